@@ -0,0 +1,354 @@
+import logging
+import math
+import random
+import time
+
+import eventlet
+import numpy as np
+
+from Model.Assignment_strategies.distance_matrix import estimate_travel_time
+from Model.Assignment_strategies.Greedy.greedy_insertion import GreedyInsertion
+from Model.Assignment_strategies.route_plan import RoutePlan
+
+
+class ALNS:
+    """
+    Adaptive large neighborhood search over transporter routes.
+
+    Starting from the greedy insertion plan, every iteration removes part of
+    the requests with a destroy operator and re-inserts them with a repair
+    operator. The new solution is accepted by simulated annealing, and every
+    operator's selection weight follows how often it recently led to new best,
+    improving or accepted solutions.
+
+    Routes keep the urgent requests ahead of the regular ones, as in
+    GreedyInsertion, and the objective is the makespan with the total travel
+    time as a small tie-breaker. All travel times come from one cost matrix.
+    """
+
+    DESTROY_OPERATORS = ("random", "worst_cost", "related")
+    REPAIR_OPERATORS = ("greedy", "regret_2", "regret_3")
+
+    # Operator scores for a new global best, an improvement and an accepted worse solution
+    SCORES = (33.0, 9.0, 13.0)
+
+    def __init__(self, transporters, requests, graph, time_limit_seconds=2, max_iterations=None,
+                 destroy_fraction=(0.1, 0.3), weight_decay=0.8, start_temperature_ratio=0.05,
+                 end_temperature_ratio=0.001, total_time_weight=0.01, seed=None):
+        """
+        Args:
+            transporters: List of transporter objects
+            requests: List of request objects
+            graph: Hospital graph
+            time_limit_seconds: Wall-clock budget for the search
+            max_iterations: Optional cap on destroy/repair iterations
+            destroy_fraction: (min, max) share of requests removed per iteration
+            weight_decay: Share of an operator weight kept at each update
+            start_temperature_ratio: Cost increase, relative to the initial cost,
+                                     that is accepted with probability 1/2 at the start
+            end_temperature_ratio: The same at the deadline; the temperature
+                                   cools geometrically in between
+            total_time_weight: Weight of the total travel time next to the makespan
+            seed: Random seed
+        """
+        self.transporters = transporters
+        self.requests = requests
+        self.graph = graph
+        self.time_limit_seconds = time_limit_seconds
+        self.max_iterations = max_iterations
+        self.destroy_fraction = destroy_fraction
+        self.weight_decay = weight_decay
+        self.start_temperature_ratio = start_temperature_ratio
+        self.end_temperature_ratio = end_temperature_ratio
+        self.total_time_weight = total_time_weight
+        self.rng = random.Random(seed)
+        self.logger = logging.getLogger('ALNS')
+
+        self.dist, self.start, self.origin, self.dest = RoutePlan.cost_model(transporters, requests, graph)
+        self.service = self.dist[self.origin, self.dest] if len(requests) else np.zeros(0)
+        self.urgent = np.array([r.urgent for r in requests], dtype=bool)
+
+        self.destroy_weights = {name: 1.0 for name in self.DESTROY_OPERATORS}
+        self.repair_weights = {name: 1.0 for name in self.REPAIR_OPERATORS}
+        self.best_routes = None
+        self.best_cost = float('inf')
+        self.iterations = 0
+        self.accepted = 0
+        self.improvements = 0
+
+    def run(self):
+        """
+        Search until the deadline and return the best plan.
+
+        Returns:
+            dict: Assignment plan mapping transporter names to ordered lists of requests
+        """
+        plan = None
+        for plan in self.run_anytime():
+            pass
+        return plan
+
+    def run_anytime(self, report_interval=None):
+        """
+        Run the search as a generator of incumbent plans.
+
+        With a report_interval, the greedy start plan is yielded right away and
+        then the incumbent whenever it has improved and at least report_interval
+        seconds have passed since the previous one, and the search yields to
+        other green threads once per iteration. The final best plan is always
+        yielded last, unless it was already yielded.
+
+        Args:
+            report_interval: Seconds between streamed incumbents (None: final plan only)
+
+        Yields:
+            dict: Assignment plans mapping transporter names to lists of requests
+        """
+        start_time = time.time()
+        deadline = start_time + self.time_limit_seconds
+
+        greedy = GreedyInsertion(self.transporters, self.requests, self.graph)
+        greedy.generate_assignment_plan()
+        routes = [list(route) for route in greedy.routes]
+        loads = self._loads(routes)
+        cost = self._cost(loads)
+        self.best_routes, self.best_cost = [list(route) for route in routes], cost
+
+        reported_cost, last_report = None, time.time()
+        if report_interval is not None:
+            reported_cost = self.best_cost
+            yield self._to_plan(self.best_routes)
+
+        if len(self.transporters) > 1 and len(self.requests) > 1:
+            # Temperatures at which a start/end-ratio cost increase is accepted with probability 1/2
+            start_temperature = self.start_temperature_ratio * max(cost, 1e-9) / math.log(2)
+            end_temperature = self.end_temperature_ratio * max(cost, 1e-9) / math.log(2)
+
+            while time.time() < deadline and (self.max_iterations is None or self.iterations < self.max_iterations):
+                progress = (time.time() - start_time) / max(self.time_limit_seconds, 1e-9)
+                temperature = start_temperature * (end_temperature / start_temperature) ** min(progress, 1.0)
+
+                destroy = self._choose(self.destroy_weights)
+                repair = self._choose(self.repair_weights)
+
+                candidate = [list(route) for route in routes]
+                removed = getattr(self, f"_destroy_{destroy}")(candidate, loads)
+                candidate_loads = self._loads(candidate)
+                getattr(self, f"_repair_{repair}")(candidate, candidate_loads, removed)
+                candidate_cost = self._cost(candidate_loads)
+                self.iterations += 1
+
+                score, accept = 0.0, True
+                if candidate_cost < self.best_cost - 1e-9:
+                    self.best_routes, self.best_cost = [list(route) for route in candidate], candidate_cost
+                    score = self.SCORES[0]
+                    self.improvements += 1
+                elif candidate_cost < cost - 1e-9:
+                    score = self.SCORES[1]
+                elif candidate_cost > cost + 1e-9:
+                    accept = self.rng.random() < math.exp(-(candidate_cost - cost) / temperature)
+                    score = self.SCORES[2] if accept else 0.0
+
+                if accept:
+                    routes, loads, cost = candidate, candidate_loads, candidate_cost
+                    self.accepted += 1
+                self._update_weight(self.destroy_weights, destroy, score)
+                self._update_weight(self.repair_weights, repair, score)
+
+                if (report_interval is not None and self.best_cost < reported_cost and
+                        time.time() - last_report >= report_interval):
+                    reported_cost, last_report = self.best_cost, time.time()
+                    yield self._to_plan(self.best_routes)
+
+                # Let dispatched transports run while streaming, as GeneticAlgorithm.run_anytime does
+                if report_interval is not None:
+                    eventlet.sleep(0)
+
+        self.logger.info(f"ALNS: cost {self.best_cost:.2f} after {self.iterations} iterations "
+                         f"({self.improvements} new best, {self.accepted} accepted) "
+                         f"in {time.time() - start_time:.2f}s")
+
+        if reported_cost is None or self.best_cost < reported_cost:
+            yield self._to_plan(self.best_routes)
+
+    def _cost(self, loads):
+        if len(loads) == 0:
+            return 0.0
+        return float(loads.max() + self.total_time_weight * loads.sum())
+
+    def _loads(self, routes):
+        loads = np.zeros(len(routes))
+        for k, route in enumerate(routes):
+            loads[k] = self._route_load(k, route)
+        return loads
+
+    def _route_load(self, k, route):
+        if not route:
+            return 0.0
+        previous = np.concatenate(([self.start[k]], self.dest[route[:-1]]))
+        return float(self.dist[previous, self.origin[route]].sum() + self.service[route].sum())
+
+    def _to_plan(self, routes):
+        return {t.name: [self.requests[q] for q in route] for t, route in zip(self.transporters, routes)}
+
+    def _choose(self, weights):
+        """Roulette-wheel choice of an operator name by weight."""
+        names = list(weights)
+        return self.rng.choices(names, weights=[weights[name] for name in names])[0]
+
+    def _update_weight(self, weights, name, score):
+        weights[name] = self.weight_decay * weights[name] + (1 - self.weight_decay) * score
+        # Keep every operator selectable
+        weights[name] = max(weights[name], 0.1)
+
+    def _removal_count(self):
+        low, high = self.destroy_fraction
+        low = max(1, int(low * len(self.requests)))
+        high = max(low, int(high * len(self.requests)))
+        return self.rng.randint(low, high)
+
+    def _remove(self, routes, requests):
+        removed = set(requests)
+        for k, route in enumerate(routes):
+            routes[k] = [q for q in route if q not in removed]
+        return list(requests)
+
+    # ---- Destroy operators -------------------------------------------------
+
+    def _destroy_random(self, routes, loads):
+        assigned = [q for route in routes for q in route]
+        return self._remove(routes, self.rng.sample(assigned, min(self._removal_count(), len(assigned))))
+
+    def _destroy_worst_cost(self, routes, loads):
+        """Remove the requests whose removal saves the most travel time, with some randomness."""
+        savings = []
+        for k, route in enumerate(routes):
+            if not route:
+                continue
+            route_array = np.array(route)
+            previous = np.concatenate(([self.start[k]], self.dest[route_array[:-1]]))
+            saving = self.dist[previous, self.origin[route_array]] + self.service[route_array]
+            following = self.origin[route_array[1:]]
+            saving[:-1] += self.dist[self.dest[route_array[:-1]], following] - self.dist[previous[:-1], following]
+            savings.extend(zip(saving.tolist(), route))
+
+        savings.sort(reverse=True)
+        count = min(self._removal_count(), len(savings))
+        chosen = []
+        while len(chosen) < count:
+            # Biased towards the front of the list, as in Ropke and Pisinger's worst removal
+            index = int(len(savings) * self.rng.random() ** 3)
+            chosen.append(savings.pop(index)[1])
+        return self._remove(routes, chosen)
+
+    def _destroy_related(self, routes, loads):
+        """Remove a random request and the requests closest to it by origin and destination department."""
+        assigned = np.array([q for route in routes for q in route], dtype=int)
+        if len(assigned) == 0:
+            return []
+        seed = assigned[self.rng.randrange(len(assigned))]
+        relatedness = (self.dist[self.origin[seed], self.origin[assigned]] +
+                       self.dist[self.dest[seed], self.dest[assigned]])
+        count = min(self._removal_count(), len(assigned))
+        return self._remove(routes, assigned[np.argsort(relatedness, kind='stable')[:count]].tolist())
+
+    # ---- Repair operators --------------------------------------------------
+
+    def _insertion_costs(self, k, route, requests):
+        """
+        Best insertion of every request into route k, keeping urgent requests
+        ahead of regular ones.
+
+        Returns:
+            tuple: (load increase, position) arrays, one entry per request
+        """
+        route_array = np.array(route, dtype=int)
+        previous = np.concatenate(([self.start[k]], self.dest[route_array])).astype(int)
+        following = np.concatenate((self.origin[route_array], [-1])).astype(int)
+        has_next = following >= 0
+
+        deltas = self.dist[previous[None, :], self.origin[requests][:, None]] + self.service[requests][:, None]
+        detour = (self.dist[self.dest[requests][:, None], following[None, has_next]] -
+                  self.dist[previous[None, has_next], following[None, has_next]])
+        deltas[:, has_next] += detour
+
+        # Urgent requests go into the urgent prefix, regular ones behind it
+        urgent_count = int(self.urgent[route_array].sum()) if len(route) else 0
+        positions = np.arange(len(route) + 1)
+        allowed = np.where(self.urgent[requests][:, None], positions[None, :] <= urgent_count,
+                           positions[None, :] >= urgent_count)
+        deltas = np.where(allowed, deltas, np.inf)
+
+        best_positions = np.argmin(deltas, axis=1)
+        return deltas[np.arange(len(requests)), best_positions], best_positions
+
+    def _repair_greedy(self, routes, loads, removed):
+        self._repair_regret(routes, loads, removed, 1)
+
+    def _repair_regret_2(self, routes, loads, removed):
+        self._repair_regret(routes, loads, removed, 2)
+
+    def _repair_regret_3(self, routes, loads, removed):
+        self._repair_regret(routes, loads, removed, 3)
+
+    def _repair_regret(self, routes, loads, removed, k):
+        """
+        Insert the removed requests one by one. Each insertion is judged by the
+        finish time of the receiving route; regret-1 takes the request with the
+        earliest possible finish, regret-k the one that loses most by not
+        getting its best route (the sum of the gaps to its k - 1 next best).
+        Urgent requests are inserted before regular ones.
+        """
+        pending = np.array(sorted(removed, key=lambda q: not self.urgent[q]), dtype=int)
+        if len(pending) == 0:
+            return
+
+        num_routes = len(routes)
+        deltas = np.empty((len(pending), num_routes))
+        positions = np.empty((len(pending), num_routes), dtype=int)
+        for route_index, route in enumerate(routes):
+            deltas[:, route_index], positions[:, route_index] = self._insertion_costs(route_index, route, pending)
+
+        active = np.ones(len(pending), dtype=bool)
+        while active.any():
+            # Regular requests wait until every urgent request is placed
+            candidates = active & (self.urgent[pending] | ~(active & self.urgent[pending]).any())
+            finish = loads[None, :] + deltas
+            finish[~candidates] = np.inf
+
+            if k == 1 or num_routes == 1:
+                flat = int(np.argmin(finish))
+                i, route_index = divmod(flat, num_routes)
+            else:
+                ranked = np.sort(finish, axis=1)
+                with np.errstate(invalid='ignore'):
+                    regret = (ranked[:, 1:k] - ranked[:, :1]).sum(axis=1)
+                regret[~candidates] = -np.inf
+                # Ties (e.g. all infinite regrets) go to the earliest finish
+                best_finish = ranked[:, 0]
+                i = int(np.lexsort((best_finish, -regret))[0])
+                route_index = int(np.argmin(finish[i]))
+
+            q = pending[i]
+            routes[route_index].insert(int(positions[i, route_index]), int(q))
+            loads[route_index] += deltas[i, route_index]
+            active[i] = False
+
+            # Only the receiving route changed
+            remaining = np.flatnonzero(active)
+            if len(remaining):
+                deltas[remaining, route_index], positions[remaining, route_index] = self._insertion_costs(
+                    route_index, routes[route_index], pending[remaining])
+
+    def estimate_travel_time(self, transporter, request):
+        """
+        Estimate travel time for a transporter to complete a request.
+
+        Args:
+            transporter: Transporter object
+            request: Transportation request object
+
+        Returns:
+            float: Time from the transporter's location to the origin plus the transport itself
+        """
+        return estimate_travel_time(transporter, request)
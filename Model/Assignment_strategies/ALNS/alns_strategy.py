@@ -0,0 +1,40 @@
+from Model.Assignment_strategies.assignment_strategy import AssignmentStrategy
+from Model.Assignment_strategies.ALNS.alns import ALNS
+
+
+class ALNSStrategy(AssignmentStrategy):
+    """
+    Strategy wrapper for adaptive large neighborhood search.
+
+    Runs until its deadline and streams improved plans through
+    generate_assignment_plans, starting with the greedy insertion plan.
+    """
+
+    def __init__(self, time_limit_seconds=2, report_interval=0.5, seed=None):
+        """
+        Args:
+            time_limit_seconds: Wall-clock budget per plan (default: 2)
+            report_interval: Seconds between improved plans streamed by
+                             generate_assignment_plans (default: 0.5)
+            seed: Random seed (default: None)
+        """
+        self.time_limit_seconds = time_limit_seconds
+        self.report_interval = report_interval
+        self.seed = seed
+        self.optimizer = None
+
+    def generate_assignment_plan(self, transporters, assignable_requests, graph):
+        self.optimizer = self.get_optimizer(transporters, assignable_requests, graph)
+        return self.optimizer.run()
+
+    def generate_assignment_plans(self, transporters, assignable_requests, graph):
+        self.optimizer = self.get_optimizer(transporters, assignable_requests, graph)
+        return self.optimizer.run_anytime(self.report_interval)
+
+    def estimate_travel_time(self, transporter, request):
+        optimizer = self.optimizer or ALNS([], [], transporter.hospital.get_graph())
+        return optimizer.estimate_travel_time(transporter, request)
+
+    def get_optimizer(self, transporters, assignable_requests, graph):
+        return ALNS(transporters, assignable_requests, graph, time_limit_seconds=self.time_limit_seconds,
+                    seed=self.seed)
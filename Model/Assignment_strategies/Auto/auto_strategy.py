@@ -0,0 +1,106 @@
+import logging
+import time
+
+from Model.Assignment_strategies.assignment_strategy import AssignmentStrategy
+from Model.Assignment_strategies.ALNS.alns_strategy import ALNSStrategy
+from Model.Assignment_strategies.Auto.strategy_profile import DEFAULT_PROFILE_PATH, StrategyProfile, instance_features
+from Model.Assignment_strategies.Genetic_algorithms.genetic_algorithm_strategy import GeneticAlgorithmStrategy
+from Model.Assignment_strategies.Greedy.greedy_insertion_strategy import GreedyInsertionStrategy
+from Model.Assignment_strategies.Hungarian.hungarian_assignment_strategy import HungarianAssignmentStrategy
+from Model.Assignment_strategies.ILP.ilp_mode import ILPMode
+from Model.Assignment_strategies.ILP.ilp_optimizer_strategy import ILPOptimizerStrategy
+
+# Strategies the router can pick, built for a time budget in seconds
+ROUTABLE_STRATEGIES = {
+    "Greedy Insertion": lambda budget: GreedyInsertionStrategy(),
+    "Hungarian Batch": lambda budget: HungarianAssignmentStrategy(),
+    "ALNS": lambda budget: ALNSStrategy(time_limit_seconds=budget),
+    "Genetic Algorithm": lambda budget: GeneticAlgorithmStrategy(time_limit_seconds=budget),
+    "ILP: Makespan": lambda budget: ILPOptimizerStrategy(ILPMode.MAKESPAN, time_limit=max(1, int(budget))),
+}
+
+
+class AutoStrategy(AssignmentStrategy):
+    """
+    Picks a strategy and time budget per instance from a benchmark profile.
+
+    For every (strategy, budget) pair in the profile the router predicts the
+    latency and plan quality on the current instance from the nearest recorded
+    instances, and takes the best predicted quality among the pairs expected to
+    finish within the latency SLO (the fastest pair if none is). The measured
+    latency of every dispatch is fed back into the profile, so the choice
+    follows the actual load; with an observations file these records also
+    survive restarts. Without a profile it uses greedy insertion.
+    """
+
+    FALLBACK = ("Greedy Insertion", 0)
+
+    def __init__(self, latency_slo=2.0, profile_path=DEFAULT_PROFILE_PATH, observations_path=None):
+        """
+        Args:
+            latency_slo: Target wall time in seconds for producing a plan
+            profile_path: JSON profile written by benchmark.strategy_profile_benchmark, only read here
+            observations_path: Writable JSON file the measured dispatch latencies are saved to,
+                               outside the package (None: kept in memory only)
+        """
+        self.latency_slo = latency_slo
+        self.profile = StrategyProfile(profile_path, observations_path)
+        self.logger = logging.getLogger('AutoStrategy')
+
+        self.strategy = None
+        self.choice = None
+        self.choices = {}
+
+    def choose(self, features):
+        """
+        Pick a (strategy name, budget) pair for an instance.
+
+        Args:
+            features: Instance features (see instance_features)
+
+        Returns:
+            tuple: (strategy name, time budget in seconds)
+        """
+        best_key, best = None, None
+        fastest_key, fastest = None, None
+        for name, budget in self.profile.candidates():
+            if name not in ROUTABLE_STRATEGIES:
+                continue
+            latency, quality = self.profile.predict(features, name, budget)
+            if fastest_key is None or latency < fastest_key:
+                fastest_key, fastest = latency, (name, budget)
+            if latency <= self.latency_slo and (best_key is None or (quality, latency) < best_key):
+                best_key, best = (quality, latency), (name, budget)
+
+        return best or fastest or self.FALLBACK
+
+    def generate_assignment_plan(self, transporters, assignable_requests, graph):
+        features = instance_features(transporters, assignable_requests, graph)
+        self.choice = self.choose(features)
+        name, budget = self.choice
+        self.strategy = ROUTABLE_STRATEGIES[name](budget)
+
+        start_time = time.time()
+        plan = self.strategy.generate_assignment_plan(transporters, assignable_requests, graph)
+        latency = time.time() - start_time
+
+        self.choices[name] = self.choices.get(name, 0) + 1
+        self.logger.info(f"Auto: {name} (budget {budget}s) for {features['requests']} requests and "
+                         f"{features['transporters']} transporters took {latency:.2f}s "
+                         f"(SLO {self.latency_slo:.2f}s)")
+
+        self.profile.record(features, name, budget, latency)
+        self.profile.save_observations()
+        return plan
+
+    def get_statistics(self):
+        return {
+            "latency_slo": self.latency_slo,
+            "last_choice": {"strategy": self.choice[0], "budget": self.choice[1]} if self.choice else None,
+            "choices": dict(self.choices),
+            "profile_records": len(self.profile.records),
+        }
+
+    def estimate_travel_time(self, transporter, request):
+        strategy = self.strategy or GreedyInsertionStrategy()
+        return strategy.estimate_travel_time(transporter, request)
@@ -0,0 +1,148 @@
+import json
+import logging
+import math
+import os
+import tempfile
+
+DEFAULT_PROFILE_PATH = os.path.join(os.path.dirname(__file__), "strategy_profile.json")
+
+
+def instance_features(transporters, requests, graph):
+    """
+    Features the strategy router compares instances by.
+
+    Args:
+        transporters: List of transporter objects
+        requests: List of request objects
+        graph: Hospital graph
+
+    Returns:
+        dict: requests, transporters, departments and urgent_share
+    """
+    return {
+        "requests": len(requests),
+        "transporters": len(transporters),
+        "departments": len(graph.adjacency_list),
+        "urgent_share": sum(1 for r in requests if r.urgent) / len(requests) if requests else 0.0,
+    }
+
+
+def feature_distance(a, b):
+    """Distance between two feature dicts; counts are compared on a log scale."""
+    distance = abs(a["urgent_share"] - b["urgent_share"])
+    for key in ("requests", "transporters", "departments"):
+        distance += abs(math.log1p(a[key]) - math.log1p(b[key]))
+    return distance
+
+
+class StrategyProfile:
+    """
+    Latency and quality records of strategies on benchmark instances.
+
+    Each record holds the instance features, the strategy name and time budget,
+    the measured wall time and, for benchmark runs, the plan quality as the
+    ratio of its makespan to the best makespan any strategy reached on the same
+    instance (1.0 = best). Records observed during dispatch carry a latency
+    only. Predictions are inverse-distance weighted means over the k nearest
+    records of a strategy and budget. Benchmark records and dispatch records
+    are stored as JSON in separate files, so dispatching never rewrites the
+    benchmark profile.
+    """
+
+    def __init__(self, path=DEFAULT_PROFILE_PATH, observations_path=None, max_observations=500):
+        """
+        Args:
+            path: JSON file with the benchmark records, written by save() only (None: memory only)
+            observations_path: JSON file the dispatch records are loaded from and written
+                               to by save_observations() (None: memory only)
+            max_observations: Number of latency-only dispatch records kept
+        """
+        self.path = path
+        self.observations_path = observations_path
+        self.max_observations = max_observations
+        self.records = []
+        self.logger = logging.getLogger('StrategyProfile')
+
+        if path and os.path.exists(path):
+            self.load()
+        if observations_path and os.path.exists(observations_path):
+            self.load_observations()
+
+    def load(self):
+        with open(self.path) as f:
+            self.records = json.load(f)["records"]
+        self.logger.info(f"Loaded {len(self.records)} strategy profile records from {self.path}")
+
+    def load_observations(self):
+        with open(self.observations_path) as f:
+            observations = [r for r in json.load(f)["records"] if r["quality"] is None]
+        self.records.extend(observations[-self.max_observations:])
+        self.logger.info(f"Loaded {len(observations)} dispatch records from {self.observations_path}")
+
+    def save(self):
+        """Write the benchmark records to path."""
+        if self.path:
+            self._write(self.path, [r for r in self.records if r["quality"] is not None])
+
+    def save_observations(self):
+        """Write the dispatch records to observations_path."""
+        if self.observations_path:
+            self._write(self.observations_path, [r for r in self.records if r["quality"] is None])
+
+    @staticmethod
+    def _write(path, records):
+        # Write a temporary file next to the target and rename it into place, so
+        # a concurrent reader or a crash never leaves a half-written profile
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"records": records}, f, indent=1)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def record(self, features, strategy, budget, latency, quality=None):
+        """
+        Add one run to the profile.
+
+        Args:
+            features: Instance features (see instance_features)
+            strategy: Strategy name
+            budget: Time budget the strategy ran with
+            latency: Measured wall time in seconds
+            quality: Makespan relative to the best known plan of the instance, if known
+        """
+        self.records.append({"features": dict(features), "strategy": strategy, "budget": budget,
+                             "latency": latency, "quality": quality})
+
+        observations = [i for i, r in enumerate(self.records) if r["quality"] is None]
+        if len(observations) > self.max_observations:
+            del self.records[observations[0]]
+
+    def candidates(self):
+        """All (strategy, budget) pairs with quality records, in first-recorded order."""
+        return list(dict.fromkeys((r["strategy"], r["budget"]) for r in self.records if r["quality"] is not None))
+
+    def predict(self, features, strategy, budget, k=3):
+        """
+        Predict latency and quality of a strategy and budget on an instance.
+
+        Returns:
+            tuple: (latency, quality), None for a value without records
+        """
+        records = [r for r in self.records if r["strategy"] == strategy and r["budget"] == budget]
+        return (self._nearest_mean(features, records, "latency", k),
+                self._nearest_mean(features, [r for r in records if r["quality"] is not None], "quality", k))
+
+    @staticmethod
+    def _nearest_mean(features, records, key, k):
+        if not records:
+            return None
+        # Among equally close records, the most recent ones count
+        distances = sorted((feature_distance(features, r["features"]), -i) for i, r in enumerate(records))[:k]
+        # Inverse distance weights, so a close instance outweighs far ones
+        weights = [(1 / (distance + 0.1), records[-i][key]) for distance, i in distances]
+        return sum(w * value for w, value in weights) / sum(w for w, _ in weights)
@@ -1,10 +1,13 @@
 import random
+import eventlet
 import numpy as np
 import time
 import logging
-from copy import deepcopy
 import statistics
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+
+from Model.Assignment_strategies.distance_matrix import DistanceMatrix
+from Model.Assignment_strategies.Genetic_algorithms.memetic_search import MemeticSearch
 
 
 class GeneticAlgorithm:
@@ -26,7 +29,9 @@ class GeneticAlgorithm:
                  population_size=50, generations=50, time_limit_seconds=5,
                  mutation_rate=0.1, crossover_rate=0.8, selection_method="tournament",
                  crossover_method="two_point", fitness_weights=None,
-                 early_stopping=True, debug_mode=False, progress_callback=None):
+                 early_stopping=True, debug_mode=False, progress_callback=None, migration_hook=None,
+                 initial_population=None, memetic=False, memetic_time_budget=0.01, fitness_cache_size=10000,
+                 convergence_window=30, convergence_tolerance=1e-3):
         """
         Initialize the genetic algorithm optimizer.
 
@@ -43,9 +48,22 @@ class GeneticAlgorithm:
             crossover_method: Type of crossover ("one_point", "two_point", "uniform")
             fitness_weights: Dict with weights for different fitness components
                              (makespan, balance, urgency)
-            early_stopping: Whether to use early stopping if no improvement
+            early_stopping: Whether to stop early once the best fitness converges
             debug_mode: Enable detailed logging
             progress_callback: Function to call with progress updates
+            migration_hook: Function (generation, population, fitness_scores) returning
+                            immigrant chromosomes to replace the worst individuals, or
+                            None; used by the island model
+            initial_population: Chromosomes to seed the population with instead of
+                                the heuristic solutions; the rest is filled randomly
+            memetic: Improve the elite individuals with relocate/swap local search
+                     every generation
+            memetic_time_budget: Seconds of local search per generation
+            fitness_cache_size: Maximum number of evaluated chromosomes remembered
+                                (least recently used first out; 0 disables the cache)
+            convergence_window: Generations over which the improvement rate is measured
+            convergence_tolerance: Relative improvement of the best fitness over the
+                                   window below which the run counts as converged
         """
         self.transporters = transporters
         self.requests = requests
@@ -62,6 +80,11 @@ class GeneticAlgorithm:
         self.early_stopping = early_stopping
         self.debug_mode = debug_mode
         self.progress_callback = progress_callback
+        self.migration_hook = migration_hook
+        self.initial_population = initial_population
+        self.memetic = memetic
+        self.memetic_time_budget = memetic_time_budget
+        self._memetic_search = None
 
         # Set default fitness weights if not provided
         if fitness_weights is None:
@@ -84,15 +107,41 @@ class GeneticAlgorithm:
         self.current_generation = 0
         self.population = []
 
+        # Per-individual route state, aligned with the population rows, so that
+        # offspring are re-scored by recomputing only the routes that changed
+        self.population_workloads = None
+        self.population_urgent_completion = None
+        # Per-individual route membership (order, starts, ends, known), see
+        # _route_membership; rows with known False are computed when needed
+        self.population_membership = None
+        # Offspring whose changed genes touch at most this many transporters get
+        # a delta evaluation instead of a full one. Below about a thousand requests
+        # the full pass costs less than the delta bookkeeping, so it is always used.
+        self.delta_transporter_limit = max(2, len(transporters) // 4) if len(requests) >= 1000 else 0
+
+        # Route state of recently evaluated chromosomes, keyed by chromosome bytes
+        self.fitness_cache_size = fitness_cache_size
+        self._fitness_cache = OrderedDict()
+
+        self.convergence_window = convergence_window
+        self.convergence_tolerance = convergence_tolerance
+
         # Performance metrics
         self.initialization_time = 0
         self.evolution_time = 0
         self.fitness_eval_time = 0
+        self.full_evaluations = 0
+        self.delta_evaluations = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.selection_time = 0
         self.crossover_time = 0
         self.mutation_time = 0
+        self.memetic_time = 0
+        self.memetic_moves = 0
         self.total_time = 0
         self.fitness_history = []
+        self.best_fitness_history = []
         self.diversity_history = []
 
         # Cache for path calculations
@@ -116,6 +165,27 @@ class GeneticAlgorithm:
         Returns:
             dict: Assignment plan mapping transporter names to lists of requests
         """
+        plan = None
+        for plan in self.run_anytime():
+            pass
+        return plan
+
+    def run_anytime(self, report_interval=None):
+        """
+        Run the optimization as a generator of incumbent plans.
+
+        With a report_interval, the best plan is yielded right after the initial
+        population has been evaluated and then whenever it has improved and at
+        least report_interval seconds have passed since the previous one, and
+        the run yields to other green threads once per generation. The final
+        best plan is always yielded last, unless it was already yielded.
+
+        Args:
+            report_interval: Seconds between streamed incumbents (None: final plan only)
+
+        Yields:
+            dict: Assignment plans mapping transporter names to lists of requests
+        """
         start_time = time.time()
         self.total_time = 0
 
@@ -124,31 +194,45 @@ class GeneticAlgorithm:
             self.logger.info(f"Small problem detected ({len(self.requests)} requests). Using greedy algorithm.")
             plan = self._solve_greedy()
             self.total_time = time.time() - start_time
-            return plan
+            yield plan
+            return
 
         # Initialize population
         init_start = time.time()
         self.population = self._initialize_population()
+        self._offspring_buffer = np.empty_like(self.population)
         self.initialization_time = time.time() - init_start
 
         # Initial fitness evaluation
         fitness_start = time.time()
-        fitness_scores = self._evaluate_population_fitness(self.population)
+        membership = self._route_membership(self.population)
+        self.population_workloads, self.population_urgent_completion = self._route_state(self.population,
+                                                                                         membership[0])
+        self.population_membership = membership + (np.ones(len(self.population), dtype=bool),)
+        fitness_scores = self._fitness_from_state(self.population_workloads, self.population_urgent_completion)
+        self.full_evaluations += len(self.population)
         self.fitness_eval_time = time.time() - fitness_start
 
         # Find initial best solution
         best_idx = np.argmin(fitness_scores)
         self.best_fitness = fitness_scores[best_idx]
-        self.best_solution = self.population[best_idx]
+        self.best_solution = self.population[best_idx].copy()
         self.best_generation = 0
 
         self.logger.info(f"Initial population: size={len(self.population)}, best fitness={self.best_fitness:.2f}")
 
         # Record initial metrics
         self.fitness_history.append(self.best_fitness)
+        self.best_fitness_history.append(self.best_fitness)
         diversity = self._calculate_population_diversity(self.population)
         self.diversity_history.append(diversity)
 
+        # Stream the initial incumbent so dispatch can start right away
+        reported_fitness, last_report = None, time.time()
+        if report_interval is not None:
+            reported_fitness = self.best_fitness
+            yield self._convert_to_plan(self.best_solution)
+
         # Main evolution loop
         evolution_start = time.time()
 
@@ -160,62 +244,67 @@ class GeneticAlgorithm:
                 self.logger.info(f"Time limit reached after {generation} generations")
                 break
 
-            # Select parents for reproduction
+            # Select parents for reproduction (indices into the population)
             selection_start = time.time()
             parents = self._select_parents(self.population, fitness_scores)
             self.selection_time += time.time() - selection_start
 
-            # Create next generation through crossover and mutation
-            next_generation = []
+            # Create next generation through crossover and mutation, written into
+            # the spare population buffer
+            next_generation = self._offspring_buffer
 
             # Add elite individuals directly to next generation (elitism)
             elite_count = max(1, self.population_size // 10)  # Top 10% are elite
-            elite_indices = np.argsort(fitness_scores)[:elite_count]
-            elites = [self.population[i] for i in elite_indices]
-            next_generation.extend(elites)
+            elite_indices = np.argsort(fitness_scores, kind='stable')[:elite_count]
+            np.take(self.population, elite_indices, axis=0, out=next_generation[:elite_count])
 
-            # Fill the rest of the population with new offspring
+            # Fill the rest of the population with new offspring, remembering
+            # which individual each child was copied from
             crossover_start = time.time()
-            while len(next_generation) < self.population_size:
-                # Select parents for this offspring
-                parent1, parent2 = random.sample(parents, 2)
-
-                # Crossover with probability
-                if random.random() < self.crossover_rate:
-                    child = self._crossover(parent1, parent2)
-                else:
-                    child = deepcopy(parent1)
-
-                next_generation.append(child)
+            source_indices = np.concatenate((elite_indices,
+                                             self._crossover_into(next_generation[elite_count:], parents)))
             self.crossover_time += time.time() - crossover_start
 
             # Apply mutation to all except elites
             mutation_start = time.time()
-            for i in range(elite_count, len(next_generation)):
-                if random.random() < self.mutation_rate:
-                    next_generation[i] = self._mutate(next_generation[i])
+            self._mutate_in_place(next_generation[elite_count:])
             self.mutation_time += time.time() - mutation_start
 
-            # Replace population
-            self.population = next_generation
-
-            # Evaluate new population
+            # Evaluate new population from the state of the individuals it was copied from
             fitness_start = time.time()
-            fitness_scores = self._evaluate_population_fitness(self.population)
+            workloads, urgent_completion, membership = self._offspring_route_state(next_generation, source_indices)
+            fitness_scores = self._fitness_from_state(workloads, urgent_completion)
             self.fitness_eval_time += time.time() - fitness_start
 
+            # Swap population buffers
+            self._offspring_buffer = self.population
+            self.population = next_generation
+            self.population_workloads, self.population_urgent_completion = workloads, urgent_completion
+            self.population_membership = membership
+
+            # Exchange individuals with other populations (island model)
+            if self.migration_hook:
+                self._migrate(generation, fitness_scores)
+
+            # Memetic step: local search on the best individuals
+            if self.memetic:
+                memetic_start = time.time()
+                self._improve_elites(fitness_scores)
+                self.memetic_time += time.time() - memetic_start
+
             # Update best solution
-            min_fitness = min(fitness_scores)
-            min_idx = fitness_scores.index(min_fitness)
+            min_idx = int(np.argmin(fitness_scores))
+            min_fitness = fitness_scores[min_idx]
 
             if min_fitness < self.best_fitness:
                 self.best_fitness = min_fitness
-                self.best_solution = self.population[min_idx]
+                self.best_solution = self.population[min_idx].copy()
                 self.best_generation = generation
                 self.logger.debug(f"New best: gen={generation}, fitness={min_fitness:.2f}")
 
             # Record metrics for this generation
             self.fitness_history.append(min_fitness)
+            self.best_fitness_history.append(self.best_fitness)
             diversity = self._calculate_population_diversity(self.population)
             self.diversity_history.append(diversity)
 
@@ -230,13 +319,24 @@ class GeneticAlgorithm:
                 }
                 self.progress_callback(progress)
 
-            # Early stopping check
-            if self.early_stopping and generation - self.best_generation > 20:
-                # If no improvement in 20 generations, and diversity is low
-                if diversity < 0.1:  # Low diversity threshold
-                    self.logger.info(f"Early stopping at generation {generation}: "
-                                     f"No improvement in 20 generations and low diversity")
-                    break
+            # Stream an improved incumbent
+            if (report_interval is not None and self.best_fitness < reported_fitness and
+                    time.time() - last_report >= report_interval):
+                reported_fitness, last_report = self.best_fitness, time.time()
+                yield self._convert_to_plan(self.best_solution)
+
+            # A streaming run shares the eventlet hub with the transports it has
+            # dispatched, so give them a turn every generation. Batch runs may be
+            # in a forked worker whose inherited hub must not be resumed.
+            if report_interval is not None:
+                eventlet.sleep(0)
+
+            # Early stopping once the improvement rate has dropped off
+            if self.early_stopping and self._has_converged():
+                self.logger.info(f"Early stopping at generation {generation}: best fitness improved less than "
+                                 f"{self.convergence_tolerance:.2%} over the last {self.convergence_window} "
+                                 f"generations")
+                break
 
             # Adaptive mutation rate adjustment
             self._adjust_mutation_rate(generation)
@@ -244,29 +344,115 @@ class GeneticAlgorithm:
             # Diversity maintenance
             if diversity < 0.05 and generation < self.generations - 10:
                 self.logger.debug(f"Low diversity ({diversity:.3f}). Injecting new chromosomes.")
-                self._inject_diversity()
+                self._inject_diversity(fitness_scores)
 
         self.evolution_time = time.time() - evolution_start
         self.total_time = time.time() - start_time
 
-        # Convert best solution to plan
-        plan = self._convert_to_plan(self.best_solution)
-
         # Log performance
         self._log_performance()
 
-        return plan
+        # Convert best solution to plan
+        if reported_fitness is None or self.best_fitness < reported_fitness:
+            yield self._convert_to_plan(self.best_solution)
+
+    def _has_converged(self):
+        """
+        Whether the best fitness improved by less than convergence_tolerance
+        (relative) over the last convergence_window generations.
+        """
+        history = self.best_fitness_history
+        if len(history) <= self.convergence_window:
+            return False
+
+        previous, current = history[-self.convergence_window - 1], history[-1]
+        if not np.isfinite(previous):
+            return False
+        return previous - current <= self.convergence_tolerance * abs(previous)
+
+    def _migrate(self, generation, fitness_scores):
+        """
+        Replace the worst individuals with immigrants from the migration hook.
+
+        Args:
+            generation: Current generation number
+            fitness_scores: Fitness array of the population, updated in place
+        """
+        immigrants = self.migration_hook(generation, self.population, fitness_scores)
+        if immigrants is None or len(immigrants) == 0:
+            return
+
+        immigrants = immigrants[:len(self.population) - 1]
+        worst_indices = np.argsort(fitness_scores, kind='stable')[-len(immigrants):]
+        self._replace_individuals(worst_indices, immigrants, fitness_scores)
+        self.logger.debug(f"Generation {generation}: received {len(immigrants)} migrants")
+
+    def _improve_elites(self, fitness_scores):
+        """
+        Run local search on the elite individuals within the per-generation time
+        budget and keep the results the full fitness confirms as improvements.
+
+        Args:
+            fitness_scores: Fitness array of the population, updated in place
+        """
+        if self._memetic_search is None:
+            self._memetic_search = MemeticSearch(self.travel_matrix, self.transporter_location, self.request_origin,
+                                                 self.request_destination, self.request_service_time)
+
+        deadline = time.time() + self.memetic_time_budget
+        elite_count = max(1, self.population_size // 10)
+
+        for idx in np.argsort(fitness_scores, kind='stable')[:elite_count]:
+            if time.time() >= deadline:
+                break
+            improved, moves = self._memetic_search.improve(self.population[idx], deadline)
+            if moves == 0:
+                continue
+
+            workloads, urgent_completion = self._route_state(improved)
+            fitness = self._fitness_from_state(workloads, urgent_completion)[0]
+            if fitness < fitness_scores[idx]:
+                self.population[idx] = improved
+                self.population_workloads[idx] = workloads[0]
+                self.population_urgent_completion[idx] = urgent_completion[0]
+                self._membership_arrays()[3][idx] = False
+                fitness_scores[idx] = fitness
+                self.memetic_moves += moves
+
+    def _replace_individuals(self, indices, chromosomes, fitness_scores=None):
+        """
+        Overwrite population rows and keep their route state (and optionally scores) current.
+
+        Args:
+            indices: Population rows to replace
+            chromosomes: New chromosomes for those rows
+            fitness_scores: Optional fitness array of the population, updated in place
+        """
+        self.population[indices] = chromosomes
+        workloads, urgent_completion = self._route_state(chromosomes)
+        self.population_workloads[indices] = workloads
+        self.population_urgent_completion[indices] = urgent_completion
+        self._membership_arrays()[3][indices] = False
+        self.full_evaluations += len(indices)
+        if fitness_scores is not None:
+            fitness_scores[indices] = self._fitness_from_state(workloads, urgent_completion)
 
     def _initialize_population(self):
         """
         Create initial population with a mix of heuristic and random solutions.
 
         Returns:
-            list: Initial population of chromosomes
+            np.ndarray: Initial population as a (P x R) integer array
         """
         self.logger.debug("Initializing population")
         population = []
 
+        if self.initial_population is not None:
+            population.extend(np.asarray(self.initial_population, dtype=np.intp)[:self.population_size])
+            while len(population) < self.population_size:
+                population.append(self._create_random_chromosome())
+            return np.array(population, dtype=np.intp)
+
         # Create one individual with greedy algorithm
         greedy_plan = self._solve_greedy()
         greedy_chromosome = self._plan_to_chromosome(greedy_plan)
@@ -287,13 +473,74 @@ class GeneticAlgorithm:
             chromosome = self._create_random_chromosome()
             population.append(chromosome)
 
-        return population
+        return np.array(population, dtype=np.intp)
 
     def _create_random_chromosome(self):
         """Create a random assignment chromosome."""
-        # Create a random chromosome: a list where the index corresponds to a request
+        # Create a random chromosome: an array where the index corresponds to a request
         # and the value is the index of the assigned transporter
-        return [random.randrange(len(self.transporters)) for _ in range(len(self.requests))]
+        return np.random.randint(len(self.transporters), size=len(self.requests))
+
+    def carry_over_population(self, population, request_ids, transporter_names):
+        """
+        Map a population evolved for an earlier request set onto the current one.
+
+        Requests that are still assignable keep their transporter, matched by
+        name. Requests that are new, or whose transporter is gone, are seeded
+        greedily per individual (see _seed_missing_genes). Requests that were
+        started or completed in the meantime are simply not part of the new set.
+
+        Args:
+            population: (P x R_old) array of chromosomes from the previous run
+            request_ids: Request ids of the previous chromosome positions
+            transporter_names: Transporter names of the previous gene values
+
+        Returns:
+            np.ndarray: (P x R) population for this run's requests and transporters
+        """
+        if not hasattr(self, 'travel_matrix'):
+            self._build_cost_model()
+
+        population = np.asarray(population, dtype=np.intp)
+        carried = np.full((len(population), len(self.requests)), -1, dtype=np.intp)
+
+        old_position = {request_id: i for i, request_id in enumerate(request_ids)}
+        kept = [(i, old_position[r.id]) for i, r in enumerate(self.requests) if r.id in old_position]
+        if kept and len(population):
+            name_index = {t.name: i for i, t in enumerate(self.transporters)}
+            transporter_map = np.array([name_index.get(name, -1) for name in transporter_names], dtype=np.intp)
+            new_columns, old_columns = (list(columns) for columns in zip(*kept))
+            carried[:, new_columns] = transporter_map[population[:, old_columns]]
+
+        self._seed_missing_genes(carried)
+        return carried
+
+    def _seed_missing_genes(self, population):
+        """
+        Assign genes marked -1 in place, request by request, to the transporter
+        that ends up with the smallest workload in each individual.
+
+        Args:
+            population: (P x R) array of chromosomes, -1 for unassigned requests
+        """
+        num_individuals, num_transporters = len(population), len(self.transporters)
+        missing = np.flatnonzero((population < 0).any(axis=0))
+        if len(missing) == 0 or num_transporters == 0:
+            return
+
+        # Workload of the already assigned requests of every (individual, transporter)
+        individuals = np.repeat(np.arange(num_individuals), num_transporters)
+        transporters = np.tile(np.arange(num_transporters), num_individuals)
+        workloads, _ = self._transporter_route_state(self._route_membership(population), individuals, transporters)
+        workloads = workloads.reshape(num_individuals, num_transporters)
+
+        for q in missing:
+            rows = np.flatnonzero(population[:, q] < 0)
+            cost = (self.travel_matrix[self.transporter_location, self.request_origin[q]] +
+                    self.request_service_time[q])
+            choice = np.argmin(workloads[rows] + cost, axis=1)
+            population[rows, q] = choice
+            workloads[rows, choice] += cost[choice]
 
     def _plan_to_chromosome(self, plan):
         """
@@ -303,9 +550,9 @@ class GeneticAlgorithm:
             plan: Dict mapping transporter names to request lists
 
         Returns:
-            list: Chromosome representation
+            np.ndarray: Chromosome representation
         """
-        chromosome = [0] * len(self.requests)
+        chromosome = np.zeros(len(self.requests), dtype=np.intp)
 
         for t_idx, transporter in enumerate(self.transporters):
             requests = plan.get(transporter.name, [])
@@ -316,101 +563,412 @@ class GeneticAlgorithm:
 
         return chromosome
 
+    def _build_cost_model(self):
+        """
+        Build integer-indexed cost arrays for vectorized fitness evaluation.
+
+        Locations (transporter positions, request origins and destinations) are
+        numbered once, and travel times between them come from the cached
+        DistanceMatrix with the same conventions as _estimate_point_to_point_time:
+        unreachable pairs cost 0 and locations outside the graph cost 10.
+        """
+        locations = list(dict.fromkeys(
+            [t.current_location for t in self.transporters] +
+            [loc for r in self.requests for loc in (r.origin, r.destination)]
+        ))
+        self.location_index = {loc: i for i, loc in enumerate(locations)}
+
+        distances = DistanceMatrix.for_graph(self.graph)
+        travel = distances.submatrix(locations)
+        travel[np.isinf(travel)] = 0
+        unknown = np.array([loc not in distances.index for loc in locations], dtype=bool)
+        travel[unknown, :] = 10
+        travel[:, unknown] = 10
+        self.travel_matrix = travel
+
+        self.transporter_location = np.array([self.location_index[t.current_location] for t in self.transporters],
+                                             dtype=np.intp)
+        self.request_origin = np.array([self.location_index[r.origin] for r in self.requests], dtype=np.intp)
+        self.request_destination = np.array([self.location_index[r.destination] for r in self.requests],
+                                            dtype=np.intp)
+        self.request_service_time = travel[self.request_origin, self.request_destination]
+        self.request_urgent = np.array([bool(getattr(r, 'urgent', False)) for r in self.requests], dtype=bool)
+
     def _evaluate_population_fitness(self, population):
         """
         Evaluate fitness for all individuals in the population.
 
         Args:
-            population: List of chromosomes
+            population: (P x R) integer array of chromosomes
 
         Returns:
-            list: Fitness scores (lower is better)
+            np.ndarray: Fitness scores (lower is better)
         """
-        return [self._evaluate_fitness(chrom) for chrom in population]
+        return self._fitness_from_state(*self._route_state(population))
 
-    def _evaluate_fitness(self, chromosome):
+    def _fitness_from_state(self, workloads, urgent_completion):
         """
-        Evaluate the fitness of a single chromosome.
+        Combine per-transporter route state into fitness scores.
 
         Args:
-            chromosome: Assignment chromosome
+            workloads: (P x T) route time per individual and transporter, inf for
+                       individuals with invalid genes
+            urgent_completion: (P x T) latest completion time of an urgent request
+                               per individual and transporter (0 if there is none)
 
         Returns:
-            float: Fitness score (lower is better)
+            np.ndarray: Fitness scores (lower is better)
         """
-        # Initialize fitness components
-        makespan = 0
-        total_travel_time = 0
-        max_urgent_completion_time = 0
+        num_individuals, num_transporters = workloads.shape
+        invalid = np.isinf(workloads).any(axis=1)
+        workloads = np.where(invalid[:, None], 0, workloads)
 
-        # Track workload and completion times per transporter
-        workloads = {t.name: 0 for t in self.transporters}
-        current_locations = {t.name: t.current_location for t in self.transporters}
-        urgent_completion_times = []
+        makespan = workloads.max(axis=1) if num_transporters else np.zeros(num_individuals)
+        workload_std = workloads.std(axis=1) if num_transporters > 1 else np.zeros(num_individuals)
+        urgent_penalty = urgent_completion.max(axis=1, initial=0)
+        travel_efficiency = workloads.sum(axis=1) / max(1, len(self.requests))
 
-        # Process each request
-        for i, t_idx in enumerate(chromosome):
-            if t_idx >= len(self.transporters):
-                # Invalid assignment - high penalty
-                return float('inf')
+        fitness = (
+                self.fitness_weights["makespan"] * makespan +
+                self.fitness_weights["balance"] * workload_std +
+                self.fitness_weights["urgency"] * urgent_penalty +
+                self.fitness_weights["travel_efficiency"] * travel_efficiency
+        )
+        return np.where(invalid, np.inf, fitness)
 
-            transporter = self.transporters[t_idx]
-            request = self.requests[i]
+    def _route_state(self, population, order=None):
+        """
+        Compute every transporter's route state for a population in one vectorized pass.
 
-            # Calculate travel times
-            to_origin_time = self._estimate_point_to_point_time(
-                current_locations[transporter.name], request.origin
-            )
+        Each transporter serves its requests in chromosome order. Sorting every
+        row stably by transporter lines up each transporter's requests in that
+        order, so the previous location of a request is the destination of its
+        left neighbour in the same group, or the transporter's start location.
 
-            to_dest_time = self._estimate_point_to_point_time(
-                request.origin, request.destination
-            )
+        Args:
+            population: (P x R) integer array of chromosomes
+            order: Optional (P x R) sort order of the rows, see _transporter_order,
+                   if the caller already has it
+
+        Returns:
+            tuple: (P x T) arrays (workloads, urgent_completion), see _fitness_from_state
+        """
+        if not hasattr(self, 'travel_matrix'):
+            self._build_cost_model()
+
+        population = np.atleast_2d(np.asarray(population, dtype=np.intp))
+        num_individuals = population.shape[0]
+        num_transporters = len(self.transporters)
+
+        invalid = ((population < 0) | (population >= num_transporters)).any(axis=1)
+        population = np.where(invalid[:, None], 0, population)
+
+        if order is None or invalid.any():
+            order = self._transporter_order(population)
+        sorted_transporters = np.take_along_axis(population, order, axis=1)
+
+        # Previous location of each request in its transporter's sequence
+        group_start = np.ones_like(sorted_transporters, dtype=bool)
+        group_start[:, 1:] = sorted_transporters[:, 1:] != sorted_transporters[:, :-1]
+        previous = self.request_destination[np.roll(order, 1, axis=1)]
+        previous = np.where(group_start, self.transporter_location[sorted_transporters], previous)
+
+        leg_time = self.travel_matrix[previous, self.request_origin[order]] + self.request_service_time[order]
+
+        # Completion time within the transporter's sequence: running total minus the
+        # running total at the start of the group (legs are non-negative)
+        running_total = np.cumsum(leg_time, axis=1)
+        group_base = np.maximum.accumulate(np.where(group_start, running_total - leg_time, 0), axis=1)
+        completion_time = running_total - group_base
+
+        # Workload per transporter: sum of leg times per (individual, transporter)
+        flat_index = (np.arange(num_individuals)[:, None] * num_transporters + sorted_transporters).ravel()
+        workloads = np.bincount(flat_index, weights=leg_time.ravel(),
+                                minlength=num_individuals * num_transporters)
+
+        # Latest urgent completion per transporter: maximum over each contiguous group
+        urgent_completion = np.zeros(num_individuals * num_transporters)
+        starts = np.flatnonzero(group_start.ravel())
+        if len(starts):
+            urgent_time = np.where(self.request_urgent[order], completion_time, 0).ravel()
+            urgent_completion[flat_index[starts]] = np.maximum.reduceat(urgent_time, starts)
+
+        workloads = workloads.reshape(num_individuals, num_transporters)
+        workloads[invalid] = np.inf
+        return workloads, urgent_completion.reshape(num_individuals, num_transporters)
+
+    def _transporter_order(self, population):
+        """
+        Gene indices of every row sorted stably by transporter.
 
-            # Update state
-            completion_time = workloads[transporter.name] + to_origin_time + to_dest_time
-            workloads[transporter.name] = completion_time
-            current_locations[transporter.name] = request.destination
+        Genes are small integers, so they are sorted as int16 where possible,
+        for which numpy's stable argsort is a radix sort: O(R) per row.
+        """
+        if len(self.transporters) < np.iinfo(np.int16).max:
+            population = population.astype(np.int16)
+        return np.argsort(population, axis=1, kind='stable')
 
-            # Track total travel time
-            total_travel_time += to_origin_time + to_dest_time
+    def _route_membership(self, population):
+        """
+        Requests of every route of every row.
 
-            # Track urgent request completion times
-            if hasattr(request, 'urgent') and request.urgent:
-                urgent_completion_times.append(completion_time)
+        Transporter t's requests in row i, in chromosome order, are
+        order[i, starts[i, t]:ends[i, t]]. Genes of -1 (unassigned) belong
+        to no route.
 
-        # Calculate makespan (max completion time)
-        makespan = max(workloads.values()) if workloads else 0
+        Args:
+            population: (P x R) integer array with genes in -1..T-1
 
-        # Calculate workload balance (standard deviation)
-        workload_values = list(workloads.values())
-        workload_std = np.std(workload_values) if len(workload_values) > 1 else 0
+        Returns:
+            tuple: (order (P x R), starts (P x T), ends (P x T))
+        """
+        num_individuals = population.shape[0]
+        num_transporters = len(self.transporters)
+        order = self._transporter_order(population)
+
+        # Shift genes by one so that unassigned requests count in the first column
+        slots = (np.arange(num_individuals)[:, None] * (num_transporters + 1) + population + 1).ravel()
+        counts = np.bincount(slots, minlength=num_individuals * (num_transporters + 1))
+        ends = np.cumsum(counts.reshape(num_individuals, num_transporters + 1), axis=1)
+        return order, ends[:, :-1], ends[:, 1:]
+
+    def _membership_arrays(self):
+        """Route membership arrays of the population, all rows unknown if the population was replaced."""
+        membership = self.population_membership
+        if membership is None or membership[0].shape != self.population.shape:
+            num_individuals, num_genes = self.population.shape
+            num_transporters = len(self.transporters)
+            membership = (np.zeros((num_individuals, num_genes), dtype=np.intp),
+                          np.zeros((num_individuals, num_transporters), dtype=np.intp),
+                          np.zeros((num_individuals, num_transporters), dtype=np.intp),
+                          np.zeros(num_individuals, dtype=bool))
+            self.population_membership = membership
+        return membership
+
+    def _population_membership(self, indices):
+        """
+        Route membership of the population, computed first for those of the
+        given rows that do not have it yet.
 
-        # Calculate urgent request penalty (avg completion time for urgent requests)
-        urgent_penalty = max(urgent_completion_times) if urgent_completion_times else 0
+        Returns:
+            tuple: (order, starts, ends) of all population rows, see _route_membership
+        """
+        order, starts, ends, known = self._membership_arrays()
+        missing = indices[~known[indices]]
+        if len(missing):
+            order[missing], starts[missing], ends[missing] = self._route_membership(self.population[missing])
+            known[missing] = True
+        return order, starts, ends
+
+    def _transporter_route_state(self, membership, rows, transporters):
+        """
+        Route state of single routes: for each k, the workload and latest urgent
+        completion of transporter transporters[k] in row rows[k].
 
-        # Travel efficiency (average travel time per request)
-        travel_efficiency = total_travel_time / max(1, len(self.requests))
+        Only the requests of those routes are visited, using the membership of
+        the rows.
 
-        # Combine components with weights
-        fitness = (
-                self.fitness_weights["makespan"] * makespan +
-                self.fitness_weights["balance"] * workload_std +
-                self.fitness_weights["urgency"] * urgent_penalty +
-                self.fitness_weights["travel_efficiency"] * travel_efficiency
-        )
+        Args:
+            membership: (order, starts, ends) of the rows, see _route_membership
+            rows: (K,) row indices into the membership arrays
+            transporters: (K,) transporter indices
+
+        Returns:
+            tuple: (K,) arrays (workloads, urgent_completion)
+        """
+        route, request = self._gather_routes(membership, rows, transporters)
+        return self._routes_state(route, request, transporters)
+
+    @staticmethod
+    def _gather_routes(membership, rows, transporters):
+        """
+        Requests of single routes, as (route, request) arrays grouped by route
+        (0..K-1) with each route's requests in chromosome order.
+        """
+        order, starts, ends = membership
+        route_starts = starts[rows, transporters]
+        lengths = ends[rows, transporters] - route_starts
+
+        route = np.repeat(np.arange(len(rows)), lengths)
+        offsets = np.cumsum(lengths) - lengths
+        position = np.arange(len(route)) - offsets[route] + route_starts[route]
+        return route, order[rows[route], position]
 
-        return fitness
+    def _routes_state(self, route, request, transporters):
+        """
+        Workload and latest urgent completion of routes given as (route, request)
+        arrays grouped by route, with transporters[k] serving route k.
+
+        Returns:
+            tuple: (K,) arrays (workloads, urgent_completion)
+        """
+        num_routes = len(transporters)
+        first = np.ones(len(route), dtype=bool)
+        first[1:] = route[1:] != route[:-1]
+        previous = np.roll(self.request_destination[request], 1)
+        previous[first] = self.transporter_location[transporters[route[first]]]
+
+        leg_time = self.travel_matrix[previous, self.request_origin[request]] + self.request_service_time[request]
+        running_total = np.cumsum(leg_time)
+        group_base = np.maximum.accumulate(np.where(first, running_total - leg_time, 0))
+        completion_time = running_total - group_base
+
+        workloads = np.bincount(route, weights=leg_time, minlength=num_routes)
+        urgent_completion = np.zeros(num_routes)
+        route_first = np.flatnonzero(first)
+        if len(route_first):
+            urgent_time = np.where(self.request_urgent[request], completion_time, 0)
+            urgent_completion[route[route_first]] = np.maximum.reduceat(urgent_time, route_first)
+        return workloads, urgent_completion
+
+    def _delta_route_state(self, children, parent_indices, changed_genes, routes):
+        """
+        Route state of the changed routes of offspring, rebuilt from their parents' routes.
+
+        A child's route for a transporter is the parent's route for it without
+        the requests whose gene moved away, plus the requests whose gene moved
+        in, in chromosome order. So only the requests of the changed routes
+        (R/T each on average) and the changed genes are visited; the parent's
+        route comes from its membership, computed once per parent row.
+
+        Args:
+            children: (C x R) array of offspring chromosomes
+            parent_indices: (C,) index of each child's parent in the population
+            changed_genes: (rows, genes) of all changed genes of the children in routes
+            routes: (rows, transporters) of the routes to recompute; must include the
+                    old and new transporter of every changed gene of those rows
+
+        Returns:
+            tuple: (K,) arrays (workloads, urgent_completion), one per route
+        """
+        rows, transporters = routes
+        parent_rows = parent_indices[rows]
+        membership = self._population_membership(np.unique(parent_rows))
+
+        # Requests the routes keep from the parent
+        route, request = self._gather_routes(membership, parent_rows, transporters)
+        keep = children[rows[route], request] == transporters[route]
+        route, request = route[keep], request[keep]
+
+        # Requests that moved into the routes
+        route_index = np.full((len(children), len(self.transporters)), -1, dtype=np.intp)
+        route_index[rows, transporters] = np.arange(len(rows))
+        gene_rows, genes = changed_genes
+        moved_in = route_index[gene_rows, children[gene_rows, genes]]
+
+        route = np.concatenate((route, moved_in))
+        request = np.concatenate((request, genes))
+        by_route = np.lexsort((request, route))
+        return self._routes_state(route[by_route], request[by_route], transporters)
+
+    def _offspring_route_state(self, children, parent_indices):
+        """
+        Route state of offspring that started as copies of known parents.
+
+        Children identical to their parent inherit its state and membership.
+        The others are looked up in the fitness cache, and identical children
+        of the same generation are evaluated only once. The transporters whose
+        routes changed are those appearing as old or new value of a changed
+        gene; if there are at most delta_transporter_limit of them only their
+        routes are recomputed (see _delta_route_state), otherwise the whole
+        child gets the vectorized full pass.
+
+        Args:
+            children: (C x R) array of offspring chromosomes
+            parent_indices: (C,) index of each child's first parent in the population
+
+        Returns:
+            tuple: (C x T) arrays (workloads, urgent_completion) and the children's
+                   route membership (order, starts, ends, known)
+        """
+        workloads = self.population_workloads[parent_indices]
+        urgent_completion = self.population_urgent_completion[parent_indices]
+        membership = tuple(array[parent_indices] for array in self._membership_arrays())
+
+        parents = self.population[parent_indices]
+        changed_genes = children != parents
+        changed = np.flatnonzero(changed_genes.any(axis=1))
+        if len(changed) == 0:
+            return workloads, urgent_completion, membership
+        membership[3][changed] = False
+
+        # Cache lookup; the first occurrence of each unknown chromosome gets evaluated
+        first_occurrence, duplicates = {}, []
+        for i in changed:
+            key = children[i].tobytes()
+            cached = self._fitness_cache.get(key)
+            if cached is not None:
+                self._fitness_cache.move_to_end(key)
+                workloads[i], urgent_completion[i] = cached
+                self.cache_hits += 1
+            elif key in first_occurrence:
+                duplicates.append((i, first_occurrence[key]))
+                self.cache_hits += 1
+            else:
+                first_occurrence[key] = i
+                self.cache_misses += 1
+
+        evaluate = np.fromiter(first_occurrence.values(), dtype=np.intp, count=len(first_occurrence))
+        rows, genes = np.nonzero(changed_genes[evaluate])
+        rows = evaluate[rows]
+        affected = np.zeros(workloads.shape, dtype=bool)
+        affected[rows, children[rows, genes]] = True
+        affected[rows, parents[rows, genes]] = True
+
+        delta = np.zeros(len(children), dtype=bool)
+        delta[evaluate] = affected[evaluate].sum(axis=1) <= self.delta_transporter_limit
+        full = evaluate[~delta[evaluate]]
+        if len(full):
+            order, starts, ends = self._route_membership(children[full])
+            workloads[full], urgent_completion[full] = self._route_state(children[full], order)
+            membership[0][full], membership[1][full], membership[2][full] = order, starts, ends
+            membership[3][full] = True
+
+        affected[~delta] = False
+        routes = np.nonzero(affected)
+        if len(routes[0]):
+            in_delta = delta[rows]
+            workloads[routes], urgent_completion[routes] = self._delta_route_state(
+                children, parent_indices, (rows[in_delta], genes[in_delta]), routes)
+        self.full_evaluations += len(full)
+        self.delta_evaluations += len(evaluate) - len(full)
+
+        for i, source in duplicates:
+            workloads[i], urgent_completion[i] = workloads[source], urgent_completion[source]
+        for key, i in first_occurrence.items():
+            self._cache_route_state(key, workloads[i].copy(), urgent_completion[i].copy())
+        return workloads, urgent_completion, membership
+
+    def _cache_route_state(self, key, workloads, urgent_completion):
+        """Remember a chromosome's route state, evicting the least recently used entry when full."""
+        if self.fitness_cache_size <= 0:
+            return
+        self._fitness_cache[key] = (workloads, urgent_completion)
+        if len(self._fitness_cache) > self.fitness_cache_size:
+            self._fitness_cache.popitem(last=False)
+
+    def _evaluate_fitness(self, chromosome):
+        """
+        Evaluate the fitness of a single chromosome.
+
+        Args:
+            chromosome: Assignment chromosome
+
+        Returns:
+            float: Fitness score (lower is better)
+        """
+        return float(self._evaluate_population_fitness(np.asarray(chromosome)[None, :])[0])
 
     def _select_parents(self, population, fitness_scores):
         """
         Select parents for reproduction using the selected selection method.
 
         Args:
-            population: List of chromosomes
-            fitness_scores: List of corresponding fitness scores
+            population: (P x R) array of chromosomes
+            fitness_scores: Array of corresponding fitness scores
 
         Returns:
-            list: Selected parent chromosomes
+            np.ndarray: Indices of the selected parents in the population
         """
         if self.selection_method == "tournament":
             return self._tournament_selection(population, fitness_scores)
@@ -425,234 +983,228 @@ class GeneticAlgorithm:
         Select parents using tournament selection.
 
         Args:
-            population: List of chromosomes
-            fitness_scores: List of corresponding fitness scores
+            population: (P x R) array of chromosomes
+            fitness_scores: Array of corresponding fitness scores
 
         Returns:
-            list: Selected parent chromosomes
+            np.ndarray: Indices of the selected parents in the population
         """
-        parents = []
-        tournament_size = max(2, self.population_size // 5)
-
+        tournament_size = min(max(2, self.population_size // 5), len(population))
         num_parents = max(self.population_size // 2, 4)  # At least 4 parents
 
-        while len(parents) < num_parents:
-            # Select random candidates for tournament
-            candidates = random.sample(range(len(population)), min(tournament_size, len(population)))
-
-            # Find the best candidate
-            best_idx = min(candidates, key=lambda i: fitness_scores[i])
-            parents.append(deepcopy(population[best_idx]))
+        # Distinct random candidates per tournament: the first columns of a random permutation
+        candidates = np.argsort(np.random.random((num_parents, len(population))), axis=1)[:, :tournament_size]
 
-        return parents
+        # The best candidate of each tournament wins
+        winners = np.argmin(np.asarray(fitness_scores)[candidates], axis=1)
+        return candidates[np.arange(num_parents), winners]
 
     def _roulette_wheel_selection(self, population, fitness_scores):
         """
         Select parents using roulette wheel selection.
 
         Args:
-            population: List of chromosomes
-            fitness_scores: List of corresponding fitness scores
+            population: (P x R) array of chromosomes
+            fitness_scores: Array of corresponding fitness scores
 
         Returns:
-            list: Selected parent chromosomes
+            np.ndarray: Indices of the selected parents in the population
         """
+        num_parents = max(self.population_size // 2, 4)  # At least 4 parents
+        fitness_scores = np.asarray(fitness_scores, dtype=float)
+
         # Since fitness is minimized, invert scores so better solutions have higher weight
-        if not fitness_scores or max(fitness_scores) == float('inf'):
+        if len(fitness_scores) == 0 or fitness_scores.max() == float('inf'):
             # Fallback to random selection if all fitness scores are infinite
-            return random.choices(population, k=max(4, self.population_size // 2))
+            return np.random.randint(len(population), size=num_parents)
 
-        max_fitness = max(fitness_scores)
-        inverted_fitness = [max(0.001, max_fitness - score + 0.001) for score in fitness_scores]
-        total_fitness = sum(inverted_fitness)
+        inverted_fitness = np.maximum(0.001, fitness_scores.max() - fitness_scores + 0.001)
 
         # Normalize to probabilities
-        selection_probs = [f / total_fitness for f in inverted_fitness]
-
-        # Select parents
-        num_parents = max(self.population_size // 2, 4)  # At least 4 parents
-        parents = random.choices(population, weights=selection_probs, k=num_parents)
+        selection_probs = inverted_fitness / inverted_fitness.sum()
 
-        return [deepcopy(p) for p in parents]
+        return np.random.choice(len(population), size=num_parents, p=selection_probs)
 
-    def _crossover(self, parent1, parent2):
+    def _crossover_into(self, children, parents):
         """
-        Create a child by combining parts of two parents using the selected method.
+        Fill a block of the offspring buffer with children of the selected parents.
+
+        Every child starts as a copy of its first parent; with probability
+        crossover_rate, a crossover mask then copies genes from the second parent
+        in place.
 
         Args:
-            parent1: First parent chromosome
-            parent2: Second parent chromosome
+            children: (C x R) view into the offspring buffer
+            parents: Indices of the selected parents in the population
 
         Returns:
-            list: Child chromosome
-        """
-        if self.crossover_method == "one_point":
-            return self._one_point_crossover(parent1, parent2)
-        elif self.crossover_method == "two_point":
-            return self._two_point_crossover(parent1, parent2)
-        elif self.crossover_method == "uniform":
-            return self._uniform_crossover(parent1, parent2)
-        else:
-            self.logger.warning(f"Unknown crossover method: {self.crossover_method}, using two-point")
-            return self._two_point_crossover(parent1, parent2)
-
-    def _one_point_crossover(self, parent1, parent2):
-        """Perform one-point crossover."""
-        if len(parent1) <= 1:
-            return deepcopy(parent1)
-
-        crossover_point = random.randrange(1, len(parent1))
-        return parent1[:crossover_point] + parent2[crossover_point:]
-
-    def _two_point_crossover(self, parent1, parent2):
-        """Perform two-point crossover."""
-        if len(parent1) <= 2:
-            return deepcopy(parent1)
+            np.ndarray: Population index of each child's first parent
+        """
+        num_children, num_genes = children.shape
+        if num_children == 0:
+            return np.zeros(0, dtype=np.intp)
 
-        point1 = random.randrange(len(parent1) - 1)
-        point2 = random.randrange(point1 + 1, len(parent1))
+        # Two different parents from the parent pool for each child
+        first = np.random.randint(len(parents), size=num_children)
+        second = (first + np.random.randint(1, len(parents), size=num_children)) % len(parents)
+        parent1, parent2 = parents[first], parents[second]
 
-        return parent1[:point1] + parent2[point1:point2] + parent1[point2:]
+        np.take(self.population, parent1, axis=0, out=children)
 
-    def _uniform_crossover(self, parent1, parent2):
-        """Perform uniform crossover with 50% probability for each gene."""
-        child = []
-        for i in range(len(parent1)):
-            if random.random() < 0.5:
-                child.append(parent1[i])
-            else:
-                child.append(parent2[i])
-        return child
+        mask = self._crossover_mask(num_children, num_genes)
+        mask &= (np.random.random(num_children) < self.crossover_rate)[:, None]
+        np.copyto(children, self.population[parent2], where=mask)
+        return parent1
 
-    def _mutate(self, chromosome):
+    def _crossover_mask(self, num_children, num_genes):
         """
-        Apply mutation operators to a chromosome.
-
-        Args:
-            chromosome: Chromosome to mutate
+        Genes taken from the second parent, per child, using the selected method.
 
         Returns:
-            list: Mutated chromosome
+            np.ndarray: (C x R) boolean mask
         """
-        # Choose mutation type based on random choice and chromosome length
-        mutation_types = []
-
+        method = self.crossover_method
+        if method not in ("one_point", "two_point", "uniform"):
+            self.logger.warning(f"Unknown crossover method: {method}, using two-point")
+            method = "two_point"
+
+        genes = np.arange(num_genes)
+
+        if method == "one_point":
+            if num_genes <= 1:
+                return np.zeros((num_children, num_genes), dtype=bool)
+            crossover_point = np.random.randint(1, num_genes, size=num_children)
+            return genes >= crossover_point[:, None]
+
+        if method == "two_point":
+            if num_genes <= 2:
+                return np.zeros((num_children, num_genes), dtype=bool)
+            point1 = np.random.randint(num_genes - 1, size=num_children)
+            point2 = point1 + 1 + (np.random.random(num_children) * (num_genes - 1 - point1)).astype(int)
+            return (genes >= point1[:, None]) & (genes < point2[:, None])
+
+        # Uniform crossover with 50% probability for each gene
+        return np.random.random((num_children, num_genes)) < 0.5
+
+    def _mutation_types(self, num_genes):
+        """Mutation operators to draw from, weighted by chromosome length."""
         # For small chromosomes (few requests), prefer point mutation
-        if len(chromosome) <= 10:
-            mutation_types = ["point"] * 4 + ["swap", "inversion"]
+        if num_genes <= 10:
+            return ["point"] * 4 + ["swap", "inversion"]
         # For medium chromosomes, use a mix
-        elif len(chromosome) <= 30:
-            mutation_types = ["point"] * 2 + ["swap"] * 2 + ["inversion", "scramble"]
+        elif num_genes <= 30:
+            return ["point"] * 2 + ["swap"] * 2 + ["inversion", "scramble"]
         # For large chromosomes, use more powerful operators
-        else:
-            mutation_types = ["point", "swap"] * 2 + ["inversion", "scramble"] * 2
-
-        mutation_type = random.choice(mutation_types)
-
-        if mutation_type == "point":
-            return self._point_mutation(chromosome)
-        elif mutation_type == "swap":
-            return self._swap_mutation(chromosome)
-        elif mutation_type == "inversion":
-            return self._inversion_mutation(chromosome)
-        elif mutation_type == "scramble":
-            return self._scramble_mutation(chromosome)
-        else:
-            return self._point_mutation(chromosome)  # Default
+        return ["point", "swap"] * 2 + ["inversion", "scramble"] * 2
 
-    def _point_mutation(self, chromosome):
-        """Change random positions to random transporters."""
-        mutated = deepcopy(chromosome)
-        num_mutations = max(1, int(len(chromosome) * self.mutation_rate))
-        positions = random.sample(range(len(chromosome)), min(num_mutations, len(chromosome)))
-
-        for pos in positions:
-            mutated[pos] = random.randrange(len(self.transporters))
+    def _mutate_in_place(self, chromosomes):
+        """
+        Mutate a block of chromosomes in place.
 
-        return mutated
+        Each chromosome is mutated with probability mutation_rate by one randomly
+        drawn operator; all chromosomes drawing the same operator are mutated
+        together with vectorized index operations.
 
-    def _swap_mutation(self, chromosome):
-        """Swap the transporters for two random requests."""
-        if len(chromosome) <= 1:
-            return deepcopy(chromosome)
+        Args:
+            chromosomes: (C x R) view into the offspring buffer
+        """
+        num_chromosomes, num_genes = chromosomes.shape
+        selected = np.flatnonzero(np.random.random(num_chromosomes) < self.mutation_rate)
+        if len(selected) == 0 or num_genes == 0:
+            return
 
-        mutated = deepcopy(chromosome)
-        pos1, pos2 = random.sample(range(len(chromosome)), 2)
-        mutated[pos1], mutated[pos2] = mutated[pos2], mutated[pos1]
+        mutation_types = np.array(self._mutation_types(num_genes))
+        drawn = mutation_types[np.random.randint(len(mutation_types), size=len(selected))]
 
-        return mutated
+        self._point_mutation(chromosomes, selected[drawn == "point"])
+        self._swap_mutation(chromosomes, selected[drawn == "swap"])
+        self._inversion_mutation(chromosomes, selected[drawn == "inversion"])
+        self._scramble_mutation(chromosomes, selected[drawn == "scramble"])
 
-    def _inversion_mutation(self, chromosome):
-        """Invert a section of the chromosome."""
-        if len(chromosome) <= 2:
-            return deepcopy(chromosome)
+    def _point_mutation(self, chromosomes, rows):
+        """Change random positions to random transporters."""
+        num_genes = chromosomes.shape[1]
+        if len(rows) == 0:
+            return
 
-        mutated = deepcopy(chromosome)
+        num_mutations = min(max(1, int(num_genes * self.mutation_rate)), num_genes)
+        positions = np.argpartition(np.random.random((len(rows), num_genes)), num_mutations - 1,
+                                    axis=1)[:, :num_mutations]
+        chromosomes[rows[:, None], positions] = np.random.randint(len(self.transporters),
+                                                                  size=(len(rows), num_mutations))
 
-        # Select section to invert
-        start = random.randrange(len(chromosome) - 1)
-        end = random.randrange(start + 1, min(start + 10, len(chromosome)))
+    def _swap_mutation(self, chromosomes, rows):
+        """Swap the transporters for two random requests."""
+        num_genes = chromosomes.shape[1]
+        if len(rows) == 0 or num_genes <= 1:
+            return
 
-        # Invert section
-        mutated[start:end] = mutated[start:end][::-1]
+        pos1 = np.random.randint(num_genes, size=len(rows))
+        pos2 = (pos1 + np.random.randint(1, num_genes, size=len(rows))) % num_genes
+        chromosomes[rows, pos1], chromosomes[rows, pos2] = chromosomes[rows, pos2], chromosomes[rows, pos1]
 
-        return mutated
+    def _random_sections(self, num_rows, num_genes):
+        """Random [start, end) sections of at most 9 genes, as (start, end) column vectors."""
+        start = np.random.randint(num_genes - 1, size=num_rows)
+        span = np.minimum(start + 10, num_genes) - (start + 1)
+        end = start + 1 + (np.random.random(num_rows) * span).astype(int)
+        return start[:, None], end[:, None]
 
-    def _scramble_mutation(self, chromosome):
-        """Randomly scramble a section of the chromosome."""
-        if len(chromosome) <= 2:
-            return deepcopy(chromosome)
+    def _inversion_mutation(self, chromosomes, rows):
+        """Invert a section of the chromosome."""
+        num_genes = chromosomes.shape[1]
+        if len(rows) == 0 or num_genes <= 2:
+            return
 
-        mutated = deepcopy(chromosome)
+        start, end = self._random_sections(len(rows), num_genes)
+        genes = np.arange(num_genes)
+        in_section = (genes >= start) & (genes < end)
 
-        # Select section to scramble
-        start = random.randrange(len(chromosome) - 1)
-        end = random.randrange(start + 1, min(start + 10, len(chromosome)))
+        # Gene j of the section takes the value at its mirrored position
+        source = np.where(in_section, start + end - 1 - genes, genes)
+        chromosomes[rows] = np.take_along_axis(chromosomes[rows], source, axis=1)
 
-        # Extract section
-        section = mutated[start:end]
-        random.shuffle(section)
+    def _scramble_mutation(self, chromosomes, rows):
+        """Randomly scramble a section of the chromosome."""
+        num_genes = chromosomes.shape[1]
+        if len(rows) == 0 or num_genes <= 2:
+            return
 
-        # Replace section
-        mutated[start:end] = section
+        start, end = self._random_sections(len(rows), num_genes)
+        genes = np.arange(num_genes)
+        in_section = (genes >= start) & (genes < end)
 
-        return mutated
+        # Random keys inside [start, end) only reorder the section when sorted
+        keys = np.where(in_section, start + np.random.random((len(rows), num_genes)) * (end - start), genes)
+        source = np.argsort(keys, axis=1, kind='stable')
+        chromosomes[rows] = np.take_along_axis(chromosomes[rows], source, axis=1)
 
     def _calculate_population_diversity(self, population):
         """
-        Calculate population diversity using average Hamming distance.
+        Calculate population diversity as the average Hamming distance over all pairs.
+
+        The number of pairs that differ at a gene follows from how often each
+        transporter occurs there: (P^2 - sum of squared counts) / 2. Counting
+        alleles per gene gives the exact all-pairs average in O(P*R).
 
         Args:
-            population: List of chromosomes
+            population: (P x R) array of chromosomes
 
         Returns:
             float: Diversity measure (0.0-1.0)
         """
-        if not population or len(population) <= 1:
+        population = np.asarray(population, dtype=np.intp)
+        if len(population) <= 1 or population.shape[1] == 0:
             return 0.0
 
-        # Sample pairs for large populations
-        num_pairs = min(100, len(population) * (len(population) - 1) // 2)
-        total_distance = 0
-
-        if len(population) <= 15:  # Small population, check all pairs
-            for i in range(len(population)):
-                for j in range(i + 1, len(population)):
-                    distance = sum(c1 != c2 for c1, c2 in zip(population[i], population[j]))
-                    total_distance += distance
-
-            max_possible = len(population[0]) * (len(population) * (len(population) - 1) // 2)
-            return total_distance / max_possible if max_possible > 0 else 0.0
-        else:  # Larger population, sample pairs
-            pairs_sampled = 0
-            while pairs_sampled < num_pairs:
-                i, j = random.sample(range(len(population)), 2)
-                distance = sum(c1 != c2 for c1, c2 in zip(population[i], population[j]))
-                total_distance += distance
-                pairs_sampled += 1
-
-            max_possible = len(population[0]) * num_pairs
-            return total_distance / max_possible if max_possible > 0 else 0.0
+        num_individuals, num_genes = population.shape
+        num_alleles = int(population.max()) + 1
+        counts = np.bincount((population + np.arange(num_genes) * num_alleles).ravel(),
+                             minlength=num_genes * num_alleles)
+
+        differing_pairs = (num_individuals * num_individuals * num_genes - np.dot(counts, counts)) / 2
+        max_possible = num_genes * num_individuals * (num_individuals - 1) / 2
+        return float(differing_pairs / max_possible)
 
     def _adjust_mutation_rate(self, generation):
         """
@@ -690,22 +1242,25 @@ class GeneticAlgorithm:
                     self.logger.debug(f"Decreasing mutation rate: {self.mutation_rate:.3f} -> {new_rate:.3f}")
                     self.mutation_rate = new_rate
 
-    def _inject_diversity(self):
-        """Inject diversity by replacing some individuals with new random ones."""
+    def _inject_diversity(self, fitness_scores):
+        """
+        Inject diversity by replacing some individuals with new random ones.
+
+        Args:
+            fitness_scores: This generation's fitness array, updated in place
+        """
         # Replace bottom 20% of population with new random individuals
         if len(self.population) <= 3:
             return
 
-        # Evaluate current population
-        fitness_scores = self._evaluate_population_fitness(self.population)
-
         # Find indices of worst individuals
         num_to_replace = max(1, self.population_size // 5)
         worst_indices = np.argsort(fitness_scores)[-num_to_replace:]
 
         # Create new random individuals
-        for idx in worst_indices:
-            self.population[idx] = self._create_random_chromosome()
+        self._replace_individuals(worst_indices, np.random.randint(len(self.transporters),
+                                                                   size=(len(worst_indices), len(self.requests))),
+                                  fitness_scores)
 
         self.logger.debug(f"Injected {num_to_replace} new random individuals")
 
@@ -725,7 +1280,7 @@ class GeneticAlgorithm:
             if t_idx >= len(self.transporters):
                 continue  # Skip invalid assignments
 
-            transporter = self.transporters[t_idx]
+            transporter = self.transporters[int(t_idx)]
             request = self.requests[i]
             plan[transporter.name].append(request)
 
@@ -1232,7 +1787,7 @@ class GeneticAlgorithm:
         if not requests:
             return []
 
-        remaining = deepcopy(requests)
+        remaining = list(requests)
         ordered = []
         current_location = transporter.current_location
 
@@ -1262,10 +1817,17 @@ class GeneticAlgorithm:
             f"  Initialization: {self.initialization_time:.2f}s ({100 * self.initialization_time / max(0.001, self.total_time):.1f}%)")
         self.logger.info(
             f"  Evolution: {self.evolution_time:.2f}s ({100 * self.evolution_time / max(0.001, self.total_time):.1f}%)")
-        self.logger.info(f"  Fitness evaluation: {self.fitness_eval_time:.2f}s")
+        self.logger.info(f"  Fitness evaluation: {self.fitness_eval_time:.2f}s "
+                         f"({self.full_evaluations} full, {self.delta_evaluations} delta)")
+        lookups = self.cache_hits + self.cache_misses
+        if lookups:
+            self.logger.info(f"  Fitness cache: {self.cache_hits}/{lookups} hits ({self.cache_hits / lookups:.1%}), "
+                             f"{self.cache_hits} evaluations saved")
         self.logger.info(f"  Selection: {self.selection_time:.2f}s")
         self.logger.info(f"  Crossover: {self.crossover_time:.2f}s")
         self.logger.info(f"  Mutation: {self.mutation_time:.2f}s")
+        if self.memetic:
+            self.logger.info(f"  Memetic search: {self.memetic_time:.2f}s ({self.memetic_moves} moves)")
 
         # Diversity statistics
         if self.diversity_history:
@@ -1,5 +1,6 @@
 from Model.Assignment_strategies.assignment_strategy import AssignmentStrategy
 from Model.Assignment_strategies.Genetic_algorithms.genetic_algorithm import GeneticAlgorithm
+from Model.Assignment_strategies.Genetic_algorithms.island_model import IslandModel
 
 
 class GeneticAlgorithmStrategy(AssignmentStrategy):
@@ -10,7 +11,8 @@ class GeneticAlgorithmStrategy(AssignmentStrategy):
     the actual optimization work to the GeneticAlgorithm class.
     """
 
-    def __init__(self, population_size=50, generations=50, time_limit_seconds=5):
+    def __init__(self, population_size=50, generations=50, time_limit_seconds=5, islands=1,
+                 persistent_population=True, memetic=False, report_interval=1.0):
         """
         Initialize the genetic algorithm strategy.
 
@@ -18,12 +20,28 @@ class GeneticAlgorithmStrategy(AssignmentStrategy):
             population_size: Size of the population (default: 50)
             generations: Maximum number of generations to evolve (default: 50)
             time_limit_seconds: Maximum time in seconds to run (default: 5)
+            islands: Number of parallel sub-populations; more than one runs
+                     the island model across processes (default: 1)
+            persistent_population: Start each run from the previous run's final
+                                   population, remapped onto the new requests
+                                   (default: True; single-population runs only)
+            memetic: Improve elite individuals with relocate/swap local search
+                     every generation (default: False)
+            report_interval: Seconds between improved plans streamed by
+                             generate_assignment_plans (default: 1.0)
         """
         self.population_size = population_size
         self.generations = generations
         self.time_limit_seconds = time_limit_seconds
+        self.islands = islands
+        self.persistent_population = persistent_population
+        self.memetic = memetic
+        self.report_interval = report_interval
         self.algorithm = None
 
+        # (population, request_ids, transporter_names) of the last evolved population
+        self.previous_population = None
+
     def generate_assignment_plan(self, transporters, assignable_requests, graph):
         """
         Generate an assignment plan using genetic algorithm.
@@ -36,9 +54,46 @@ class GeneticAlgorithmStrategy(AssignmentStrategy):
         Returns:
             Dictionary mapping transporter names to lists of assigned requests
         """
+        plan = None
+        for plan in self._run(transporters, assignable_requests, graph, report_interval=None):
+            pass
+        return plan
+
+    def generate_assignment_plans(self, transporters, assignable_requests, graph):
+        """
+        Yield improving assignment plans while the genetic algorithm runs.
+
+        The first plan comes right after the initial population has been
+        evaluated, so dispatch can start immediately; improved plans follow at
+        most every report_interval seconds, and the last one is the final result.
+
+        Args:
+            transporters: List of available transporters
+            assignable_requests: List of requests to be assigned
+            graph: Hospital graph with department locations
+
+        Yields:
+            Dictionaries mapping transporter names to lists of assigned requests
+        """
+        return self._run(transporters, assignable_requests, graph, self.report_interval)
+
+    def _run(self, transporters, assignable_requests, graph, report_interval):
         # Scale parameters based on problem size
         self._scale_parameters(transporters, assignable_requests)
 
+        if self.islands > 1:
+            self.algorithm = IslandModel(
+                transporters,
+                assignable_requests,
+                graph,
+                islands=self.islands,
+                population_size=self.population_size,
+                generations=self.generations,
+                time_limit_seconds=self.time_limit_seconds
+            )
+            yield self.algorithm.run()
+            return
+
         # Create and run the algorithm
         self.algorithm = GeneticAlgorithm(
             transporters,
@@ -46,11 +101,21 @@ class GeneticAlgorithmStrategy(AssignmentStrategy):
             graph,
             population_size=self.population_size,
             generations=self.generations,
-            time_limit_seconds=self.time_limit_seconds
+            time_limit_seconds=self.time_limit_seconds,
+            memetic=self.memetic
         )
 
-        # Run the algorithm and return the results
-        return self.algorithm.run()
+        if self.persistent_population and self.previous_population is not None:
+            self.algorithm.initial_population = self.algorithm.carry_over_population(*self.previous_population)
+
+        # Run the algorithm and keep its final population for the next round
+        yield from self.algorithm.run_anytime(report_interval)
+        if self.persistent_population and len(self.algorithm.population):
+            self.previous_population = (
+                self.algorithm.population.copy(),
+                [r.id for r in assignable_requests],
+                [t.name for t in transporters]
+            )
 
     def _scale_parameters(self, transporters, requests):
         """
@@ -0,0 +1,232 @@
+import logging
+import random
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from Model.Assignment_strategies.Genetic_algorithms.genetic_algorithm import GeneticAlgorithm
+from Model.Assignment_strategies.parallel_runner import process_context, run_in_processes
+from Model.Assignment_strategies.problem_snapshot import ProblemSnapshot
+
+# (selection_method, crossover_method) per island, cycled when there are more islands
+OPERATOR_MIXES = [
+    ("tournament", "two_point"),
+    ("roulette", "uniform"),
+    ("tournament", "one_point"),
+    ("roulette", "two_point"),
+    ("tournament", "uniform"),
+    ("roulette", "one_point"),
+]
+
+
+class MigrationBuffer:
+    """
+    Shared-memory mailboxes for migrating chromosomes between islands.
+
+    Each island owns one slot holding its latest emigrants and a version
+    counter. Islands form a ring: island i publishes into slot i and
+    receives from slot i - 1, taking each batch of migrants only once.
+    """
+
+    def __init__(self, num_islands, migrants, num_genes, locks, name=None):
+        self.num_islands = num_islands
+        self.migrants = migrants
+        self.num_genes = num_genes
+        self.locks = locks
+
+        genes_size = num_islands * migrants * max(1, num_genes) * 8
+        size = genes_size + num_islands * 8
+        if name is None:
+            self.memory = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+
+        self.genes = np.ndarray((num_islands, migrants, num_genes), dtype=np.int64, buffer=self.memory.buf)
+        self.versions = np.ndarray((num_islands,), dtype=np.int64, buffer=self.memory.buf, offset=genes_size)
+        if name is None:
+            self.versions[:] = 0
+
+    def attach(self):
+        """Open the same buffer from a worker process."""
+        return MigrationBuffer(self.num_islands, self.migrants, self.num_genes, self.locks, name=self.memory.name)
+
+    def publish(self, island, chromosomes):
+        with self.locks[island]:
+            self.genes[island, :len(chromosomes)] = chromosomes
+            self.versions[island] += 1
+
+    def receive(self, island, last_version):
+        """
+        Return (chromosomes, version) from the ring neighbour, or (None, last_version)
+        if it has not published anything new.
+        """
+        source = (island - 1) % self.num_islands
+        with self.locks[source]:
+            version = int(self.versions[source])
+            if version == last_version:
+                return None, last_version
+            return self.genes[source].copy(), version
+
+    def close(self, unlink=False):
+        # Drop the numpy views before closing the mapping
+        self.genes = self.versions = None
+        self.memory.close()
+        if unlink:
+            self.memory.unlink()
+
+
+class IslandMigration:
+    """Migration hook for one island's GeneticAlgorithm."""
+
+    def __init__(self, buffer, island, interval):
+        self.buffer = buffer
+        self.island = island
+        self.interval = interval
+        self.last_version = 0
+
+    def __call__(self, generation, population, fitness_scores):
+        if generation == 0 or generation % self.interval != 0:
+            return None
+
+        best = np.argsort(fitness_scores, kind='stable')[:self.buffer.migrants]
+        self.buffer.publish(self.island, population[best])
+
+        immigrants, self.last_version = self.buffer.receive(self.island, self.last_version)
+        return immigrants
+
+
+def _run_island(snapshot, island, ga_kwargs, buffer, interval, seed):
+    """Worker entry point: evolve one island and return its best chromosome and fitness."""
+    # Forked workers inherit the parent's random state, so reseed per island
+    random.seed(seed)
+    np.random.seed(seed)
+
+    transporters, requests, graph = snapshot.restore()
+    migration_buffer = buffer.attach()
+    try:
+        ga = GeneticAlgorithm(transporters, requests, graph,
+                              migration_hook=IslandMigration(migration_buffer, island, interval), **ga_kwargs)
+        ga.run()
+        return ga.best_solution.tolist(), float(ga.best_fitness), ga.current_generation + 1
+    finally:
+        migration_buffer.close()
+
+
+class IslandModel:
+    """
+    Island-model parallel genetic algorithm.
+
+    Several sub-populations evolve in separate processes, each with a different
+    selection/crossover mix, and periodically pass their best individuals to
+    the next island through shared memory. The best individual of all islands
+    is returned within the same wall-clock budget as a single GA run.
+    """
+
+    def __init__(self, transporters, requests, graph, islands=4, population_size=50, generations=50,
+                 time_limit_seconds=5, migration_interval=10, migrants=2, max_workers=None, seed=None):
+        """
+        Args:
+            transporters: List of transporter objects
+            requests: List of request objects
+            graph: Hospital graph
+            islands: Number of sub-populations (worker processes)
+            population_size: Population size per island
+            generations: Maximum number of generations per island
+            time_limit_seconds: Wall-clock budget for the whole run
+            migration_interval: Generations between migrations
+            migrants: Number of individuals sent per migration
+            max_workers: Maximum number of concurrent processes (default: one per
+                         island, since migration needs the islands to run together)
+            seed: Base random seed; island i uses seed + i
+        """
+        self.transporters = transporters
+        self.requests = requests
+        self.graph = graph
+        self.islands = islands
+        self.population_size = population_size
+        self.generations = generations
+        self.time_limit_seconds = time_limit_seconds
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.max_workers = max_workers or islands
+        self.seed = seed if seed is not None else random.randrange(2 ** 31)
+        self.logger = logging.getLogger('IslandModel')
+
+        # Local GA for cost model, plan conversion and travel time estimates
+        self.algorithm = GeneticAlgorithm(transporters, requests, graph, population_size=population_size,
+                                          generations=generations, time_limit_seconds=time_limit_seconds)
+        self.island_results = {}
+        self.best_fitness = float('inf')
+
+    def run(self):
+        """
+        Evolve all islands and return the best plan found.
+
+        Returns:
+            dict: Assignment plan mapping transporter names to lists of requests
+        """
+        # Small problems are solved greedily by the GA itself
+        if self.islands <= 1 or len(self.requests) <= 8:
+            plan = self.algorithm.run()
+            self.best_fitness = self.algorithm.best_fitness
+            return plan
+
+        start_time = time.time()
+
+        # The heuristic seeds are shared by all islands, so build them only once
+        seeds = self._heuristic_seeds()
+        time_limit = max(1.0, self.time_limit_seconds - (time.time() - start_time))
+
+        context = process_context()
+        locks = [context.Lock() for _ in range(self.islands)]
+        buffer = MigrationBuffer(self.islands, self.migrants, len(self.requests), locks)
+
+        try:
+            snapshot = ProblemSnapshot(self.transporters, self.requests, self.graph)
+            tasks = {}
+            for island in range(self.islands):
+                selection, crossover = OPERATOR_MIXES[island % len(OPERATOR_MIXES)]
+                ga_kwargs = {
+                    "population_size": self.population_size,
+                    "generations": self.generations,
+                    "time_limit_seconds": time_limit,
+                    "selection_method": selection,
+                    "crossover_method": crossover,
+                    "early_stopping": False,
+                    "initial_population": seeds,
+                }
+                tasks[island] = (_run_island, (snapshot, island, ga_kwargs, buffer,
+                                               self.migration_interval, self.seed + island))
+
+            # Grace period for process startup and population initialization
+            results = run_in_processes(tasks, time_limit + 5, self.max_workers)
+        finally:
+            buffer.close(unlink=True)
+
+        best_chromosome = None
+        for island, (chromosome, fitness, generations_run) in results.items():
+            selection, crossover = OPERATOR_MIXES[island % len(OPERATOR_MIXES)]
+            self.island_results[island] = {
+                "selection": selection, "crossover": crossover,
+                "fitness": fitness, "generations": generations_run
+            }
+            if fitness < self.best_fitness:
+                self.best_fitness, best_chromosome = fitness, chromosome
+
+        if best_chromosome is None:
+            self.logger.warning("No island finished in time, falling back to the greedy plan")
+            return self.algorithm._convert_to_plan(seeds[0])
+
+        self.logger.info(f"Island model: best fitness {self.best_fitness:.2f} from {len(results)}/{self.islands} "
+                         f"islands in {time.time() - start_time:.2f}s")
+        return self.algorithm._convert_to_plan(np.array(best_chromosome, dtype=np.intp))
+
+    def _heuristic_seeds(self):
+        """Greedy, urgency-first and balanced solutions as chromosomes."""
+        plans = [self.algorithm._solve_greedy(), self.algorithm._solve_urgency_first(),
+                 self.algorithm._solve_balanced()]
+        return np.array([self.algorithm._plan_to_chromosome(plan) for plan in plans], dtype=np.intp)
+
+    def estimate_travel_time(self, transporter, request):
+        return self.algorithm.estimate_travel_time(transporter, request)
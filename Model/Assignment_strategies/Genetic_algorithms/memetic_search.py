@@ -0,0 +1,154 @@
+import time
+
+import numpy as np
+
+
+class MemeticSearch:
+    """
+    Relocate and swap local search on GA chromosomes.
+
+    A chromosome assigns every request to a transporter, and each transporter
+    serves its requests in request order, so a route is the sorted array of the
+    request indices assigned to it. Moving a request between routes only
+    changes the legs around its old and new position, so every move is
+    evaluated as an O(1) delta against the GA's cost matrix. Moves are taken
+    from the longest route and accepted when they lower the larger of the two
+    affected route loads, as in RoutePlan.improve.
+    """
+
+    def __init__(self, travel_matrix, transporter_location, request_origin, request_destination,
+                 request_service_time):
+        """
+        Args:
+            travel_matrix: Travel times between location indices
+            transporter_location: Start location index per transporter
+            request_origin: Origin location index per request
+            request_destination: Destination location index per request
+            request_service_time: Origin-to-destination travel time per request
+        """
+        self.travel = travel_matrix
+        self.start = transporter_location
+        self.origin = request_origin
+        self.dest = request_destination
+        self.service = request_service_time
+
+    def improve(self, chromosome, deadline):
+        """
+        Apply improving moves to a copy of the chromosome until none is left or
+        the deadline passes.
+
+        Args:
+            chromosome: (R,) integer array of transporter indices
+            deadline: time.time() value at which to stop
+
+        Returns:
+            tuple: (improved chromosome, number of applied moves)
+        """
+        chromosome = np.array(chromosome, dtype=np.intp)
+        num_transporters = len(self.start)
+        routes = [np.flatnonzero(chromosome == t) for t in range(num_transporters)]
+        loads = np.array([self._route_load(t, route) for t, route in enumerate(routes)], dtype=float)
+        moves = 0
+
+        while num_transporters > 1 and time.time() < deadline:
+            worst = int(np.argmax(loads))
+            if not (self._relocate(chromosome, routes, loads, worst) or
+                    self._swap(chromosome, routes, loads, worst)):
+                break
+            moves += 1
+
+        return chromosome, moves
+
+    def _route_load(self, t, route):
+        if len(route) == 0:
+            return 0.0
+        previous = np.concatenate(([self.start[t]], self.dest[route[:-1]]))
+        return float(self.travel[previous, self.origin[route]].sum() + self.service[route].sum())
+
+    def _removal_deltas(self, t, route):
+        """Load change of route t when the request at each position is removed."""
+        previous = np.concatenate(([self.start[t]], self.dest[route[:-1]]))
+        deltas = -self.travel[previous, self.origin[route]] - self.service[route]
+        following = self.origin[route[1:]]
+        deltas[:-1] += self.travel[previous[:-1], following] - self.travel[self.dest[route[:-1]], following]
+        return deltas
+
+    def _insertion_deltas(self, t, route, requests, removed=None):
+        """
+        Load change of route t when each of requests is inserted at its request-order
+        position, optionally after removing the request at position removed
+        (broadcast against requests).
+        """
+        if len(route) == 0:
+            return self.travel[self.start[t], self.origin[requests]] + self.service[requests]
+
+        position = np.searchsorted(route, requests)
+        previous_position, next_position = position - 1, position
+        if removed is not None:
+            previous_position = np.where(previous_position == removed, previous_position - 1, previous_position)
+            next_position = np.where(next_position == removed, next_position + 1, next_position)
+
+        previous = np.where(previous_position >= 0,
+                            self.dest[route[np.clip(previous_position, 0, len(route) - 1)]], self.start[t])
+        has_next = next_position < len(route)
+        following = self.origin[route[np.clip(next_position, 0, len(route) - 1)]]
+
+        deltas = self.travel[previous, self.origin[requests]] + self.service[requests]
+        return deltas + np.where(has_next, self.travel[self.dest[requests], following] -
+                                 self.travel[previous, following], 0)
+
+    def _relocate(self, chromosome, routes, loads, worst):
+        route = routes[worst]
+        if len(route) == 0:
+            return False
+        new_worst = loads[worst] + self._removal_deltas(worst, route)
+
+        best = None
+        for k in range(len(routes)):
+            if k == worst:
+                continue
+            new_load = loads[k] + self._insertion_deltas(k, routes[k], route)
+            peak = np.maximum(new_worst, new_load)
+            i = int(np.argmin(peak))
+            if peak[i] < loads[worst] - 1e-9 and (best is None or peak[i] < best[0]):
+                best = (peak[i], k, i, new_worst[i], new_load[i])
+
+        if best is None:
+            return False
+        _, k, i, loads[worst], loads[k] = best
+        q = route[i]
+        chromosome[q] = k
+        routes[worst] = np.delete(route, i)
+        routes[k] = np.insert(routes[k], np.searchsorted(routes[k], q), q)
+        return True
+
+    def _swap(self, chromosome, routes, loads, worst):
+        route = routes[worst]
+        if len(route) == 0:
+            return False
+        removal = self._removal_deltas(worst, route)
+        positions = np.arange(len(route))[:, None]
+
+        best = None
+        for k in range(len(routes)):
+            other = routes[k]
+            if k == worst or len(other) == 0:
+                continue
+            # Grid over (request of worst route, request of route k)
+            new_worst = loads[worst] + removal[:, None] + self._insertion_deltas(
+                worst, route, other[None, :], removed=positions)
+            new_load = loads[k] + self._removal_deltas(k, other)[None, :] + self._insertion_deltas(
+                k, other, route[:, None], removed=np.arange(len(other))[None, :])
+            peak = np.maximum(new_worst, new_load)
+            i, j = np.unravel_index(int(np.argmin(peak)), peak.shape)
+            if peak[i, j] < loads[worst] - 1e-9 and (best is None or peak[i, j] < best[0]):
+                best = (peak[i, j], k, i, j, new_worst[i, j], new_load[i, j])
+
+        if best is None:
+            return False
+        _, k, i, j, loads[worst], loads[k] = best
+        q, r = route[i], routes[k][j]
+        chromosome[q], chromosome[r] = k, worst
+        routes[worst] = np.sort(np.concatenate((np.delete(route, i), [r])))
+        routes[k] = np.sort(np.concatenate((np.delete(routes[k], j), [q])))
+        return True
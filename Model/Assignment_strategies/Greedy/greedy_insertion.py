@@ -0,0 +1,102 @@
+import logging
+import time
+
+from Model.Assignment_strategies.distance_matrix import estimate_travel_time
+from Model.Assignment_strategies.route_plan import RoutePlan
+
+
+class GreedyInsertion:
+    """
+    Cheapest-insertion construction heuristic for fast dispatching.
+
+    Requests are taken in priority order (urgent first, then oldest first) and
+    each one is inserted at the position of any transporter's route that gives
+    the earliest finish time for that route, ties going to the smaller detour.
+    Urgent requests are all placed before regular ones, so regular requests are
+    only inserted behind a route's urgent prefix and never delay it.
+
+    All travel times come from one precomputed cost matrix, and an insertion is
+    priced by the legs around its position only, so building a plan costs
+    O(R * T * L) for R requests, T transporters and routes of length L.
+    """
+
+    def __init__(self, transporters, requests, graph):
+        """
+        Args:
+            transporters: List of transporter objects
+            requests: List of request objects
+            graph: Hospital graph
+        """
+        self.transporters = transporters
+        self.requests = requests
+        self.graph = graph
+        self.logger = logging.getLogger('GreedyInsertion')
+
+        # Plain lists: scalar lookups on them are much cheaper than on numpy arrays
+        dist, start, origin, dest = RoutePlan.cost_model(transporters, requests, graph)
+        self.dist, self.start, self.origin, self.dest = dist.tolist(), start.tolist(), origin.tolist(), dest.tolist()
+        self.service = [self.dist[o][d] for o, d in zip(self.origin, self.dest)]
+
+        self.routes = [[] for _ in transporters]
+        self.loads = [0.0] * len(transporters)
+
+    def generate_assignment_plan(self):
+        """
+        Build the routes by cheapest insertion.
+
+        Returns:
+            dict: Assignment plan mapping transporter names to ordered lists of requests
+        """
+        start_time = time.time()
+        self.routes = [[] for _ in self.transporters]
+        self.loads = [0.0] * len(self.transporters)
+        urgent_counts = [0] * len(self.transporters)
+
+        if self.transporters:
+            order = sorted(range(len(self.requests)),
+                           key=lambda q: (not self.requests[q].urgent, self.requests[q].request_time))
+            for q in order:
+                k, position, delta = self._cheapest_insertion(q, urgent_counts)
+                self.routes[k].insert(position, q)
+                self.loads[k] += delta
+                if self.requests[q].urgent:
+                    urgent_counts[k] += 1
+
+        self.logger.debug(f"Inserted {len(self.requests)} requests into {len(self.transporters)} routes "
+                          f"in {(time.time() - start_time) * 1000:.2f}ms")
+        return {t.name: [self.requests[q] for q in route] for t, route in zip(self.transporters, self.routes)}
+
+    def _cheapest_insertion(self, q, urgent_counts):
+        """Return (transporter index, position, load increase) of the best insertion of request q."""
+        dist, origin, dest = self.dist, self.origin, self.dest
+        q_origin, q_dest, q_service = origin[q], dest[q], self.service[q]
+        from_origin = dist[q_dest]
+        urgent = self.requests[q].urgent
+
+        best_key, best = None, None
+        for k, route in enumerate(self.routes):
+            first = 0 if urgent else urgent_counts[k]
+            previous = self.start[k] if first == 0 else dest[route[first - 1]]
+            for position in range(first, len(route) + 1):
+                delta = dist[previous][q_origin] + q_service
+                if position < len(route):
+                    following = origin[route[position]]
+                    delta += from_origin[following] - dist[previous][following]
+                    previous = dest[route[position]]
+                key = (self.loads[k] + delta, delta)
+                if best_key is None or key < best_key:
+                    best_key, best = key, (k, position, delta)
+        return best
+
+    def estimate_travel_time(self, transporter, request):
+        """
+        Estimate travel time for a transporter to complete a request.
+
+        Args:
+            transporter: Transporter object
+            request: Transportation request object
+
+        Returns:
+            float: Time from the transporter's location to the origin plus the transport itself
+        """
+        return estimate_travel_time(transporter, request)
@@ -0,0 +1,25 @@
+from Model.Assignment_strategies.assignment_strategy import AssignmentStrategy
+from Model.Assignment_strategies.Greedy.greedy_insertion import GreedyInsertion
+
+
+class GreedyInsertionStrategy(AssignmentStrategy):
+    """
+    Strategy wrapper for the cheapest-insertion heuristic.
+
+    Builds a plan in well under a second even at peak load, at the price of
+    optimality, so it suits situations where dispatch latency matters most.
+    """
+
+    def __init__(self):
+        self.optimizer = None
+
+    def generate_assignment_plan(self, transporters, assignable_requests, graph):
+        self.optimizer = self.get_optimizer(transporters, assignable_requests, graph)
+        return self.optimizer.generate_assignment_plan()
+
+    def estimate_travel_time(self, transporter, request):
+        optimizer = self.optimizer or GreedyInsertion([], [], transporter.hospital.get_graph())
+        return optimizer.estimate_travel_time(transporter, request)
+
+    def get_optimizer(self, transporters, assignable_requests, graph):
+        return GreedyInsertion(transporters, assignable_requests, graph)
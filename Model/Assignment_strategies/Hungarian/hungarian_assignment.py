@@ -0,0 +1,86 @@
+import logging
+import time
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from Model.Assignment_strategies.distance_matrix import estimate_travel_time
+from Model.Assignment_strategies.route_plan import RoutePlan
+
+
+class HungarianAssignment:
+    """
+    Batch dispatch by repeated transporter-to-request matching.
+
+    Every round gives each transporter at most one next request by solving a
+    linear assignment problem (Hungarian method) on the completion times: the
+    transporter's current finish time, plus the trip from where its route ends
+    to the request's origin, plus the transport itself. Matched requests are
+    appended to the routes and the rounds repeat until all requests are
+    assigned. Urgent requests are matched in the first rounds, before any
+    regular request.
+    """
+
+    def __init__(self, transporters, requests, graph):
+        """
+        Args:
+            transporters: List of transporter objects
+            requests: List of request objects
+            graph: Hospital graph
+        """
+        self.transporters = transporters
+        self.requests = requests
+        self.graph = graph
+        self.logger = logging.getLogger('HungarianAssignment')
+
+        self.dist, self.start, self.origin, self.dest = RoutePlan.cost_model(transporters, requests, graph)
+        self.service = self.dist[self.origin, self.dest] if len(requests) else np.zeros(0)
+
+        self.loads = np.zeros(len(transporters))
+        self.rounds = 0
+
+    def generate_assignment_plan(self):
+        """
+        Match transporters to requests round by round.
+
+        Returns:
+            dict: Assignment plan mapping transporter names to ordered lists of requests
+        """
+        start_time = time.time()
+        routes = [[] for _ in self.transporters]
+        self.loads = np.zeros(len(self.transporters))
+        self.rounds = 0
+
+        if self.transporters:
+            location = self.start.copy()
+            urgent = np.array([r.urgent for r in self.requests], dtype=bool)
+            for batch in (np.flatnonzero(urgent), np.flatnonzero(~urgent)):
+                while len(batch):
+                    # Completion time of every transporter doing every request next
+                    cost = self.loads[:, None] + self.dist[location][:, self.origin[batch]] + self.service[batch]
+                    rows, cols = linear_sum_assignment(cost)
+
+                    for k, column in zip(rows, cols):
+                        q = batch[column]
+                        routes[k].append(q)
+                        self.loads[k] = cost[k, column]
+                        location[k] = self.dest[q]
+                    batch = np.delete(batch, cols)
+                    self.rounds += 1
+
+        self.logger.debug(f"Matched {len(self.requests)} requests in {self.rounds} rounds "
+                          f"in {(time.time() - start_time) * 1000:.2f}ms")
+        return {t.name: [self.requests[q] for q in route] for t, route in zip(self.transporters, routes)}
+
+    def estimate_travel_time(self, transporter, request):
+        """
+        Estimate travel time for a transporter to complete a request.
+
+        Args:
+            transporter: Transporter object
+            request: Transportation request object
+
+        Returns:
+            float: Time from the transporter's location to the origin plus the transport itself
+        """
+        return estimate_travel_time(transporter, request)
@@ -0,0 +1,26 @@
+from Model.Assignment_strategies.assignment_strategy import AssignmentStrategy
+from Model.Assignment_strategies.Hungarian.hungarian_assignment import HungarianAssignment
+
+
+class HungarianAssignmentStrategy(AssignmentStrategy):
+    """
+    Strategy wrapper for round-based linear assignment dispatching.
+
+    Solves only transporter-to-next-request matchings instead of a full MIP,
+    which is enough when transporters are idle and take one task at a time,
+    and produces plans in milliseconds for hundreds of requests.
+    """
+
+    def __init__(self):
+        self.optimizer = None
+
+    def generate_assignment_plan(self, transporters, assignable_requests, graph):
+        self.optimizer = self.get_optimizer(transporters, assignable_requests, graph)
+        return self.optimizer.generate_assignment_plan()
+
+    def estimate_travel_time(self, transporter, request):
+        optimizer = self.optimizer or HungarianAssignment([], [], transporter.hospital.get_graph())
+        return optimizer.estimate_travel_time(transporter, request)
+
+    def get_optimizer(self, transporters, assignable_requests, graph):
+        return HungarianAssignment(transporters, assignable_requests, graph)
@@ -1,8 +1,24 @@
 import numpy as np
+import math
+import multiprocessing
 import time
 import logging
-from copy import deepcopy
+from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.spatial.distance import squareform
 from Model.Assignment_strategies.ILP.ilp_makespan import ILPMakespan
+from Model.Assignment_strategies.ILP.ilp_urgency_first import ILPUrgencyFirst
+from Model.Assignment_strategies.distance_matrix import DistanceMatrix
+from Model.Assignment_strategies.graph_partition import GraphPartition
+from Model.Assignment_strategies.route_plan import RoutePlan
+from Model.Assignment_strategies.parallel_runner import run_in_processes
+from Model.Assignment_strategies.problem_snapshot import ProblemSnapshot
+
+
+def _solve_cluster(snapshot, time_limit):
+    """Worker entry point: solve one cluster's makespan ILP and return a plan of request ids."""
+    transporters, requests, graph = snapshot.restore()
+    plan = ILPMakespan(transporters, requests, graph, time_limit=time_limit).build_and_solve()
+    return ProblemSnapshot.plan_to_ids(plan)
 
 
 class ClusterBasedILP:
@@ -12,14 +28,14 @@ class ClusterBasedILP:
 
     Advanced Features:
     - Adaptive clustering based on hospital size
-    - Multiple clustering methods (k-means, hierarchical)
+    - Multiple clustering methods (cached spectral graph partition, k-means, hierarchical)
     - Performance tracking and metrics
     - Detailed logging
     - Fallback mechanisms
     """
 
     def __init__(self, transporters, requests, graph, num_clusters=None,
-                 clustering_method="kmeans", debug_mode=False, time_limit=30):
+                 clustering_method="spectral", debug_mode=False, time_limit=30, parallel=True, max_workers=None):
         """
         Initialize the clustered ILP optimizer.
 
@@ -28,9 +44,11 @@ class ClusterBasedILP:
             requests: List of transport request objects
             graph: Hospital graph with department locations
             num_clusters: Number of clusters (None for auto-determination)
-            clustering_method: Method to use for clustering ("kmeans" or "hierarchical")
+            clustering_method: Method to use for clustering ("spectral", "kmeans" or "hierarchical")
             debug_mode: Enable detailed logging
             time_limit: Maximum time in seconds for optimization
+            parallel: Solve clusters concurrently in worker processes
+            max_workers: Maximum number of worker processes (default: CPU count)
         """
         self.transporters = transporters
         self.requests = requests
@@ -38,6 +56,8 @@ class ClusterBasedILP:
         self.clustering_method = clustering_method
         self.debug_mode = debug_mode
         self.time_limit = time_limit
+        self.parallel = parallel
+        self.max_workers = max_workers or multiprocessing.cpu_count()
 
         # Performance metrics
         self.preprocessing_time = 0
@@ -84,11 +104,16 @@ class ClusterBasedILP:
         Returns:
             int: Recommended number of clusters
         """
-        # Get unique departments involved in requests
-        departments = set()
-        for r in self.requests:
-            departments.add(r.origin)
-            departments.add(r.destination)
+        if self.clustering_method == "spectral":
+            # The spectral partition covers the whole graph, so size it by the
+            # graph to keep the same cached clusters from round to round
+            departments = set(self.graph.get_nodes())
+        else:
+            # Get unique departments involved in requests
+            departments = set()
+            for r in self.requests:
+                departments.add(r.origin)
+                departments.add(r.destination)
 
         # Scale clusters based on department count
         dept_count = len(departments)
@@ -159,11 +184,9 @@ class ClusterBasedILP:
         """Preprocess data for clustering (extract departments, coordinates, etc.)."""
         self.logger.debug("Preprocessing data for clustering")
 
-        # Extract all unique departments from requests
-        self.all_departments = set()
-        for r in self.requests:
-            self.all_departments.add(r.origin)
-            self.all_departments.add(r.destination)
+        # Extract all unique departments from requests (sorted for reproducible clusters)
+        self.all_departments = sorted({r.origin for r in self.requests} | {r.destination for r in self.requests})
+        self.department_index = {dept: i for i, dept in enumerate(self.all_departments)}
 
         # Create a map of department coordinates
         self.department_coords = {}
@@ -178,38 +201,27 @@ class ClusterBasedILP:
 
     def _create_distance_matrix(self):
         """Create a matrix of distances between all departments."""
-        departments = list(self.all_departments)
-        n = len(departments)
-        self.distance_matrix = np.zeros((n, n))
+        distances = DistanceMatrix.for_graph(self.graph).submatrix(self.all_departments)
 
-        for i in range(n):
-            for j in range(i + 1, n):
-                dept1, dept2 = departments[i], departments[j]
-                distance = self._calculate_distance(dept1, dept2)
-                self.distance_matrix[i, j] = distance
-                self.distance_matrix[j, i] = distance
+        # Fall back to Euclidean distance for unknown or unreachable departments
+        coords = np.array([self.department_coords[d] for d in self.all_departments], dtype=float).reshape(-1, 2)
+        euclidean = np.sqrt(((coords[:, None, :] - coords[None, :, :]) ** 2).sum(axis=2))
+        distances = np.where(np.isinf(distances), euclidean, distances)
+
+        # Clustering needs a symmetric matrix, also for directed graphs
+        self.distance_matrix = (distances + distances.T) / 2
 
     def _calculate_distance(self, dept1, dept2):
         """Calculate the distance between two departments."""
-        # Try using graph-based distance first
-        try:
-            path, _ = self.transporters[0].pathfinder.dijkstra(dept1, dept2)
-            path_distance = sum(
-                self.graph.get_edge_weight(path[i], path[i + 1])
-                for i in range(len(path) - 1)
-            )
-            return path_distance
-        except (IndexError, AttributeError, ValueError):
-            # Fall back to Euclidean distance
-            x1, y1 = self.department_coords[dept1]
-            x2, y2 = self.department_coords[dept2]
-            return np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+        return self.distance_matrix[self.department_index[dept1], self.department_index[dept2]]
 
     def _generate_clusters(self):
         """Generate clusters of departments based on selected method."""
         self.logger.info(f"Generating {self.num_clusters} clusters using {self.clustering_method} method")
 
-        if self.clustering_method == "kmeans":
+        if self.clustering_method == "spectral":
+            self.clusters = self._spectral_clustering()
+        elif self.clustering_method == "kmeans":
             self.clusters = self._kmeans_clustering()
         elif self.clustering_method == "hierarchical":
             self.clusters = self._hierarchical_clustering()
@@ -224,6 +236,19 @@ class ClusterBasedILP:
         for i, cluster in enumerate(self.clusters):
             self.logger.debug(f"Cluster {i + 1} has {len(cluster)} departments")
 
+    def _spectral_clustering(self):
+        """
+        Use the cached spectral partition of the whole hospital graph.
+
+        The partition is only recomputed when the graph changes, so cluster
+        boundaries stay the same across re-optimizations.
+
+        Returns:
+            list: List of clusters, where each cluster is a list of department names
+        """
+        partition = GraphPartition.for_graph(self.graph, self.num_clusters)
+        return partition.clusters_for(self.all_departments)
+
     def _kmeans_clustering(self):
         """
         Perform K-means clustering on hospital departments.
@@ -231,119 +256,82 @@ class ClusterBasedILP:
         Returns:
             list: List of clusters, where each cluster is a list of department names
         """
-        departments = list(self.all_departments)
+        departments = self.all_departments
         if not departments:
             return [[] for _ in range(self.num_clusters)]
 
         # Extract coordinates for clustering
-        coordinates = [self.department_coords[d] for d in departments]
-
-        # Initialize centroids using k-means++ like approach
-        centroids = [coordinates[0]]
-
-        # Initialize remaining centroids by maximizing minimum distance
-        for _ in range(1, self.num_clusters):
-            distances = []
-            for point in coordinates:
-                min_dist = min(np.sum((np.array(point) - np.array(centroid)) ** 2)
-                               for centroid in centroids)
-                distances.append(min_dist)
-
-            if not distances:
-                break
+        coordinates = np.array([self.department_coords[d] for d in departments], dtype=float)
 
-            # Choose the farthest point as the next centroid
-            next_centroid_idx = np.argmax(distances)
-            if next_centroid_idx < len(coordinates):
-                centroids.append(coordinates[next_centroid_idx])
+        # Initialize centroids using k-means++ like approach: start with the first
+        # department and repeatedly add the point farthest from all centroids
+        centroid_indices = [0]
+        min_sq_dist = ((coordinates - coordinates[0]) ** 2).sum(axis=1)
+        for _ in range(1, min(self.num_clusters, len(departments))):
+            next_centroid_idx = int(np.argmax(min_sq_dist))
+            centroid_indices.append(next_centroid_idx)
+            min_sq_dist = np.minimum(min_sq_dist, ((coordinates - coordinates[next_centroid_idx]) ** 2).sum(axis=1))
 
-        # Initialize clusters
-        clusters = [[] for _ in range(len(centroids))]
+        centroids = coordinates[centroid_indices]
+        labels = None
 
         # Run K-means for a fixed number of iterations
         max_iterations = 15
 
         for iteration in range(max_iterations):
-            # Clear current clusters
-            new_clusters = [[] for _ in range(len(centroids))]
-
-            # Assign each department to nearest centroid
-            for i, dept in enumerate(departments):
-                if i >= len(coordinates):
-                    continue
-
-                min_dist = float('inf')
-                closest_cluster = 0
-
-                for j, centroid in enumerate(centroids):
-                    dist = np.sum((np.array(coordinates[i]) - np.array(centroid)) ** 2)
-                    if dist < min_dist:
-                        min_dist = dist
-                        closest_cluster = j
-
-                new_clusters[closest_cluster].append(dept)
+            # Assign each department to nearest centroid (departments x centroids distances)
+            sq_dist = ((coordinates[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+            new_labels = np.argmin(sq_dist, axis=1)
 
             # Check if clusters have changed
-            if all(set(old) == set(new) for old, new in zip(clusters, new_clusters) if old and new):
+            if labels is not None and np.array_equal(labels, new_labels):
                 self.logger.debug(f"K-means converged after {iteration + 1} iterations")
-                clusters = new_clusters
                 break
+            labels = new_labels
 
-            clusters = new_clusters
-
-            # Update centroids
-            for j in range(len(centroids)):
-                if clusters[j]:
-                    cluster_coords = [self.department_coords[d] for d in clusters[j]]
-                    centroids[j] = np.mean(cluster_coords, axis=0)
+            # Update centroids; empty clusters keep their previous centroid
+            counts = np.bincount(labels, minlength=len(centroids))
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, coordinates)
+            non_empty = counts > 0
+            centroids[non_empty] = sums[non_empty] / counts[non_empty, None]
 
-        return clusters
+        return self._labels_to_clusters(labels, len(centroids))
 
     def _hierarchical_clustering(self):
         """
-        Perform hierarchical clustering on hospital departments.
+        Perform hierarchical (average linkage) clustering on hospital departments.
 
         Returns:
             list: List of clusters, where each cluster is a list of department names
         """
-        departments = list(self.all_departments)
+        departments = self.all_departments
         if not departments:
             return [[] for _ in range(self.num_clusters)]
+        if len(departments) == 1:
+            return [list(departments)]
 
-        # Start with each department in its own cluster
-        clusters = [[dept] for dept in departments]
-
-        # Merge until we have the desired number of clusters
-        while len(clusters) > self.num_clusters:
-            # Find the two closest clusters
-            min_dist = float('inf')
-            closest_pair = (0, 1)
+        # Average linkage merges the pair of clusters with the smallest mean distance
+        condensed = squareform(self.distance_matrix, checks=False)
+        tree = linkage(condensed, method="average")
+        labels = fcluster(tree, t=self.num_clusters, criterion="maxclust") - 1
 
-            for i in range(len(clusters)):
-                for j in range(i + 1, len(clusters)):
-                    dist = self._calculate_cluster_distance(clusters[i], clusters[j])
-                    if dist < min_dist:
-                        min_dist = dist
-                        closest_pair = (i, j)
-
-            # Merge the closest clusters
-            i, j = closest_pair
-            clusters[i].extend(clusters[j])
-            clusters.pop(j)
+        return self._labels_to_clusters(labels, labels.max() + 1)
 
+    def _labels_to_clusters(self, labels, num_clusters):
+        """Convert an array of cluster labels per department into lists of department names."""
+        clusters = [[] for _ in range(num_clusters)]
+        for dept, label in zip(self.all_departments, labels):
+            clusters[label].append(dept)
         return clusters
 
     def _calculate_cluster_distance(self, cluster1, cluster2):
         """Calculate the average distance between all points in two clusters."""
-        total_dist = 0
-        count = 0
-
-        for dept1 in cluster1:
-            for dept2 in cluster2:
-                total_dist += self._calculate_distance(dept1, dept2)
-                count += 1
-
-        return total_dist / max(1, count)
+        rows = [self.department_index[d] for d in cluster1]
+        cols = [self.department_index[d] for d in cluster2]
+        if not rows or not cols:
+            return 0
+        return float(self.distance_matrix[np.ix_(rows, cols)].mean())
 
     def _assign_requests_to_clusters(self):
         """Assign requests to appropriate clusters."""
@@ -528,14 +516,17 @@ class ClusterBasedILP:
         Returns:
             dict: Combined assignment plan
         """
+        solvable = [i for i in range(len(self.clusters))
+                    if self.cluster_requests[i] and self.transporter_clusters[i]]
+
+        if self.parallel and len(solvable) > 1:
+            return self._solve_clusters_in_parallel(solvable)
+
         self.logger.info(f"Solving {len(self.clusters)} clusters independently")
 
         master_plan = {t.name: [] for t in self.transporters}
 
-        for i in range(len(self.clusters)):
-            if not self.cluster_requests[i] or not self.transporter_clusters[i]:
-                continue
-
+        for i in solvable:
             self.logger.debug(f"Solving cluster {i + 1} with {len(self.cluster_requests[i])} requests "
                               f"and {len(self.transporter_clusters[i])} transporters")
 
@@ -550,7 +541,12 @@ class ClusterBasedILP:
                 )
 
                 # Solve with time limit
-                cluster_plan = self._solve_with_timeout(ilp, self.time_limit / len(self.clusters))
+                cluster_time_limit = self.time_limit / len(self.clusters) if self.time_limit else None
+                cluster_plan = self._solve_with_timeout(ilp, cluster_time_limit)
+                if not ProblemSnapshot.assigns_each_once(ProblemSnapshot.plan_to_ids(cluster_plan),
+                                                         self.cluster_requests[i]):
+                    self.logger.warning(f"Cluster {i + 1} ILP plan is incomplete, assigning it greedily")
+                    cluster_plan = self._greedy_cluster_plan(i)
 
                 cluster_time = time.time() - cluster_start
                 self.logger.debug(f"Cluster {i + 1} solved in {cluster_time:.2f} seconds")
@@ -565,21 +561,78 @@ class ClusterBasedILP:
 
         return master_plan
 
+    def _solve_clusters_in_parallel(self, solvable):
+        """
+        Solve the clusters concurrently, one worker process per cluster.
+
+        Clusters are handed out in waves of max_workers, so each cluster gets
+        time_limit divided by the number of waves rather than by the number of
+        clusters. Plans are merged as soon as their worker finishes; clusters
+        that miss the deadline, fail or return a plan that does not cover all of
+        their requests get a greedy plan instead.
+
+        Args:
+            solvable: Indices of clusters with both requests and transporters
+
+        Returns:
+            dict: Combined assignment plan
+        """
+        workers = min(self.max_workers, len(solvable))
+        waves = math.ceil(len(solvable) / workers)
+        cluster_time_limit = max(1, int(self.time_limit / waves)) if self.time_limit else None
+
+        limit = f"{cluster_time_limit}s" if cluster_time_limit else "no time limit"
+        self.logger.info(f"Solving {len(solvable)} clusters in parallel on {workers} processes "
+                         f"({limit} per cluster)")
+
+        master_plan = {t.name: [] for t in self.transporters}
+        merged = set()
+
+        def merge(i, id_plan):
+            if not ProblemSnapshot.assigns_each_once(id_plan, self.cluster_requests[i]):
+                self.logger.warning(f"Cluster {i + 1} ILP plan is incomplete")
+                return
+            cluster_plan = ProblemSnapshot.plan_from_ids(id_plan, self.cluster_requests[i])
+            for t_name, t_requests in cluster_plan.items():
+                master_plan[t_name].extend(t_requests)
+            merged.add(i)
+            self.logger.debug(f"Cluster {i + 1} merged")
+
+        tasks = {
+            i: (_solve_cluster, (ProblemSnapshot(self.transporter_clusters[i], self.cluster_requests[i], self.graph),
+                                 cluster_time_limit))
+            for i in solvable
+        }
+        # Grace period on top of the solver limits for process startup and model building
+        deadline = self.time_limit + waves if self.time_limit else None
+        run_in_processes(tasks, deadline, workers, on_result=merge)
+
+        for i in solvable:
+            if i not in merged:
+                self.logger.warning(f"Cluster {i + 1} has no complete ILP solution, assigning it greedily")
+                merge(i, ProblemSnapshot.plan_to_ids(self._greedy_cluster_plan(i)))
+
+        return master_plan
+
+    def _greedy_cluster_plan(self, i):
+        """Urgency-first plan for cluster i, used when its ILP gives no complete plan."""
+        return ILPUrgencyFirst(self.transporter_clusters[i], self.cluster_requests[i], self.graph).build_and_solve()
+
     def _solve_with_timeout(self, ilp, timeout):
         """Solve an ILP with a timeout."""
         # Store original time limit if exists
-        original_timeout = getattr(ilp, 'timeout', None)
+        original_timeout = getattr(ilp, 'time_limit', None)
 
         try:
             # Set timeout if the ILP solver supports it
-            if hasattr(ilp, 'timeout'):
-                ilp.timeout = timeout
+            if hasattr(ilp, 'time_limit'):
+                ilp.time_limit = timeout
 
             return ilp.build_and_solve()
         finally:
             # Restore original timeout
-            if original_timeout is not None and hasattr(ilp, 'timeout'):
-                ilp.timeout = original_timeout
+            if original_timeout is not None and hasattr(ilp, 'time_limit'):
+                ilp.time_limit = original_timeout
 
     def _post_process_solution(self, plan):
         """
@@ -591,107 +644,30 @@ class ClusterBasedILP:
         Returns:
             dict: Improved assignment plan
         """
+        route_plan = RoutePlan(self.transporters, plan, self.graph)
+
         # Sort each transporter's requests for efficient routes
-        for t in self.transporters:
-            if t.name in plan and plan[t.name]:
-                plan[t.name] = self._sort_requests_by_greedy_chain(t, plan[t.name])
+        route_plan.order_greedy_chain()
 
         # Check for workload balance
-        self._balance_workload(plan)
+        self._balance_workload(route_plan)
 
-        return plan
+        return route_plan.to_plan()
 
-    def _balance_workload(self, plan):
+    def _balance_workload(self, route_plan):
         """
-        Try to balance workload by moving requests between transporters.
+        Balance workload by relocating and swapping requests between transporters
+        until no move shortens the longest route.
 
         Args:
-            plan: Assignment plan to balance
+            route_plan: RoutePlan to balance in place
         """
-        # Calculate current workload
-        workloads = {}
-        for t in self.transporters:
-            requests = plan.get(t.name, [])
-            workloads[t.name] = self._calculate_transporter_workload(t, requests)
-
-        # Find max and min workload transporters
-        if not workloads:
-            return
-
-        min_workload = min(workloads.values())
-        max_workload = max(workloads.values())
-        min_transporter = next(t.name for t in self.transporters if workloads.get(t.name) == min_workload)
-        max_transporter = next(t.name for t in self.transporters if workloads.get(t.name) == max_workload)
-
-        # If already balanced, do nothing
-        imbalance = max_workload - min_workload
-        if imbalance < 0.2 * max_workload:  # Less than 20% imbalance is acceptable
-            return
-
-        self.logger.debug(f"Workload imbalance detected: {min_workload:.2f} vs {max_workload:.2f}")
-
-        # Try to move some requests from max to min
-        max_requests = plan.get(max_transporter, [])
-
-        # Sort requests by time (shortest first)
-        max_requests_times = [(r, self._calculate_request_time(self._get_transporter_by_name(max_transporter), r))
-                              for r in max_requests]
-        sorted_requests = [r for r, _ in sorted(max_requests_times, key=lambda x: x[1])]
-
-        # Try moving requests one by one
-        for request in sorted_requests:
-            # Check if moving this request would improve balance
-            req_time = self._calculate_request_time(self._get_transporter_by_name(max_transporter), request)
-
-            new_max = max_workload - req_time
-            new_min = min_workload + self._calculate_request_time(
-                self._get_transporter_by_name(min_transporter), request)
-
-            # If it improves balance, move it
-            if new_max >= new_min:  # Only move if it doesn't create a worse imbalance
-                # Remove from max
-                plan[max_transporter].remove(request)
-
-                # Add to min
-                if min_transporter not in plan:
-                    plan[min_transporter] = []
-                plan[min_transporter].append(request)
-
-                # Update workloads
-                workloads[max_transporter] = new_max
-                workloads[min_transporter] = new_min
-                max_workload = new_max
-                min_workload = new_min
-
-                # If balance is now acceptable, stop
-                if max_workload - min_workload < 0.2 * max_workload:
-                    break
-
-    def _calculate_transporter_workload(self, transporter, requests):
-        """Calculate total workload for a transporter with given requests."""
-        if not requests:
-            return 0
-
-        total_time = 0
-        current_location = transporter.current_location
+        before = route_plan.loads()
+        moves = route_plan.improve()
 
-        for request in requests:
-            # Time to origin
-            origin_time = self._calculate_path_time(current_location, request.origin)
-
-            # Time to destination
-            dest_time = self._calculate_path_time(request.origin, request.destination)
-
-            total_time += origin_time + dest_time
-            current_location = request.destination
-
-        return total_time
-
-    def _calculate_request_time(self, transporter, request):
-        """Calculate time to handle a specific request by a specific transporter."""
-        origin_time = self._calculate_path_time(transporter.current_location, request.origin)
-        dest_time = self._calculate_path_time(request.origin, request.destination)
-        return origin_time + dest_time
+        if moves:
+            self.logger.debug(f"Workload balancing applied {moves} moves, "
+                              f"longest route {before.max():.2f} -> {route_plan.loads().max():.2f}")
 
     def _calculate_path_time(self, start, end):
         """Calculate travel time between two points."""
@@ -712,33 +688,13 @@ class ClusterBasedILP:
             except:
                 return 10  # Default time if all else fails
 
-    def _get_transporter_by_name(self, name):
-        """Get a transporter object by name."""
-        for t in self.transporters:
-            if t.name == name:
-                return t
-        return None
-
     def _sort_requests_by_greedy_chain(self, transporter, requests):
         """Sort requests by a greedy chain to minimize travel time."""
         if not requests:
             return []
 
-        remaining = deepcopy(requests)
-        ordered = []
-        current_location = transporter.current_location
-
-        while remaining:
-            # Find request whose origin is closest to current location
-            next_request = min(
-                remaining,
-                key=lambda r: self._calculate_path_time(current_location, r.origin)
-            )
-            ordered.append(next_request)
-            current_location = next_request.destination
-            remaining.remove(next_request)
-
-        return ordered
+        return RoutePlan([transporter], {transporter.name: requests}, self.graph) \
+            .order_greedy_chain().to_plan()[transporter.name]
 
     def _get_full_path(self, request):
         """Get full path for a request (origin to destination)."""
@@ -1,55 +1,210 @@
 from abc import ABC, abstractmethod
+import heapq
+import logging
 import pulp
+from Model.Assignment_strategies.distance_matrix import DistanceMatrix
+from Model.Assignment_strategies.ILP.request_classes import group_requests
+from Model.Assignment_strategies.route_plan import RoutePlan
 
 
 class ILPCore(ABC):
-    def __init__(self, transporters, requests, graph):
+    def __init__(self, transporters, requests, graph, aggregate_requests=True, symmetry_breaking=True,
+                 time_limit=None, closed_form=True, threads=None):
         self.transporters = transporters
         self.requests = requests
         self.graph = graph
         self.model = pulp.LpProblem("Transport_Assignment", pulp.LpMinimize)
         self.assign_vars = {}
 
+        # Presolve: identical (origin, destination, urgent) requests share one
+        # integer variable per transporter instead of one binary each
+        self.request_classes = group_requests(requests, aggregate=aggregate_requests)
+        self.symmetry_breaking = symmetry_breaking
+        self.time_limit = time_limit
+        self.closed_form = closed_form
+        self.threads = threads
+
     def build_and_solve(self):
+        # Objectives with a known optimal assignment skip the solver entirely
+        if self.closed_form:
+            plan = self.solve_closed_form()
+            if plan is not None:
+                return self.order_routes(plan)
+
         self.define_variables()
         self.add_constraints()
+        if self.symmetry_breaking:
+            self.add_symmetry_breaking_constraints()
         self.define_objective()
 
-        self.model.solve(pulp.PULP_CBC_CMD(msg=False))
+        self.model.solve(self._solver())
+        if not self.has_solution():
+            # E.g. CBC hit its time limit before finding an incumbent; the variables
+            # then hold no assignment and extracting them would drop requests
+            logging.getLogger('ILPCore').warning(
+                f"{self.__class__.__name__}: solver stopped without a feasible solution "
+                f"({pulp.LpStatus[self.model.status]}), using the least-travel plan")
+            return self.order_routes(self.solve_closed_form() or self.assign_by_travel(self.requests))
         return self.extract_assignments()
 
-    def define_variables(self):
+    def has_solution(self):
+        """True if the last solve left a feasible integer assignment in the variables."""
+        return self.model.sol_status in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible)
+
+    def _solver(self):
+        return pulp.PULP_CBC_CMD(msg=False, timeLimit=self.time_limit, threads=self.threads)
+
+    def define_variables(self, relaxed=False):
         for t in self.transporters:
-            for r in self.requests:
-                var_name = f"x_{t.name}_{r.id}"
-                self.assign_vars[(t.name, r.id)] = pulp.LpVariable(var_name, cat="Binary")
+            for c in self.request_classes:
+                var_name = f"x_{t.name}_{c.id}"
+                if relaxed:
+                    var = pulp.LpVariable(var_name, lowBound=0, upBound=c.multiplicity, cat="Continuous")
+                elif c.multiplicity == 1:
+                    var = pulp.LpVariable(var_name, cat="Binary")
+                else:
+                    var = pulp.LpVariable(var_name, lowBound=0, upBound=c.multiplicity, cat="Integer")
+                self.assign_vars[(t.name, c.id)] = var
 
     def add_constraints(self):
-        # Each request must be assigned to exactly one transporter
-        for r in self.requests:
+        # Every request in a class must be assigned to exactly one transporter
+        for c in self.request_classes:
             self.model += (
-                pulp.lpSum(self.assign_vars[(t.name, r.id)] for t in self.transporters) == 1,
-                f"UniqueAssignment_{r.id}"
+                pulp.lpSum(self.assign_vars[(t.name, c.id)] for t in self.transporters) == c.multiplicity,
+                f"UniqueAssignment_{c.id}"
             )
 
+    def add_symmetry_breaking_constraints(self):
+        """
+        Break the symmetry between interchangeable transporters.
+
+        Transporters of a group share their travel times and every objective
+        treats them alike, so permuting their routes gives another solution of
+        the same value. The group is ordered lexicographically by the first
+        request class each transporter serves: the (k+1)-th transporter may only
+        take copies of a class if the k-th one serves that class or an earlier
+        one, which also puts idle transporters last. Only relabellings of
+        transporters that start at the same class stay feasible. No optimum is
+        cut off, since any solution can be relabelled by sorting the group by
+        first class.
+
+        Numbering the individual requests 0..R-1 in class order, the k-th
+        transporter of that order serves no request numbered below k, so its
+        variables for classes lying entirely before position k are fixed to 0.
+        """
+        for group in self.find_interchangeable_transporters():
+            first_index = 0
+            for c in self.request_classes:
+                last_index = first_index + c.multiplicity - 1
+                for position, t in enumerate(group):
+                    if position > last_index:
+                        self.model += (
+                            self.assign_vars[(t.name, c.id)] == 0,
+                            f"SymmetryBreak_{t.name}_{c.id}"
+                        )
+                first_index += c.multiplicity
+
+            for previous, t in zip(group, group[1:]):
+                served_so_far = []
+                for c in self.request_classes:
+                    served_so_far.append(self.assign_vars[(previous.name, c.id)])
+                    self.model += (
+                        self.assign_vars[(t.name, c.id)] <= c.multiplicity * pulp.lpSum(served_so_far),
+                        f"SymmetryOrder_{t.name}_{c.id}"
+                    )
+
+    def find_interchangeable_transporters(self):
+        """
+        Group transporters that are indistinguishable to the model.
+
+        Returns:
+            list: Groups (lists) of two or more transporters with the same location,
+                  status and shift state
+        """
+        groups = {}
+        for t in self.transporters:
+            groups.setdefault(self._transporter_signature(t), []).append(t)
+        return [group for group in groups.values() if len(group) > 1]
+
+    @staticmethod
+    def _transporter_signature(transporter):
+        shift_manager = getattr(transporter, "shift_manager", None)
+        return (
+            transporter.current_location,
+            getattr(transporter, "status", None),
+            getattr(shift_manager, "resting", None),
+            getattr(shift_manager, "accumulated_work_time", None),
+        )
+
     @abstractmethod
     def define_objective(self):
         """Implemented by subclasses: defines the optimization objective."""
         pass
 
+    def solve_closed_form(self):
+        """
+        Overridden by subclasses whose objective can be optimized without the solver.
+
+        Returns:
+            dict: Unordered assignment plan, or None to fall back to the MIP
+        """
+        return None
+
+    def assign_to_least_loaded(self, requests, load_of):
+        """
+        Give each request, in order, to the transporter with the smallest load so far.
+
+        Args:
+            requests: Requests in the order they should be handed out
+            load_of: Function (transporter, request) -> load added by the request
+
+        Returns:
+            dict: Unordered assignment plan, built with O(R log T) heap operations
+                  and one load_of call per request
+        """
+        plan = {t.name: [] for t in self.transporters}
+        heap = [(0, index) for index in range(len(self.transporters))]
+
+        for r in requests:
+            load, index = heapq.heappop(heap)
+            transporter = self.transporters[index]
+            plan[transporter.name].append(r)
+            heapq.heappush(heap, (load + load_of(transporter, r), index))
+
+        return plan
+
+    def assign_by_travel(self, requests):
+        """
+        Give each request, in order, to the transporter with the least travel so far.
+
+        Travel is priced with cached all-pairs distances, so this stays O(R log T).
+
+        Returns:
+            dict: Unordered assignment plan
+        """
+        if not self.transporters:
+            return {}
+        distances = DistanceMatrix.for_graph(self.graph)
+        return self.assign_to_least_loaded(
+            requests,
+            lambda t, r: distances.distance(t.current_location, r.origin) + distances.distance(r.origin, r.destination))
+
     def extract_assignments(self):
         plan = {t.name: [] for t in self.transporters}
 
-        for (t_name, r_id), var in self.assign_vars.items():
-            if var.varValue == 1:
-                req = next(r for r in self.requests if r.id == r_id)
-                plan[t_name].append(req)
+        # Expand class multiplicities back into individual requests
+        for c in self.request_classes:
+            unassigned = list(c.requests)
+            for t in self.transporters:
+                count = int(round(self.assign_vars[(t.name, c.id)].varValue or 0))
+                plan[t.name].extend(unassigned[:count])
+                unassigned = unassigned[count:]
 
-        # Sort assignments per transporter by travel time from current location
-        for t in self.transporters:
-            plan[t.name] = self.sort_requests_by_greedy_chain(t, plan[t.name])
+        return self.order_routes(plan)
 
-        return plan
+    def order_routes(self, plan):
+        # Sort assignments per transporter by travel time from current location
+        return RoutePlan(self.transporters, plan, self.graph).order_greedy_chain().to_plan()
 
     def estimate_travel_time(self, transporter, request):
         path_to_origin, _ = transporter.pathfinder.dijkstra(transporter.current_location, request.origin)
@@ -67,22 +222,8 @@ class ILPCore(ABC):
         return to_origin_time + to_dest_time
 
     def sort_requests_by_greedy_chain(self, transporter, requests):
-        from copy import deepcopy
-        remaining = deepcopy(requests)
-        ordered = []
-        current_location = transporter.current_location
-
-        while remaining:
-            # Find the request whose origin is closest to current_location
-            next_request = min(
-                remaining,
-                key=lambda r: self.estimate_point_to_point_time(current_location, r.origin)
-            )
-            ordered.append(next_request)
-            current_location = next_request.destination
-            remaining.remove(next_request)
-
-        return ordered
+        route_plan = RoutePlan([transporter], {transporter.name: requests}, self.graph)
+        return route_plan.order_greedy_chain().to_plan()[transporter.name]
 
     def estimate_point_to_point_time(self, start, end):
         path, _ = self.transporters[0].pathfinder.dijkstra(start, end)
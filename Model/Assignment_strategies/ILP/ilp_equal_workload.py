@@ -8,8 +8,15 @@ class ILPEqualWorkload(ILPCore):
 
         for t in self.transporters:
             total = lpSum(
-                self.assign_vars[(t.name, r.id)] for r in self.requests
+                self.assign_vars[(t.name, c.id)] for c in self.request_classes
             )
             self.model += (total <= self.max_requests, f"MaxRequests_{t.name}")
 
         self.model += self.max_requests
+
+    def solve_closed_form(self):
+        # Round-robin gives every transporter floor(R/T) or ceil(R/T) requests,
+        # which is exactly the optimal max_requests
+        if not self.transporters:
+            return None
+        return self.assign_to_least_loaded(self.requests, lambda t, r: 1)
@@ -1,17 +1,187 @@
-from pulp import lpSum, LpVariable
+import logging
+
+import numpy as np
+from pulp import lpSum, LpVariable, LpProblem, LpMinimize, LpStatusOptimal, value
+from scipy.optimize import linear_sum_assignment
 from Model.Assignment_strategies.ILP.ilp_core import ILPCore
 
 
 class ILPMakespan(ILPCore):
+    def __init__(self, transporters, requests, graph, lp_relaxation=None, relaxation_threshold=1500, **kwargs):
+        """
+        Args:
+            lp_relaxation: True to always use LP relaxation and rounding, False to
+                           always solve the exact MIP, None to decide by instance size
+            relaxation_threshold: Number of assignment variables (request classes x
+                                  transporters) above which the relaxation is used
+            **kwargs: Passed on to ILPCore
+        """
+        super().__init__(transporters, requests, graph, **kwargs)
+        self.lp_relaxation = lp_relaxation
+        self.relaxation_threshold = relaxation_threshold
+        self.logger = logging.getLogger('ILPMakespan')
+
+        # Quality report for the LP relaxation mode
+        self.lp_lower_bound = None
+        self.rounded_makespan = None
+        self.optimality_gap = None
+
+        self._travel_times = {}
+
     def define_objective(self):
         self.makespan = LpVariable("makespan", lowBound=0)
 
         for t in self.transporters:
             total_time = lpSum(
-                self.assign_vars[(t.name, r.id)] * self.estimate_travel_time(t, r)
-                for r in self.requests
+                self.assign_vars[(t.name, c.id)] * self.class_travel_time(t, c)
+                for c in self.request_classes
             )
             self.model += (total_time <= self.makespan, f"MakespanLimit_{t.name}")
 
         self.model += self.makespan
 
+    def class_travel_time(self, transporter, request_class):
+        """Travel time for a request class, cached per (location, origin, destination)."""
+        key = (transporter.current_location, request_class.origin, request_class.destination)
+        if key not in self._travel_times:
+            self._travel_times[key] = self.estimate_travel_time(transporter, request_class)
+        return self._travel_times[key]
+
+    def build_and_solve(self):
+        if self.use_lp_relaxation():
+            return self.solve_lp_relaxation()
+        return super().build_and_solve()
+
+    def use_lp_relaxation(self):
+        if self.lp_relaxation is not None:
+            return self.lp_relaxation
+        return len(self.request_classes) * len(self.transporters) > self.relaxation_threshold
+
+    def solve_lp_relaxation(self):
+        """
+        Solve the LP relaxation, round it and repair the result with local moves.
+
+        The rounding follows Lenstra, Shmoys and Tardos: whole units of the LP
+        solution are kept, and the leftover fractional requests are matched to
+        transporters along their fractional edges. In a basic LP solution these
+        edges form a pseudoforest, so every transporter gets at most one extra
+        request and the rounded makespan is at most the LP bound plus the longest
+        single travel time.
+
+        Returns:
+            dict: Assignment plan mapping transporter names to lists of requests
+        """
+        self.define_variables(relaxed=True)
+        self.add_constraints()
+        self.define_objective()
+        self.model.solve(self._solver())
+
+        if self.model.status != LpStatusOptimal:
+            self.logger.warning("LP relaxation failed, falling back to the exact MIP")
+            self.lp_relaxation = False
+            self.model = LpProblem("Transport_Assignment", LpMinimize)
+            self.assign_vars = {}
+            return super().build_and_solve()
+
+        self.lp_lower_bound = value(self.model.objective)
+
+        # costs[t, c] and fractional LP values y[t, c]
+        costs = np.array([[self.class_travel_time(t, c) for c in self.request_classes]
+                          for t in self.transporters], dtype=float)
+        y = np.array([[self.assign_vars[(t.name, c.id)].varValue or 0 for c in self.request_classes]
+                      for t in self.transporters], dtype=float)
+
+        counts = self._round_lp_solution(y, costs)
+        counts = self._repair_with_local_moves(counts, costs)
+
+        self.rounded_makespan = float((counts * costs).sum(axis=1).max()) if len(self.transporters) else 0.0
+        if self.rounded_makespan > 0:
+            self.optimality_gap = (self.rounded_makespan - self.lp_lower_bound) / self.rounded_makespan
+        else:
+            self.optimality_gap = 0.0
+
+        self.logger.info(f"LP relaxation: lower bound {self.lp_lower_bound:.1f}, "
+                         f"rounded makespan {self.rounded_makespan:.1f}, gap {self.optimality_gap:.1%}")
+
+        return self._expand_counts(counts)
+
+    def _round_lp_solution(self, y, costs):
+        """Keep the integral part of y and match the leftover requests along fractional edges."""
+        eps = 1e-6
+        counts = np.floor(y + eps).astype(int)
+        fractional = (y - counts) > eps
+
+        leftover = np.array([c.multiplicity for c in self.request_classes]) - counts.sum(axis=0)
+        jobs = np.repeat(np.arange(len(self.request_classes)), np.maximum(leftover, 0))
+
+        # Non-fractional edges are allowed but heavily penalized, so the matching
+        # only uses them if the LP solution was not a vertex
+        penalty = costs.max() * (len(jobs) + 1) + 1 if costs.size else 1
+
+        while len(jobs):
+            match_costs = costs[:, jobs].T + np.where(fractional[:, jobs].T, 0, penalty)
+            rows, cols = linear_sum_assignment(match_costs)
+            for row, col in zip(rows, cols):
+                counts[col, jobs[row]] += 1
+            jobs = np.delete(jobs, rows)
+
+        return counts
+
+    def _repair_with_local_moves(self, counts, costs):
+        """
+        Relocate and swap requests away from the makespan transporter while that
+        lowers the larger of the two affected loads.
+        """
+        loads = (counts * costs).sum(axis=1)
+
+        while len(loads) > 1:
+            worst = int(np.argmax(loads))
+            if not any(self._relocate(counts, costs, loads, worst, c) or self._swap(counts, costs, loads, worst, c)
+                       for c in np.flatnonzero(counts[worst])):
+                break
+
+        return counts
+
+    @staticmethod
+    def _relocate(counts, costs, loads, worst, c):
+        """Move one request of class c to the transporter where it ends up lowest."""
+        new_loads = loads + costs[:, c]
+        new_loads[worst] = np.inf
+        target = int(np.argmin(new_loads))
+        if new_loads[target] >= loads[worst]:
+            return False
+
+        counts[worst, c] -= 1
+        counts[target, c] += 1
+        loads[worst] -= costs[worst, c]
+        loads[target] = new_loads[target]
+        return True
+
+    @staticmethod
+    def _swap(counts, costs, loads, worst, c):
+        """Exchange one request of class c for a request class of another transporter."""
+        for target in range(len(loads)):
+            if target == worst:
+                continue
+            for other in np.flatnonzero(counts[target]):
+                worst_load = loads[worst] - costs[worst, c] + costs[worst, other]
+                target_load = loads[target] - costs[target, other] + costs[target, c]
+                if max(worst_load, target_load) < loads[worst]:
+                    counts[worst, c] -= 1
+                    counts[worst, other] += 1
+                    counts[target, other] -= 1
+                    counts[target, c] += 1
+                    loads[worst], loads[target] = worst_load, target_load
+                    return True
+        return False
+
+    def _expand_counts(self, counts):
+        plan = {t.name: [] for t in self.transporters}
+
+        for j, c in enumerate(self.request_classes):
+            unassigned = list(c.requests)
+            for i, t in enumerate(self.transporters):
+                plan[t.name].extend(unassigned[:counts[i, j]])
+                unassigned = unassigned[counts[i, j]:]
+
+        return self.order_routes(plan)
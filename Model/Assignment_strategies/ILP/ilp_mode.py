@@ -5,4 +5,5 @@ class ILPMode(Enum):
     MAKESPAN = "makespan"
     EQUAL_WORKLOAD = "equal_workload"
     URGENCY_FIRST = "urgency_first"
-    CLUSTER_BASED = "cluster_based"  # New mode for cluster-based approach
\ No newline at end of file
+    CLUSTER_BASED = "cluster_based"  # New mode for cluster-based approach
+    PORTFOLIO = "portfolio"  # Races several modes in parallel processes
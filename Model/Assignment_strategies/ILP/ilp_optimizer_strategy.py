@@ -6,9 +6,13 @@ from Model.Assignment_strategies.ILP.ilp_makespan import ILPMakespan
 from Model.Assignment_strategies.ILP.ilp_equal_workload import ILPEqualWorkload
 from Model.Assignment_strategies.ILP.ilp_urgency_first import ILPUrgencyFirst
 from Model.Assignment_strategies.ILP.cluster_based_ilp import ClusterBasedILP
+from Model.Assignment_strategies.ILP.ilp_portfolio import ILPPortfolio
 
 
 class ILPOptimizerStrategy(AssignmentStrategy):
+    # Keyword arguments forwarded to the ILPCore based optimizers
+    CORE_OPTIONS = ("aggregate_requests", "symmetry_breaking", "time_limit", "closed_form", "threads")
+
     def __init__(self, mode=ILPMode.MAKESPAN, **kwargs):
         """
         Initialize with an ILP mode.
@@ -16,6 +20,7 @@ class ILPOptimizerStrategy(AssignmentStrategy):
         Args:
             mode: The ILP mode to use (from ILPMode enum)
             **kwargs: Additional parameters for specific modes (e.g., num_clusters)
+                      or for the solver core (e.g., aggregate_requests)
         """
         self.mode = mode
         self.kwargs = kwargs
@@ -37,19 +42,36 @@ class ILPOptimizerStrategy(AssignmentStrategy):
         Returns:
             ILP optimizer instance
         """
+        core_kwargs = self._core_kwargs()
+
         if self.mode == ILPMode.MAKESPAN:
-            return ILPMakespan(transporters, assignable_requests, graph)
+            makespan_kwargs = {key: self.kwargs[key] for key in ("lp_relaxation", "relaxation_threshold")
+                               if key in self.kwargs}
+            return ILPMakespan(transporters, assignable_requests, graph, **core_kwargs, **makespan_kwargs)
         elif self.mode == ILPMode.EQUAL_WORKLOAD:
-            return ILPEqualWorkload(transporters, assignable_requests, graph)
+            return ILPEqualWorkload(transporters, assignable_requests, graph, **core_kwargs)
         elif self.mode == ILPMode.URGENCY_FIRST:
-            return ILPUrgencyFirst(transporters, assignable_requests, graph)
+            return ILPUrgencyFirst(transporters, assignable_requests, graph, **core_kwargs)
         elif self.mode == ILPMode.CLUSTER_BASED:
             # Get parameters specific to cluster-based approach
             num_clusters = self.kwargs.get('num_clusters', 5)
-            return ClusterBasedILP(transporters, assignable_requests, graph, num_clusters=num_clusters)
+            cluster_kwargs = {key: self.kwargs[key] for key in ("time_limit", "parallel", "max_workers",
+                                                                "clustering_method")
+                              if key in self.kwargs}
+            return ClusterBasedILP(transporters, assignable_requests, graph, num_clusters=num_clusters,
+                                   **cluster_kwargs)
+        elif self.mode == ILPMode.PORTFOLIO:
+            portfolio_kwargs = {key: self.kwargs[key]
+                                for key in ("members", "deadline", "metric", "max_workers", "threads")
+                                if key in self.kwargs}
+            return ILPPortfolio(transporters, assignable_requests, graph, **portfolio_kwargs)
         else:
             raise ValueError(f"Unsupported ILP Mode: {self.mode}")
 
+    def _core_kwargs(self):
+        """Pick out the keyword arguments understood by ILPCore."""
+        return {key: self.kwargs[key] for key in self.CORE_OPTIONS if key in self.kwargs}
+
     def estimate_travel_time(self, transporter, request):
         if not self.optimizer:
             raise RuntimeError("ILPOptimizerStrategy: optimizer not initialized.")
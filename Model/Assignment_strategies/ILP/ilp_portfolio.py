@@ -0,0 +1,116 @@
+import logging
+import time
+
+from Model.Assignment_strategies.ILP.ilp_mode import ILPMode
+from Model.Assignment_strategies.ILP.ilp_urgency_first import ILPUrgencyFirst
+from Model.Assignment_strategies.parallel_runner import run_in_processes
+from Model.Assignment_strategies.plan_evaluator import PlanEvaluator
+from Model.Assignment_strategies.problem_snapshot import ProblemSnapshot
+
+
+def _solve_member(snapshot, mode_value, kwargs):
+    """Worker entry point: rebuild the problem and solve it with one ILP configuration."""
+    # Imported here to avoid a circular import with ILPOptimizerStrategy
+    from Model.Assignment_strategies.ILP.ilp_optimizer_strategy import ILPOptimizerStrategy
+
+    transporters, requests, graph = snapshot.restore()
+    strategy = ILPOptimizerStrategy(ILPMode(mode_value), **kwargs)
+    plan = strategy.generate_assignment_plan(transporters, requests, graph)
+    return ProblemSnapshot.plan_to_ids(plan)
+
+
+class ILPPortfolio:
+    """
+    Runs several ILP modes or parameterizations concurrently and keeps the best plan.
+
+    Each member is solved in its own process on a snapshot of the problem. When
+    the deadline expires, unfinished members are terminated and the finished
+    plans that assign every request exactly once are compared with a common
+    PlanEvaluator metric.
+    """
+
+    # (label, mode, kwargs); time limits are filled in from the deadline
+    DEFAULT_MEMBERS = [
+        ("Makespan", ILPMode.MAKESPAN, {}),
+        ("Makespan (LP relaxation)", ILPMode.MAKESPAN, {"lp_relaxation": True}),
+        ("Equal Workload", ILPMode.EQUAL_WORKLOAD, {}),
+        ("Urgency First", ILPMode.URGENCY_FIRST, {}),
+        ("Cluster-Based", ILPMode.CLUSTER_BASED, {"num_clusters": 7}),
+    ]
+
+    def __init__(self, transporters, requests, graph, members=None, deadline=30, metric="makespan",
+                 max_workers=None, threads=1):
+        """
+        Args:
+            transporters: List of transporter objects
+            requests: List of transport request objects
+            graph: Hospital graph
+            members: List of (label, ILPMode, kwargs) tuples (default: DEFAULT_MEMBERS)
+            deadline: Wall-clock budget in seconds for the whole portfolio
+            metric: PlanEvaluator key to minimize ("makespan" or "total_time")
+            max_workers: Maximum number of concurrent processes (default: CPU count)
+            threads: CBC threads per member
+        """
+        self.transporters = transporters
+        self.requests = requests
+        self.graph = graph
+        self.members = members if members is not None else self.DEFAULT_MEMBERS
+        self.deadline = deadline
+        self.metric = metric
+        self.max_workers = max_workers
+        self.threads = threads
+        self.logger = logging.getLogger('ILPPortfolio')
+
+        self.evaluator = PlanEvaluator(transporters, graph)
+        self.scores = {}
+        self.winner = None
+
+    def build_and_solve(self):
+        """
+        Race the portfolio members and return the best plan found before the deadline.
+
+        Returns:
+            dict: Assignment plan mapping transporter names to lists of requests
+        """
+        start_time = time.time()
+        snapshot = ProblemSnapshot(self.transporters, self.requests, self.graph)
+
+        tasks = {
+            label: (_solve_member, (snapshot, mode.value, self._member_kwargs(mode, kwargs)))
+            for label, mode, kwargs in self.members
+        }
+
+        best_plan = None
+        for label, id_plan in run_in_processes(tasks, self.deadline, self.max_workers).items():
+            # A plan missing requests would win on makespan without being comparable
+            if not ProblemSnapshot.assigns_each_once(id_plan, self.requests):
+                self.logger.warning(f"Portfolio member {label} returned an incomplete plan, ignoring it")
+                continue
+            plan = ProblemSnapshot.plan_from_ids(id_plan, self.requests)
+            score = self.evaluator.evaluate(plan)[self.metric]
+            self.scores[label] = score
+
+            if best_plan is None or score < self.scores[self.winner]:
+                best_plan, self.winner = plan, label
+
+        if best_plan is None:
+            self.logger.warning("No portfolio member finished before the deadline, using greedy urgency plan")
+            self.winner = "Urgency First (fallback)"
+            return ILPUrgencyFirst(self.transporters, self.requests, self.graph).build_and_solve()
+
+        self.logger.info(f"Portfolio winner: {self.winner} ({self.metric} {self.scores[self.winner]:.1f}) "
+                         f"out of {len(self.scores)}/{len(tasks)} finished members "
+                         f"in {time.time() - start_time:.2f}s")
+        return best_plan
+
+    def _member_kwargs(self, mode, kwargs):
+        member_kwargs = dict(kwargs)
+        # Leave a margin so members stop on their own before being terminated
+        member_kwargs.setdefault("time_limit", max(1, int(self.deadline * 0.8)))
+        if mode != ILPMode.CLUSTER_BASED:
+            member_kwargs.setdefault("threads", self.threads)
+        return member_kwargs
+
+    def estimate_travel_time(self, transporter, request):
+        return (self.evaluator.travel_time(transporter.current_location, request.origin) +
+                self.evaluator.travel_time(request.origin, request.destination))
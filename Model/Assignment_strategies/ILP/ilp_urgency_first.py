@@ -5,7 +5,17 @@ from Model.Assignment_strategies.ILP.ilp_core import ILPCore
 class ILPUrgencyFirst(ILPCore):
     def define_objective(self):
         self.model += lpSum(
-            self.assign_vars[(t.name, r.id)] * (10 if r.urgent else 1)
+            self.assign_vars[(t.name, c.id)] * (10 if c.urgent else 1)
             for t in self.transporters
-            for r in self.requests
+            for c in self.request_classes
         )
+
+    def solve_closed_form(self):
+        # Every request is assigned exactly once, so the objective always equals
+        # 10 * urgent + 1 * regular and any feasible plan is optimal. Hand out
+        # urgent requests first, each to the transporter with the least travel so far.
+        if not self.transporters:
+            return None
+        urgent = [r for r in self.requests if r.urgent]
+        regular = [r for r in self.requests if not r.urgent]
+        return self.assign_by_travel(urgent + regular)
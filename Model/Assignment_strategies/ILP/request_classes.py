@@ -0,0 +1,47 @@
+from collections import OrderedDict
+
+
+class RequestClass:
+    """
+    A group of interchangeable transport requests.
+
+    Requests sharing the same (origin, destination, urgent) triple have identical
+    coefficients in every ILP objective, so the model only needs one integer
+    variable per transporter telling how many of them that transporter takes.
+    """
+
+    def __init__(self, class_id, origin, destination, urgent):
+        self.id = class_id
+        self.origin = origin
+        self.destination = destination
+        self.urgent = urgent
+        self.requests = []
+
+    @property
+    def multiplicity(self):
+        return len(self.requests)
+
+    def __repr__(self):
+        return f"<RequestClass {self.id}: {self.origin} → {self.destination}, urgent={self.urgent}, x{self.multiplicity}>"
+
+
+def group_requests(requests, aggregate=True):
+    """
+    Group requests into RequestClass objects.
+
+    Args:
+        requests: List of transport requests
+        aggregate: If False, every request gets a class of its own
+
+    Returns:
+        list: RequestClass objects in order of first appearance
+    """
+    classes = OrderedDict()
+
+    for r in requests:
+        key = (r.origin, r.destination, bool(r.urgent)) if aggregate else r.id
+        if key not in classes:
+            classes[key] = RequestClass(f"c{len(classes)}", r.origin, r.destination, bool(r.urgent))
+        classes[key].requests.append(r)
+
+    return list(classes.values())
@@ -11,5 +11,12 @@ class AssignmentStrategy(ABC):
         """Return estimated time from transporter to complete a request"""
         pass
 
+    def generate_assignment_plans(self, transporters, requests, graph):
+        """Yield improving assignment plans, best last. Default: the single final plan"""
+        yield self.generate_assignment_plan(transporters, requests, graph)
+
     def get_optimizer(self, transporters, requests, graph):
         return None  # Default: no optimizer
+
+    def get_statistics(self):
+        return {}  # Default: no statistics
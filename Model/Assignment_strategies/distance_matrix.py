@@ -0,0 +1,90 @@
+import weakref
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import shortest_path
+
+
+def estimate_travel_time(transporter, request):
+    """
+    Travel time for a transporter to complete a request, from cached distances.
+
+    Args:
+        transporter: Transporter object
+        request: Transportation request object
+
+    Returns:
+        float: Time from the transporter's location to the origin plus the transport itself
+    """
+    distances = DistanceMatrix.for_graph(transporter.hospital.get_graph())
+    return (distances.distance(transporter.current_location, request.origin) +
+            distances.distance(request.origin, request.destination))
+
+
+class DistanceMatrix:
+    """
+    All-pairs shortest path distances of a hospital graph.
+
+    The matrix is computed in one batched scipy call instead of one Dijkstra
+    per department pair, and shared between optimizers through for_graph(),
+    which caches it per graph until the graph's version changes.
+    """
+
+    _cache = weakref.WeakKeyDictionary()
+
+    def __init__(self, graph):
+        self.nodes = list(graph.adjacency_list)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.version = getattr(graph, "version", 0)
+
+        n = len(self.nodes)
+        rows, cols, weights = [], [], []
+        for node, neighbors in graph.adjacency_list.items():
+            for neighbor, weight in neighbors.items():
+                rows.append(self.index[node])
+                cols.append(self.index[neighbor])
+                weights.append(weight)
+
+        adjacency = csr_matrix((weights, (rows, cols)), shape=(n, n))
+        self.matrix = shortest_path(adjacency, method="D", directed=graph.directed) if n else np.zeros((0, 0))
+
+    @classmethod
+    def for_graph(cls, graph):
+        """
+        Return the cached distance matrix of a graph, rebuilding it if the graph changed.
+
+        Args:
+            graph: Hospital graph
+
+        Returns:
+            DistanceMatrix: Distances for the current version of the graph
+        """
+        cached = cls._cache.get(graph)
+        if cached is None or cached.version != getattr(graph, "version", 0):
+            cached = cls(graph)
+            cls._cache[graph] = cached
+        return cached
+
+    def distance(self, start, end):
+        """Shortest path distance between two nodes (inf if unknown or unreachable)."""
+        if start not in self.index or end not in self.index:
+            return float('inf')
+        return float(self.matrix[self.index[start], self.index[end]])
+
+    def submatrix(self, nodes):
+        """
+        Distances between a subset of nodes, in the given order.
+
+        Args:
+            nodes: Node names; unknown nodes get infinite distances
+
+        Returns:
+            np.ndarray: len(nodes) x len(nodes) matrix with zeros on the diagonal
+        """
+        known = np.array([node in self.index for node in nodes], dtype=bool)
+        indices = np.array([self.index.get(node, 0) for node in nodes], dtype=int)
+
+        sub = self.matrix[np.ix_(indices, indices)] if len(nodes) else np.zeros((0, 0))
+        sub = np.where(known[:, None] & known[None, :], sub, np.inf)
+        np.fill_diagonal(sub, 0)
+        return sub
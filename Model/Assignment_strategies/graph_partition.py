@@ -0,0 +1,116 @@
+import weakref
+
+import numpy as np
+
+
+class GraphPartition:
+    """
+    Spectral partition of the whole hospital graph into department clusters.
+
+    Corridors are weighted by affinity (1 / length), so departments joined by
+    short corridors end up together, and the partition follows the corridor
+    structure rather than the floor plan coordinates. Because it covers every
+    department instead of only those in the current requests, cluster
+    boundaries stay fixed between re-optimizations. Partitions are cached per
+    graph and cluster count via for_graph() until the graph's version changes.
+    """
+
+    _cache = weakref.WeakKeyDictionary()
+
+    def __init__(self, graph, num_clusters):
+        self.num_clusters = num_clusters
+        self.version = getattr(graph, "version", 0)
+        self.nodes = list(graph.adjacency_list)
+
+        labels = self._spectral_labels(graph, num_clusters)
+        self.clusters = [[] for _ in range(labels.max() + 1 if len(labels) else 0)]
+        for node, label in zip(self.nodes, labels):
+            self.clusters[label].append(node)
+        self.clusters = [c for c in self.clusters if c]
+        self.cluster_of = {node: i for i, cluster in enumerate(self.clusters) for node in cluster}
+
+    @classmethod
+    def for_graph(cls, graph, num_clusters):
+        """
+        Return the cached partition of a graph, recomputing it only if the graph changed.
+
+        Args:
+            graph: Hospital graph
+            num_clusters: Desired number of clusters
+
+        Returns:
+            GraphPartition: Partition for the current version of the graph
+        """
+        partitions = cls._cache.setdefault(graph, {})
+        cached = partitions.get(num_clusters)
+        if cached is None or cached.version != getattr(graph, "version", 0):
+            cached = cls(graph, num_clusters)
+            partitions[num_clusters] = cached
+        return cached
+
+    def clusters_for(self, departments):
+        """
+        Restrict the partition to a set of departments.
+
+        Args:
+            departments: Department names of interest
+
+        Returns:
+            list: Clusters (lists of department names) in partition order; departments
+                  outside the graph are left out
+        """
+        wanted = set(departments)
+        return [[d for d in cluster if d in wanted] for cluster in self.clusters]
+
+    def _spectral_labels(self, graph, num_clusters):
+        n = len(self.nodes)
+        if n == 0:
+            return np.zeros(0, dtype=int)
+        num_clusters = max(1, min(num_clusters, n))
+
+        index = {node: i for i, node in enumerate(self.nodes)}
+        affinity = np.zeros((n, n))
+        for node, neighbors in graph.adjacency_list.items():
+            for neighbor, weight in neighbors.items():
+                if node != neighbor:
+                    affinity[index[node], index[neighbor]] = 1.0 / max(weight, 1e-9)
+        affinity = np.maximum(affinity, affinity.T)
+
+        # Normalized Laplacian L = I - D^-1/2 W D^-1/2 (isolated nodes get zero rows)
+        degree = affinity.sum(axis=1)
+        inv_sqrt_degree = np.where(degree > 0, 1.0 / np.sqrt(np.where(degree > 0, degree, 1)), 0)
+        laplacian = np.eye(n) - inv_sqrt_degree[:, None] * affinity * inv_sqrt_degree[None, :]
+
+        # Embed each node with the eigenvectors of the smallest eigenvalues (Ng, Jordan and Weiss)
+        _, eigenvectors = np.linalg.eigh(laplacian)
+        embedding = eigenvectors[:, :num_clusters]
+        norms = np.linalg.norm(embedding, axis=1, keepdims=True)
+        embedding = embedding / np.where(norms > 0, norms, 1)
+
+        return _kmeans(embedding, num_clusters)
+
+
+def _kmeans(points, k, max_iterations=50):
+    """Deterministic k-means with farthest-point initialization."""
+    centroid_indices = [0]
+    min_sq_dist = ((points - points[0]) ** 2).sum(axis=1)
+    for _ in range(1, k):
+        next_idx = int(np.argmax(min_sq_dist))
+        centroid_indices.append(next_idx)
+        min_sq_dist = np.minimum(min_sq_dist, ((points - points[next_idx]) ** 2).sum(axis=1))
+
+    centroids = points[centroid_indices].copy()
+    labels = None
+    for _ in range(max_iterations):
+        new_labels = np.argmin(((points[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2), axis=1)
+        if labels is not None and np.array_equal(labels, new_labels):
+            break
+        labels = new_labels
+
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, points)
+        non_empty = counts > 0
+        centroids[non_empty] = sums[non_empty] / counts[non_empty, None]
+
+    return labels
@@ -0,0 +1,129 @@
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.connection import wait
+
+logger = logging.getLogger('ParallelRunner')
+
+# Workers run in process groups of their own (POSIX only), so stopping one also
+# stops the subprocesses its task started, such as CBC or nested workers
+PROCESS_GROUPS = hasattr(os, "setsid") and hasattr(os, "killpg")
+_worker_groups = set()  # Process groups of the workers this process is running
+
+
+def process_context():
+    """Multiprocessing context for workers (and for locks shared with them)."""
+    # Fork keeps the parent's imports and avoids re-running the Flask entry point
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _signal_group(pgid, signum):
+    try:
+        os.killpg(pgid, signum)
+        return True
+    except (ProcessLookupError, PermissionError):
+        return False
+
+
+def _on_terminate(signum, frame):
+    # Nested workers run in groups of their own, so pass the termination on
+    for pgid in list(_worker_groups):
+        _signal_group(pgid, signal.SIGTERM)
+    os._exit(1)
+
+
+def _run_task(connection, func, args):
+    if PROCESS_GROUPS:
+        os.setsid()
+        _worker_groups.clear()  # Inherited from the parent through fork
+        signal.signal(signal.SIGTERM, _on_terminate)
+    try:
+        connection.send((True, func(*args)))
+    except Exception as e:
+        connection.send((False, f"{type(e).__name__}: {e}"))
+    finally:
+        connection.close()
+
+
+def _stop(process):
+    """Terminate a worker together with its process group, killing it if it lingers."""
+    # Before the worker has called setsid its group does not exist yet
+    if not (PROCESS_GROUPS and _signal_group(process.pid, signal.SIGTERM)):
+        process.terminate()
+    process.join(timeout=1)
+    if process.is_alive():
+        if not (PROCESS_GROUPS and _signal_group(process.pid, signal.SIGKILL)):
+            process.kill()
+        process.join()
+
+
+def run_in_processes(tasks, deadline, max_workers=None, on_result=None):
+    """
+    Run independent tasks in worker processes and collect what finishes in time.
+
+    Args:
+        tasks: Dict mapping a key to a (function, args) tuple. Functions must be
+               module-level and return picklable results.
+        deadline: Wall-clock budget in seconds (None: no deadline). Workers still
+                  running when it expires are terminated along with the
+                  subprocesses they started.
+        max_workers: Maximum number of concurrent processes (default: CPU count)
+        on_result: Optional callback (key, result) called as each task finishes
+
+    Returns:
+        dict: key -> result for every task that finished successfully
+    """
+    context = process_context()
+    max_workers = max_workers or multiprocessing.cpu_count()
+    end_time = time.time() + deadline if deadline is not None else None
+
+    pending = list(tasks.items())
+    running = {}  # connection -> (key, process)
+    results = {}
+
+    while pending or running:
+        while pending and len(running) < max_workers:
+            key, (func, args) = pending.pop(0)
+            receiver, sender = context.Pipe(duplex=False)
+            # Not daemonic, so tasks may start their own workers (e.g. Cluster-Based inside a portfolio)
+            process = context.Process(target=_run_task, args=(sender, func, args))
+            process.start()
+            sender.close()
+            _worker_groups.add(process.pid)
+            running[receiver] = (key, process)
+
+        remaining = end_time - time.time() if end_time is not None else None
+        if remaining is not None and remaining <= 0:
+            break
+
+        for connection in wait(list(running), timeout=remaining):
+            key, process = running.pop(connection)
+            try:
+                ok, payload = connection.recv()
+            except EOFError:
+                ok, payload = False, "worker exited without a result"
+            connection.close()
+            process.join()
+            _worker_groups.discard(process.pid)
+
+            if ok:
+                results[key] = payload
+                if on_result:
+                    on_result(key, payload)
+            else:
+                logger.warning(f"Task {key} failed: {payload}")
+
+    for connection, (key, process) in running.items():
+        logger.warning(f"Task {key} missed the {deadline:.1f}s deadline, terminating")
+        _stop(process)
+        _worker_groups.discard(process.pid)
+        connection.close()
+
+    for key, _ in pending:
+        logger.warning(f"Task {key} was never started before the deadline")
+
+    return results
@@ -0,0 +1,51 @@
+class PlanEvaluator:
+    """
+    Common yardstick for comparing assignment plans produced by different optimizers.
+
+    Every transporter executes its requests in plan order, travelling from its
+    current location to each origin and on to the destination. This is the same
+    execution model the benchmark uses.
+    """
+
+    def __init__(self, transporters, graph):
+        self.transporters = transporters
+        self.graph = graph
+        self._distance_cache = {}
+
+    def evaluate(self, plan):
+        """
+        Score a plan.
+
+        Args:
+            plan: Dict mapping transporter names to ordered request lists
+
+        Returns:
+            dict: makespan, total_time and per-transporter workload
+        """
+        workload = {}
+        for t in self.transporters:
+            workload[t.name] = self.route_time(t.current_location, plan.get(t.name, []))
+
+        return {
+            "makespan": max(workload.values(), default=0),
+            "total_time": sum(workload.values()),
+            "workload": workload
+        }
+
+    def route_time(self, start, requests):
+        time = 0
+        location = start
+        for request in requests:
+            time += self.travel_time(location, request.origin) + self.travel_time(request.origin, request.destination)
+            location = request.destination
+        return time
+
+    def travel_time(self, start, end):
+        key = (start, end)
+        if key not in self._distance_cache:
+            try:
+                _, distance = self.transporters[0].pathfinder.dijkstra(start, end)
+            except (IndexError, ValueError):
+                distance = float('inf')
+            self._distance_cache[key] = distance
+        return self._distance_cache[key]
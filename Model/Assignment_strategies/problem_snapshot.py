@@ -0,0 +1,94 @@
+from Model.hospital_model import Hospital
+from Model.graph_model import Graph
+from Model.model_patient_transporters import PatientTransporter
+from Model.model_transportation_request import TransportationRequest
+
+
+class ProblemSnapshot:
+    """
+    Plain-data copy of an assignment problem.
+
+    Transporters hold socket connections and the hospital, so they cannot be
+    sent to worker processes. A snapshot keeps only what the optimizers read
+    (graph, transporter state and request fields) and can rebuild equivalent
+    model objects on the other side. Plans travel back as request ids.
+    """
+
+    def __init__(self, transporters, requests, graph):
+        self.directed = graph.directed
+        self.adjacency = {node: dict(neighbors) for node, neighbors in graph.adjacency_list.items()}
+        self.coordinates = dict(graph.coordinates)
+
+        self.transporters = [
+            {
+                "name": t.name,
+                "current_location": t.current_location,
+                "status": getattr(t, "status", "active"),
+                "resting": t.shift_manager.resting if hasattr(t, "shift_manager") else False,
+                "accumulated_work_time": (t.shift_manager.accumulated_work_time
+                                          if hasattr(t, "shift_manager") else 0.0),
+            }
+            for t in transporters
+        ]
+
+        self.requests = [
+            {
+                "id": r.id,
+                "origin": r.origin,
+                "destination": r.destination,
+                "transport_type": getattr(r, "transport_type", "stretcher"),
+                "urgent": r.urgent,
+                "request_time": getattr(r, "request_time", None),
+            }
+            for r in requests
+        ]
+
+    def restore(self):
+        """
+        Rebuild the problem from the snapshot.
+
+        Returns:
+            tuple: (transporters, requests, graph) backed by a private hospital.
+                   The requests are not registered in the global request lists.
+        """
+        hospital = Hospital()
+        graph = Graph(directed=self.directed)
+        graph.adjacency_list = {node: dict(neighbors) for node, neighbors in self.adjacency.items()}
+        graph.coordinates = dict(self.coordinates)
+        hospital.graph = graph
+        hospital.departments = list(graph.adjacency_list)
+
+        transporters = []
+        for data in self.transporters:
+            transporter = PatientTransporter(hospital, data["name"], socketio=None,
+                                             start_location=data["current_location"])
+            transporter.status = data["status"]
+            transporter.shift_manager.resting = data["resting"]
+            transporter.shift_manager.accumulated_work_time = data["accumulated_work_time"]
+            transporters.append(transporter)
+
+        requests = []
+        for data in self.requests:
+            request = TransportationRequest(data["origin"], data["destination"], data["transport_type"],
+                                            data["urgent"], request_time=data["request_time"])
+            request.id = data["id"]
+            requests.append(request)
+
+        return transporters, requests, graph
+
+    @staticmethod
+    def plan_to_ids(plan):
+        """Convert {transporter_name: [requests]} into {transporter_name: [request ids]}."""
+        return {name: [r.id for r in requests] for name, requests in plan.items()}
+
+    @staticmethod
+    def plan_from_ids(id_plan, requests):
+        """Map a plan of request ids back onto the caller's own request objects."""
+        by_id = {r.id: r for r in requests}
+        return {name: [by_id[r_id] for r_id in ids if r_id in by_id] for name, ids in id_plan.items()}
+
+    @staticmethod
+    def assigns_each_once(id_plan, requests):
+        """True if a plan of request ids assigns every request exactly once and nothing else."""
+        ids = [r_id for route in id_plan.values() for r_id in route]
+        return len(ids) == len(requests) and set(ids) == {r.id for r in requests}
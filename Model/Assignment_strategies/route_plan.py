@@ -0,0 +1,244 @@
+from itertools import chain
+
+import numpy as np
+
+from Model.Assignment_strategies.distance_matrix import DistanceMatrix
+
+
+class RoutePlan:
+    """
+    Index-based view of an assignment plan for fast route post-processing.
+
+    Requests and locations are numbered once and all travel times come from a
+    cost matrix, so ordering and balancing never copy request objects or run
+    Dijkstra. Each transporter executes its route sequentially: from its
+    current location to the first origin, on to that destination, then to the
+    next origin, and so on. Relocate and swap moves are evaluated by the change
+    they cause at the affected route positions only.
+    """
+
+    def __init__(self, transporters, plan, graph):
+        """
+        Args:
+            transporters: List of transporter objects
+            plan: Dict mapping transporter names to lists of requests
+            graph: Hospital graph
+        """
+        self.transporters = transporters
+        self.requests = [r for t in transporters for r in plan.get(t.name, [])]
+
+        self.dist, self.start, self.origin, self.dest = self.cost_model(transporters, self.requests, graph)
+        self.service = self.dist[self.origin, self.dest] if len(self.requests) else np.zeros(0)
+
+        self.routes = []
+        offset = 0
+        for t in transporters:
+            count = len(plan.get(t.name, []))
+            self.routes.append(list(range(offset, offset + count)))
+            offset += count
+
+    @staticmethod
+    def cost_model(transporters, requests, graph):
+        """
+        Number the locations of a problem and build the travel times between them.
+
+        Args:
+            transporters: List of transporter objects
+            requests: List of request objects
+            graph: Hospital graph
+
+        Returns:
+            tuple: (dist, start, origin, dest): the cost matrix over the problem's
+                   locations and the location indices of the transporters'
+                   positions and the requests' origins and destinations
+        """
+        locations = list(dict.fromkeys(
+            [t.current_location for t in transporters] +
+            [loc for r in requests for loc in (r.origin, r.destination)]
+        ))
+        location_index = {loc: i for i, loc in enumerate(locations)}
+
+        dist = RoutePlan.cost_matrix(graph, locations) if locations else np.zeros((0, 0))
+        start = np.array([location_index[t.current_location] for t in transporters], dtype=int)
+        origin = np.array([location_index[r.origin] for r in requests], dtype=int)
+        dest = np.array([location_index[r.destination] for r in requests], dtype=int)
+        return dist, start, origin, dest
+
+    @staticmethod
+    def cost_matrix(graph, locations):
+        """
+        Travel times between locations from the graph's cached distances.
+
+        Args:
+            graph: Hospital graph
+            locations: Location names
+
+        Returns:
+            np.ndarray: len(locations) x len(locations) matrix
+        """
+        dist = DistanceMatrix.for_graph(graph).submatrix(locations)
+        if np.isinf(dist).any():
+            # Unknown or unreachable locations: estimate from coordinates, as the
+            # optimizers' path time helpers do
+            coords = np.array([graph.get_node_coordinates(loc) for loc in locations], dtype=float)
+            euclidean = np.sqrt(((coords[:, None, :] - coords[None, :, :]) ** 2).sum(axis=2)) / 10
+            dist = np.where(np.isinf(dist), euclidean, dist)
+        return dist
+
+    def to_plan(self):
+        """Return the routes as {transporter_name: [requests]} with the original request objects."""
+        return {t.name: [self.requests[q] for q in route] for t, route in zip(self.transporters, self.routes)}
+
+    def route_load(self, k):
+        """Total travel time of transporter k's route."""
+        route = self.routes[k]
+        if not route:
+            return 0.0
+        previous = np.concatenate(([self.start[k]], self.dest[route[:-1]]))
+        return float(self.dist[previous, self.origin[route]].sum() + self.service[route].sum())
+
+    def loads(self):
+        return np.array([self.route_load(k) for k in range(len(self.routes))], dtype=float)
+
+    def order_greedy_chain(self):
+        """Reorder every route greedily: always continue with the request whose origin is closest."""
+        for k, route in enumerate(self.routes):
+            remaining = list(route)
+            ordered = []
+            location = self.start[k]
+            while remaining:
+                pick = int(np.argmin(self.dist[location, self.origin[remaining]]))
+                q = remaining.pop(pick)
+                ordered.append(q)
+                location = self.dest[q]
+            self.routes[k] = ordered
+        return self
+
+    def improve(self, max_moves=None):
+        """
+        Relocate and swap requests away from the longest route until no move
+        lowers the larger of the two affected route loads.
+
+        Args:
+            max_moves: Optional cap on the number of applied moves
+
+        Returns:
+            int: Number of moves applied
+        """
+        max_moves = max_moves if max_moves is not None else 10 * max(1, len(self.requests))
+        loads = self.loads()
+        moves = 0
+
+        while moves < max_moves and len(self.routes) > 1:
+            worst = int(np.argmax(loads))
+            if not (self._try_relocate(worst, loads) or self._try_swap(worst, loads)):
+                break
+            moves += 1
+
+        return moves
+
+    def _previous_location(self, k, position):
+        route = self.routes[k]
+        return self.start[k] if position == 0 else self.dest[route[position - 1]]
+
+    def _removal_delta(self, k, position):
+        route = self.routes[k]
+        q = route[position]
+        previous = self._previous_location(k, position)
+        delta = -self.dist[previous, self.origin[q]] - self.service[q]
+        if position + 1 < len(route):
+            following = self.origin[route[position + 1]]
+            delta += self.dist[previous, following] - self.dist[self.dest[q], following]
+        return delta
+
+    def _insertion_slots(self):
+        """
+        All insertion points of all routes, route by route: for each slot the
+        location before it, the origin after it (-1 at the end of a route) and
+        the offset of every route's first slot.
+        """
+        lengths = np.array([len(route) for route in self.routes], dtype=int)
+        flat = np.fromiter(chain.from_iterable(self.routes), dtype=int, count=int(lengths.sum()))
+        offsets = np.concatenate(([0], np.cumsum(lengths + 1)[:-1])).astype(int)
+
+        is_first = np.zeros(len(flat) + len(self.routes), dtype=bool)
+        is_first[offsets] = True
+        previous = np.empty(len(is_first), dtype=int)
+        previous[is_first] = self.start
+        previous[~is_first] = self.dest[flat]
+
+        is_last = np.zeros(len(is_first), dtype=bool)
+        is_last[offsets + lengths] = True
+        following = np.full(len(is_first), -1, dtype=int)
+        following[~is_last] = self.origin[flat]
+        return previous, following, offsets
+
+    def _insertion_deltas(self, slots, q):
+        """Load increase for inserting request q at every slot of every route."""
+        previous, following, _ = slots
+        deltas = self.dist[previous, self.origin[q]] + self.service[q]
+        has_next = following >= 0
+        deltas[has_next] += (self.dist[self.dest[q], following[has_next]] -
+                             self.dist[previous[has_next], following[has_next]])
+        return deltas
+
+    def _replacement_deltas(self, k, position, new_qs):
+        """Load change of route k when the request at position is replaced by each of new_qs."""
+        route = self.routes[k]
+        old_q = route[position]
+        previous = self._previous_location(k, position)
+        deltas = (self.dist[previous, self.origin[new_qs]] + self.service[new_qs] -
+                  self.dist[previous, self.origin[old_q]] - self.service[old_q])
+        if position + 1 < len(route):
+            following = self.origin[route[position + 1]]
+            deltas += self.dist[self.dest[new_qs], following] - self.dist[self.dest[old_q], following]
+        return deltas
+
+    def _positional_replacement_deltas(self, k, new_q):
+        """Load change of route k when new_q replaces the request at each position."""
+        route = np.array(self.routes[k], dtype=int)
+        previous = np.concatenate(([self.start[k]], self.dest[route[:-1]])).astype(int)
+        deltas = (self.dist[previous, self.origin[new_q]] + self.service[new_q] -
+                  self.dist[previous, self.origin[route]] - self.service[route])
+        following = self.origin[route[1:]]
+        deltas[:-1] += self.dist[self.dest[new_q], following] - self.dist[self.dest[route[:-1]], following]
+        return deltas
+
+    def _try_relocate(self, worst, loads):
+        slots = self._insertion_slots()
+        offsets = slots[2]
+
+        for position, q in enumerate(self.routes[worst]):
+            new_worst = loads[worst] + self._removal_delta(worst, position)
+
+            # Cheapest insertion into every other route at once
+            deltas = self._insertion_deltas(slots, q)
+            new_loads = loads + np.minimum.reduceat(deltas, offsets)
+            new_loads[worst] = np.inf
+            k = int(np.argmin(new_loads))
+
+            if max(new_worst, new_loads[k]) < loads[worst] - 1e-9:
+                end = offsets[k + 1] if k + 1 < len(offsets) else len(deltas)
+                insert_at = int(np.argmin(deltas[offsets[k]:end]))
+                self.routes[worst].pop(position)
+                self.routes[k].insert(insert_at, q)
+                loads[worst], loads[k] = new_worst, new_loads[k]
+                return True
+        return False
+
+    def _try_swap(self, worst, loads):
+        for position, q in enumerate(self.routes[worst]):
+            for k in range(len(self.routes)):
+                if k == worst or not self.routes[k]:
+                    continue
+                # Evaluate swapping q with every request of route k at once
+                new_worst = loads[worst] + self._replacement_deltas(worst, position, np.array(self.routes[k]))
+                new_load = loads[k] + self._positional_replacement_deltas(k, q)
+                improving = np.flatnonzero(np.maximum(new_worst, new_load) < loads[worst] - 1e-9)
+                if len(improving):
+                    other_position = int(improving[0])
+                    self.routes[worst][position], self.routes[k][other_position] = \
+                        self.routes[k][other_position], q
+                    loads[worst], loads[k] = new_worst[other_position], new_load[other_position]
+                    return True
+        return False
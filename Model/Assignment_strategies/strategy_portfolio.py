@@ -0,0 +1,171 @@
+import logging
+import time
+
+from Model.Assignment_strategies.assignment_strategy import AssignmentStrategy
+from Model.Assignment_strategies.ALNS.alns_strategy import ALNSStrategy
+from Model.Assignment_strategies.distance_matrix import estimate_travel_time
+from Model.Assignment_strategies.Genetic_algorithms.genetic_algorithm_strategy import GeneticAlgorithmStrategy
+from Model.Assignment_strategies.Greedy.greedy_insertion import GreedyInsertion
+from Model.Assignment_strategies.ILP.ilp_mode import ILPMode
+from Model.Assignment_strategies.ILP.ilp_optimizer_strategy import ILPOptimizerStrategy
+from Model.Assignment_strategies.parallel_runner import run_in_processes
+from Model.Assignment_strategies.plan_evaluator import PlanEvaluator
+from Model.Assignment_strategies.problem_snapshot import ProblemSnapshot
+
+# Members with a solver time limit, built for a budget in seconds so that they
+# stop on their own before the race deadline. Other members run as registered.
+BUDGETED_MEMBERS = {
+    "ALNS": lambda budget: ALNSStrategy(time_limit_seconds=budget),
+    "Genetic Algorithm": lambda budget: GeneticAlgorithmStrategy(
+        population_size=50, generations=50, time_limit_seconds=budget),
+    "Genetic Algorithm: Islands": lambda budget: GeneticAlgorithmStrategy(
+        population_size=50, generations=200, islands=4, time_limit_seconds=budget),
+    "Genetic Algorithm: Memetic": lambda budget: GeneticAlgorithmStrategy(
+        population_size=50, generations=50, memetic=True, time_limit_seconds=budget),
+    "ILP: Makespan": lambda budget: ILPOptimizerStrategy(ILPMode.MAKESPAN, time_limit=max(1, int(budget))),
+    "ILP: Equal Workload": lambda budget: ILPOptimizerStrategy(ILPMode.EQUAL_WORKLOAD,
+                                                               time_limit=max(1, int(budget))),
+    "ILP: Urgency First": lambda budget: ILPOptimizerStrategy(ILPMode.URGENCY_FIRST,
+                                                              time_limit=max(1, int(budget))),
+    "ILP: Cluster-Based": lambda budget: ILPOptimizerStrategy(ILPMode.CLUSTER_BASED, num_clusters=7,
+                                                              time_limit=max(1, int(budget))),
+    "ILP: Portfolio": lambda budget: ILPOptimizerStrategy(ILPMode.PORTFOLIO, deadline=budget),
+}
+
+
+def _build_member(name, budget):
+    """Build a member strategy, with its solver time limit set to budget where it has one."""
+    if budget is not None and name in BUDGETED_MEMBERS:
+        return BUDGETED_MEMBERS[name](budget)
+
+    # Imported here to avoid a circular import with the registry, which lists the portfolio itself
+    from Model.Assignment_strategies.strategy_registry import STRATEGY_REGISTRY
+    return STRATEGY_REGISTRY[name]()
+
+
+def _solve_member(snapshot, name, budget):
+    """Worker entry point: rebuild the problem and solve it with one member strategy."""
+    transporters, requests, graph = snapshot.restore()
+    plan = _build_member(name, budget).generate_assignment_plan(transporters, requests, graph)
+    return ProblemSnapshot.plan_to_ids(plan)
+
+
+class StrategyPortfolio(AssignmentStrategy):
+    """
+    Races several registered strategies and keeps the best plan at the deadline.
+
+    Every member runs in its own process on the same snapshot of the problem.
+    Members with a solver time limit get the deadline minus SOLVE_MARGIN
+    (snapshot restore and plan transfer) as their limit, so ILP members stop
+    CBC themselves. Members still running at the deadline are terminated
+    together with their solver subprocesses. Finished plans that assign every
+    request exactly once are scored with a common PlanEvaluator metric; other
+    plans count as unfinished. Per-member win statistics accumulate over all
+    runs of this strategy instance, so operators can see which strategy suits
+    their usual backlog.
+    """
+
+    DEFAULT_MEMBERS = ["Greedy Insertion", "Hungarian Batch", "ALNS", "ILP: Makespan"]
+    SOLVE_MARGIN = 1.0
+
+    def __init__(self, members=None, deadline=5, metric="makespan", max_workers=None):
+        """
+        Args:
+            members: Names of STRATEGY_REGISTRY entries to race (default: DEFAULT_MEMBERS)
+            deadline: Wall-clock budget in seconds for the whole race (None: no deadline,
+                      members run with their registered limits)
+            metric: PlanEvaluator key to minimize ("makespan" or "total_time")
+            max_workers: Maximum number of concurrent processes (default: one per
+                         member, since they race against the same deadline)
+        """
+        self.members = list(members) if members is not None else list(self.DEFAULT_MEMBERS)
+        self.deadline = deadline
+        self.metric = metric
+        self.max_workers = max_workers or len(self.members)
+        self.logger = logging.getLogger('StrategyPortfolio')
+
+        self.scores = {}
+        self.winner = None
+        self.runs = 0
+        self.member_stats = {name: {"finished": 0, "wins": 0, "total_time": 0.0} for name in self.members}
+
+    def generate_assignment_plan(self, transporters, assignable_requests, graph):
+        """
+        Race the members and return the best plan finished before the deadline.
+
+        Args:
+            transporters: List of available transporters
+            assignable_requests: List of requests to be assigned
+            graph: Hospital graph
+
+        Returns:
+            dict: Assignment plan mapping transporter names to lists of requests
+        """
+        start_time = time.time()
+        evaluator = PlanEvaluator(transporters, graph)
+        snapshot = ProblemSnapshot(transporters, assignable_requests, graph)
+        budget = self.member_budget()
+        tasks = {name: (_solve_member, (snapshot, name, budget)) for name in self.members}
+
+        finish_times = {}
+        results = run_in_processes(tasks, self.deadline, self.max_workers,
+                                   on_result=lambda name, _: finish_times.setdefault(name, time.time() - start_time))
+
+        self.runs += 1
+        self.scores, self.winner = {}, None
+        best_plan = None
+        for name, id_plan in results.items():
+            # A plan missing requests would win on makespan without being comparable
+            if not ProblemSnapshot.assigns_each_once(id_plan, assignable_requests):
+                self.logger.warning(f"Portfolio member {name} returned an incomplete plan, ignoring it")
+                continue
+            plan = ProblemSnapshot.plan_from_ids(id_plan, assignable_requests)
+            self.scores[name] = evaluator.evaluate(plan)[self.metric]
+            self.member_stats[name]["finished"] += 1
+            self.member_stats[name]["total_time"] += finish_times[name]
+
+            if best_plan is None or self.scores[name] < self.scores[self.winner]:
+                best_plan, self.winner = plan, name
+
+        if best_plan is None:
+            self.logger.warning("No portfolio member finished before the deadline, using greedy insertion")
+            return GreedyInsertion(transporters, assignable_requests, graph).generate_assignment_plan()
+
+        self.member_stats[self.winner]["wins"] += 1
+        self.logger.info(f"Portfolio winner: {self.winner} ({self.metric} {self.scores[self.winner]:.1f}) "
+                         f"out of {len(self.scores)}/{len(tasks)} finished members "
+                         f"in {time.time() - start_time:.2f}s")
+        return best_plan
+
+    def member_budget(self):
+        """Time limit in seconds handed to the members' solvers, None without a deadline."""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - self.SOLVE_MARGIN, self.deadline / 2)
+
+    def get_statistics(self):
+        """
+        Win statistics per member over all runs of this portfolio.
+
+        Returns:
+            dict: runs, last winner and scores, and per member the number of
+                  finished runs, wins, win rate and mean time to finish
+        """
+        return {
+            "runs": self.runs,
+            "metric": self.metric,
+            "last_winner": self.winner,
+            "last_scores": dict(self.scores),
+            "members": {
+                name: {
+                    "finished": stats["finished"],
+                    "wins": stats["wins"],
+                    "win_rate": stats["wins"] / self.runs if self.runs else 0.0,
+                    "mean_time": stats["total_time"] / stats["finished"] if stats["finished"] else None,
+                }
+                for name, stats in self.member_stats.items()
+            }
+        }
+
+    def estimate_travel_time(self, transporter, request):
+        return estimate_travel_time(transporter, request)
@@ -3,12 +3,25 @@ from Model.Assignment_strategies.Random.random_assignment_strategy import Random
 from Model.Assignment_strategies.ILP.ilp_optimizer_strategy import ILPOptimizerStrategy
 from Model.Assignment_strategies.ILP.ilp_mode import ILPMode
 from Model.Assignment_strategies.Genetic_algorithms.genetic_algorithm_strategy import GeneticAlgorithmStrategy
+from Model.Assignment_strategies.Greedy.greedy_insertion_strategy import GreedyInsertionStrategy
+from Model.Assignment_strategies.Hungarian.hungarian_assignment_strategy import HungarianAssignmentStrategy
+from Model.Assignment_strategies.ALNS.alns_strategy import ALNSStrategy
+from Model.Assignment_strategies.strategy_portfolio import StrategyPortfolio
+from Model.Assignment_strategies.Auto.auto_strategy import AutoStrategy
 
 STRATEGY_REGISTRY = {
     "Random": RandomAssignmentStrategy,
+    "Greedy Insertion": GreedyInsertionStrategy,
+    "Hungarian Batch": HungarianAssignmentStrategy,
     "ILP: Makespan": lambda: ILPOptimizerStrategy(ILPMode.MAKESPAN),
     "ILP: Equal Workload": lambda: ILPOptimizerStrategy(ILPMode.EQUAL_WORKLOAD),
     "ILP: Urgency First": lambda: ILPOptimizerStrategy(ILPMode.URGENCY_FIRST),
     "ILP: Cluster-Based": lambda: ILPOptimizerStrategy(ILPMode.CLUSTER_BASED, num_clusters=7),
-    "Genetic Algorithm": lambda: GeneticAlgorithmStrategy(population_size=50, generations=50)
-}
\ No newline at end of file
+    "ILP: Portfolio": lambda: ILPOptimizerStrategy(ILPMode.PORTFOLIO, deadline=30),
+    "Genetic Algorithm": lambda: GeneticAlgorithmStrategy(population_size=50, generations=50),
+    "Genetic Algorithm: Islands": lambda: GeneticAlgorithmStrategy(population_size=50, generations=200, islands=4),
+    "Genetic Algorithm: Memetic": lambda: GeneticAlgorithmStrategy(population_size=50, generations=50, memetic=True),
+    "ALNS": lambda: ALNSStrategy(time_limit_seconds=2),
+    "Portfolio": lambda: StrategyPortfolio(deadline=5),
+    "Auto": lambda: AutoStrategy(latency_slo=2.0)
+}
@@ -162,8 +162,8 @@ class SystemIntegrator:
                         f"🆕 New request created: {origin} ➝ {destination} ({transport_type}, urgent={urgent})"
                     )
 
-                    # Deploy optimization
-                    self.system.transport_manager.deploy_strategy_assignment()
+                    # Deploy optimization, batched according to the batch policy
+                    self.system.transport_manager.handle_new_request(request)
 
                     # Wait before next request
                     eventlet.sleep(adjusted_interval)
@@ -1,4 +1,7 @@
+import eventlet
+
 from Model.model_transportation_request import TransportationRequest
+from Model.solver_clock import SolverClock
 from Model.transport_assignment_handler import TransportAssignmentHandler
 
 class AssignmentExecutor:
@@ -8,6 +11,7 @@ class AssignmentExecutor:
         self.strategy = strategy
         self.assignable_requests = assignable_requests
         self.handler = TransportAssignmentHandler(socketio, transport_manager)
+        self.solver_clock = SolverClock()
 
     def run(self):
         self._emit_reoptimization_start()
@@ -19,19 +23,47 @@ class AssignmentExecutor:
         self._emit_pending_status(all_requests)
         self._emit_transporter_status(transporters)
 
-        assignment_plan = self.strategy.generate_assignment_plan(transporters, all_requests, graph)
+        # Anytime strategies stream improving plans: dispatch the first one right
+        # away and let later ones rearrange the work that has not started yet
+        assignment_plan = None
+        dispatched = 0
+        for plan in self._timed(self.strategy.generate_assignment_plans(transporters, all_requests, graph)):
+            if not plan:
+                continue
+            if dispatched:
+                self._log(f"📈 Improved plan #{dispatched + 1} found, updating queues...")
+            assignment_plan = plan
+            self._dispatch_plan(transporters, plan)
+            dispatched += 1
+            eventlet.sleep(0)  # Let the dispatched transports start while optimization continues
+
         if not assignment_plan:
             self._emit_no_assignment_found()
             return
 
         optimizer = self.strategy.get_optimizer(transporters, all_requests, graph)
+        self._log_summary_for_all(optimizer)
 
+    def _timed(self, plans):
+        """Yield the strategy's plans, clocking only the time spent producing them."""
+        plans = iter(plans)
+        while True:
+            self.solver_clock.start()
+            try:
+                plan = next(plans)
+            except StopIteration:
+                return
+            finally:
+                self.solver_clock.stop()
+            yield plan
+
+    def _dispatch_plan(self, transporters, assignment_plan):
+        # Requests started by an earlier plan stay with their transporter
+        plan = {name: [r for r in requests if r.is_reassignable()] for name, requests in assignment_plan.items()}
         for transporter in transporters:
-            self._assign_tasks_to_transporter(transporter, assignment_plan, optimizer)
-
-        self._log_summary_for_all(optimizer)
+            self._assign_tasks_to_transporter(transporter, plan)
 
-    def _assign_tasks_to_transporter(self, transporter, assignment_plan, optimizer):
+    def _assign_tasks_to_transporter(self, transporter, assignment_plan):
         assigned_requests = assignment_plan.get(transporter.name, [])
 
         if transporter.shift_manager.resting:
@@ -0,0 +1,98 @@
+import eventlet
+
+
+class BatchDispatcher:
+    """
+    Collects request arrivals and runs one optimization per batch.
+
+    A batch is closed, and the assignment strategy deployed once for all of its
+    requests, when the window that started with its first arrival expires, when
+    it holds max_batch_size requests, or when an urgent request arrives. With a
+    window of 0 every arrival is deployed right away, as before batching.
+    """
+
+    FLUSH_REASONS = ("immediate", "window", "size", "urgent", "manual")
+
+    def __init__(self, transport_manager, window_seconds=0, max_batch_size=None, flush_on_urgent=True):
+        """
+        Args:
+            transport_manager: TransportManager whose strategy is deployed per batch
+            window_seconds: Longest time a request waits for its batch to close (0: no batching)
+            max_batch_size: Close the batch once it holds this many requests (None: no limit)
+            flush_on_urgent: Close the batch as soon as an urgent request arrives
+        """
+        self.tm = transport_manager
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self.flush_on_urgent = flush_on_urgent
+
+        self.batch = []
+        self.timer = None
+        self.batches = 0
+        self.batched_requests = 0
+        self.flushes = {reason: 0 for reason in self.FLUSH_REASONS}
+
+    def configure(self, window_seconds=None, max_batch_size=None, flush_on_urgent=None):
+        """Change the policy; requests already waiting are deployed under the old one first."""
+        self.flush("manual")
+        if window_seconds is not None:
+            self.window_seconds = window_seconds
+        if max_batch_size is not None:
+            self.max_batch_size = max_batch_size or None
+        if flush_on_urgent is not None:
+            self.flush_on_urgent = flush_on_urgent
+
+    def add(self, request):
+        """
+        Add an arrival to the open batch and close the batch if the policy says so.
+
+        Returns:
+            str or None: Reason the batch was closed, None if it stays open
+        """
+        self.batch.append(request)
+
+        if self.window_seconds <= 0:
+            reason = "immediate"
+        elif request.urgent and self.flush_on_urgent:
+            reason = "urgent"
+        elif self.max_batch_size and len(self.batch) >= self.max_batch_size:
+            reason = "size"
+        else:
+            if self.timer is None:
+                self.timer = eventlet.spawn_after(self.window_seconds, self.flush, "window")
+            return None
+
+        self.flush(reason)
+        return reason
+
+    def flush(self, reason="manual"):
+        """Close the open batch and deploy the assignment strategy for it."""
+        timer, self.timer = self.timer, None
+        if timer is not None and reason != "window":
+            timer.cancel()
+        if not self.batch:
+            return
+
+        self.batches += 1
+        self.batched_requests += len(self.batch)
+        self.flushes[reason] += 1
+        self.batch = []
+        self.tm.deploy_strategy_assignment()
+
+    def clear(self):
+        """Drop the open batch without deploying, e.g. when another dispatch mode takes over."""
+        if self.timer is not None:
+            self.timer.cancel()
+        self.timer = None
+        self.batch = []
+
+    def get_status(self):
+        return {
+            "window_seconds": self.window_seconds,
+            "max_batch_size": self.max_batch_size,
+            "flush_on_urgent": self.flush_on_urgent,
+            "open_batch": len(self.batch),
+            "batches": self.batches,
+            "mean_batch_size": self.batched_requests / self.batches if self.batches else 0.0,
+            "flushes": dict(self.flushes),
+        }
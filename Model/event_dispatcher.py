@@ -0,0 +1,206 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from Model.Assignment_strategies.distance_matrix import DistanceMatrix
+
+
+class LocationIndex:
+    """
+    Items grouped by hospital location, with nearest-location lookup.
+
+    Items are kept per location in arrival order. A lookup returns the oldest
+    item at the location nearest to a query location by network distance.
+    While only a few locations hold items, the nearest one is found by
+    comparing their distances directly; otherwise the locations are scanned in
+    the query location's precomputed distance order, which stops at the first
+    occupied one. Either way the cost depends on the number of departments,
+    not on the number of items, and adding or removing an item is O(1).
+    """
+
+    # Use the direct comparison while at most this share of the locations is occupied
+    DIRECT_SHARE = 0.125
+
+    def __init__(self, distances):
+        """
+        Args:
+            distances: DistanceMatrix of the hospital graph
+        """
+        self.distances = distances
+        self.buckets = {}  # location -> OrderedDict(key -> item)
+        self.locations = {}  # key -> location
+        self._orders = {}  # location index -> locations sorted by distance
+
+    def __len__(self):
+        return len(self.locations)
+
+    def __contains__(self, key):
+        return key in self.locations
+
+    def add(self, key, location, item):
+        """Add or move an item; a key is indexed at one location at a time."""
+        self.remove(key)
+        self.buckets.setdefault(location, OrderedDict())[key] = item
+        self.locations[key] = location
+
+    def remove(self, key):
+        location = self.locations.pop(key, None)
+        if location is None:
+            return None
+        bucket = self.buckets[location]
+        item = bucket.pop(key)
+        if not bucket:
+            del self.buckets[location]
+        return item
+
+    def pop_nearest(self, location):
+        """
+        Remove and return (key, item) of the oldest item at the nearest occupied
+        location, or None if the index is empty.
+        """
+        nearest = self.nearest_location(location)
+        if nearest is None:
+            return None
+        key = next(iter(self.buckets[nearest]))
+        return key, self.remove(key)
+
+    def nearest_location(self, location):
+        if not self.buckets:
+            return None
+
+        index = self.distances.index
+        if location not in index:
+            return next(iter(self.buckets))
+
+        origin = index[location]
+        if len(self.buckets) <= max(1, self.DIRECT_SHARE * len(index)):
+            return min(self.buckets, key=lambda loc: self.distances.matrix[origin, index[loc]]
+                       if loc in index else np.inf)
+
+        for candidate in self._order(origin):
+            if candidate in self.buckets:
+                return candidate
+        # Only locations outside the graph are occupied
+        return next(iter(self.buckets))
+
+    def _order(self, origin):
+        order = self._orders.get(origin)
+        if order is None:
+            nodes = self.distances.nodes
+            order = [nodes[i] for i in np.argsort(self.distances.matrix[origin], kind='stable')]
+            self._orders[origin] = order
+        return order
+
+
+class EventDispatcher:
+    """
+    Online dispatching without batch optimization.
+
+    An arriving request goes straight to the nearest idle transporter, and a
+    transporter that becomes free takes the nearest pending request, urgent
+    requests first. Idle transporters are indexed by their location and
+    pending requests by their origin department, so each decision costs a
+    lookup instead of a solve. Index entries are validated when they are
+    taken, so transporters that went inactive or started resting, and
+    requests that were assigned elsewhere, are simply skipped.
+    """
+
+    def __init__(self, transport_manager, assignment_handler):
+        """
+        Args:
+            transport_manager: TransportManager owning the transporters
+            assignment_handler: TransportAssignmentHandler that starts the transports
+        """
+        self.tm = transport_manager
+        self.handler = assignment_handler
+        self.distances = DistanceMatrix.for_graph(transport_manager.hospital.get_graph())
+
+        self.idle = LocationIndex(self.distances)
+        self.pending_urgent = LocationIndex(self.distances)
+        self.pending_regular = LocationIndex(self.distances)
+        self.dispatched = 0
+
+    def rebuild(self, transporters, pending_requests):
+        """Index the current idle transporters and pending requests, then match them."""
+        self._refresh_distances()
+        self.idle = LocationIndex(self.distances)
+        self.pending_urgent = LocationIndex(self.distances)
+        self.pending_regular = LocationIndex(self.distances)
+
+        for request in sorted(pending_requests, key=lambda r: r.request_time):
+            self._pending_index(request).add(request.id, request.origin, request)
+        for transporter in transporters:
+            self.on_transporter_free(transporter)
+
+    def on_request(self, request):
+        """
+        Dispatch an arriving request to the nearest idle transporter, or keep it pending.
+
+        Returns:
+            PatientTransporter or None: The transporter the request was assigned to
+        """
+        self._refresh_distances()
+        while True:
+            entry = self.idle.pop_nearest(request.origin)
+            if entry is None:
+                self._pending_index(request).add(request.id, request.origin, request)
+                return None
+            transporter = entry[1]
+            if self._is_available(transporter):
+                self._assign(transporter, request)
+                return transporter
+
+    def on_transporter_free(self, transporter):
+        """
+        Give a transporter that became free the best pending request, or mark it idle.
+
+        Returns:
+            TransportationRequest or None: The request the transporter took
+        """
+        self.idle.remove(transporter.name)
+        if not self._is_available(transporter):
+            return None
+
+        self._refresh_distances()
+        for index in (self.pending_urgent, self.pending_regular):
+            while True:
+                entry = index.pop_nearest(transporter.current_location)
+                if entry is None:
+                    break
+                request = entry[1]
+                if request.status == "pending":
+                    self._assign(transporter, request)
+                    return request
+
+        self.idle.add(transporter.name, transporter.current_location, transporter)
+        return None
+
+    def on_transporter_unavailable(self, transporter):
+        self.idle.remove(transporter.name)
+
+    def get_status(self):
+        return {
+            "idle_transporters": len(self.idle),
+            "pending_urgent": len(self.pending_urgent),
+            "pending_regular": len(self.pending_regular),
+            "dispatched": self.dispatched,
+        }
+
+    def _assign(self, transporter, request):
+        self.dispatched += 1
+        self.handler.assign(transporter, request)
+
+    def _pending_index(self, request):
+        return self.pending_urgent if request.urgent else self.pending_regular
+
+    def _is_available(self, transporter):
+        return (transporter.status != "inactive" and not transporter.is_busy and
+                not transporter.shift_manager.resting)
+
+    def _refresh_distances(self):
+        # The graph may have changed; DistanceMatrix.for_graph caches per graph version
+        distances = DistanceMatrix.for_graph(self.tm.hospital.get_graph())
+        if distances is not self.distances:
+            self.distances = distances
+            for index in (self.idle, self.pending_urgent, self.pending_regular):
+                index.distances, index._orders = distances, {}
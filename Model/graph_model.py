@@ -6,17 +6,20 @@ class Graph:
         self.adjacency_list = {}
         self.coordinates = {}  # NEW: Store coordinates for each node
         self.directed = directed
+        self.version = 0  # Bumped on every change so cached distance data can be invalidated
 
     def add_node(self, node, x=None, y=None):
         """Adds a node to the graph with optional coordinates."""
         if node not in self.adjacency_list:
             self.adjacency_list[node] = {}
             self.coordinates[node] = (x, y) if x is not None and y is not None else (0, 0)
+            self.version += 1
 
     def set_node_coordinates(self, node, x, y):
         """Sets fixed coordinates for a node."""
         if node in self.adjacency_list:
             self.coordinates[node] = (x, y)
+            self.version += 1
 
     def get_node_coordinates(self, node):
         """Returns the coordinates of a node."""
@@ -32,6 +35,7 @@ class Graph:
         self.adjacency_list[node1][node2] = weight
         if not self.directed:
             self.adjacency_list[node2][node1] = weight
+        self.version += 1
 
     def get_hospital_graph(self):
         """Returns graph data including nodes, edges, and positions with slight randomness."""
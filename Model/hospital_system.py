@@ -205,7 +205,7 @@ class HospitalSystem:
         self.enable_optimized_mode(ILPMode.MAKESPAN)
 
     def reset_transporters(self, count):
-        self.transport_manager.transporters.clear()
+        self.transport_manager.clear_transporters()
 
         for i in range(count):
             name = f"Sim_Transporter_{i + 1}"
@@ -1,7 +1,11 @@
+import numbers
+
 import eventlet
 from Model.Assignment_strategies.ILP.ilp_optimizer_strategy import ILPOptimizerStrategy
 from Model.Assignment_strategies.assignment_strategy import AssignmentStrategy
 from Model.assignment_executor import AssignmentExecutor
+from Model.batch_dispatcher import BatchDispatcher
+from Model.event_dispatcher import EventDispatcher
 from Model.model_transportation_request import TransportationRequest
 from Model.transport_assignment_handler import TransportAssignmentHandler
 from Model.Assignment_strategies.strategy_registry import STRATEGY_REGISTRY
@@ -9,6 +13,9 @@ from Model.simulation_state import SimulationState
 
 
 class TransportManager:
+    # "optimize": re-run the assignment strategy on new work; "event": dispatch each event online
+    DISPATCH_MODES = ("optimize", "event")
+
     def __init__(self, hospital, socketio):
         self.hospital = hospital
         self.socketio = socketio
@@ -18,6 +25,12 @@ class TransportManager:
         self.assignment_handler = TransportAssignmentHandler(socketio, self)
         self.simulation_running = False
         self.state = SimulationState.READY
+        self.dispatch_mode = "optimize"
+        self.event_dispatcher = None
+        self.batch_dispatcher = BatchDispatcher(self)
+        self.solver_stats = {"solves": 0, "coalesced": 0, "cpu_seconds": 0.0, "wall_seconds": 0.0}
+        self.solve_running = False
+        self.solve_requested = False
 
     def set_state(self, new_state, emit_notification=True):
         """Change the system state with proper notification"""
@@ -57,15 +70,100 @@ class TransportManager:
     def get_available_strategy_names(self):
         return list(STRATEGY_REGISTRY.keys())
 
+    def get_strategy_statistics(self):
+        return {
+            "strategy": self.assignment_strategy.__class__.__name__,
+            "statistics": self.assignment_strategy.get_statistics()
+        }
+
+    def set_dispatch_mode(self, mode: str):
+        if mode not in self.DISPATCH_MODES:
+            return {"error": f"❌ Unknown dispatch mode: {mode}"}, 400
+
+        self.dispatch_mode = mode
+        if mode == "event":
+            # The event dispatcher picks up the requests still waiting for their batch
+            self.batch_dispatcher.clear()
+            # Start from the current situation: idle transporters take the pending requests
+            self.event_dispatcher = EventDispatcher(self, self.assignment_handler)
+            self.event_dispatcher.rebuild(self.transporters, TransportationRequest.pending_requests)
+        else:
+            self.event_dispatcher = None
+
+        self.socketio.emit("transport_log", {"message": f"⚙️ Dispatch mode switched to: {mode}"})
+        return {"status": f"✅ Dispatch mode set to: {mode}"}, 200
+
+    def set_batch_policy(self, window_seconds=None, max_batch_size=None, flush_on_urgent=None):
+        if window_seconds is not None and not self._is_number(window_seconds, numbers.Real):
+            return {"error": "❌ Batch window must be a number of seconds"}, 400
+        if max_batch_size is not None and not self._is_number(max_batch_size, numbers.Integral):
+            return {"error": "❌ Batch size must be a whole number"}, 400
+        if flush_on_urgent is not None and not isinstance(flush_on_urgent, bool):
+            return {"error": "❌ Flush on urgent must be true or false"}, 400
+        if window_seconds is not None and window_seconds < 0:
+            return {"error": "❌ Batch window must not be negative"}, 400
+        if max_batch_size is not None and max_batch_size < 0:
+            return {"error": "❌ Batch size must not be negative"}, 400
+
+        self.batch_dispatcher.configure(window_seconds, max_batch_size, flush_on_urgent)
+        policy = self.batch_dispatcher.get_status()
+        self.socketio.emit("transport_log", {
+            "message": f"⚙️ Batch dispatch: window {policy['window_seconds']}s, "
+                       f"max size {policy['max_batch_size'] or '-'}, flush on urgent {policy['flush_on_urgent']}"
+        })
+        return {"status": "✅ Batch policy updated"}, 200
+
+    @staticmethod
+    def _is_number(value, kind):
+        # JSON true/false arrive as bool, which Python counts as an integer
+        return isinstance(value, kind) and not isinstance(value, bool)
+
+    def get_dispatch_status(self):
+        status = {"mode": self.dispatch_mode, "solver": dict(self.solver_stats)}
+        if self.event_dispatcher:
+            status.update(self.event_dispatcher.get_status())
+        else:
+            status["batch"] = self.batch_dispatcher.get_status()
+        return status
+
+    def handle_new_request(self, request):
+        """Dispatch a newly arrived request according to the dispatch mode."""
+        if self.dispatch_mode == "event":
+            # Already dispatched on creation
+            return
+        self.batch_dispatcher.add(request)
+
     def deploy_strategy_assignment(self):
-        eventlet.spawn_n(self.execute_assignment_plan)
+        if self.dispatch_mode == "event":
+            return {"status": "⚡ Event dispatch mode: requests are dispatched as they arrive."}
+        # One solve at a time: deployments during a running solve are coalesced
+        # into a single re-run that picks up every request that arrived meanwhile
+        self.solve_requested = True
+        if self.solve_running:
+            self.solver_stats["coalesced"] += 1
+            return {"status": "⏳ Assignment running, the new requests follow in the next run."}
+        self.solve_running = True
+        eventlet.spawn_n(self._run_solves)
         return {"status": "🚀 Assignment strategy deployed!"}
 
+    def _run_solves(self):
+        try:
+            while self.solve_requested:
+                self.solve_requested = False
+                self.execute_assignment_plan()
+        finally:
+            self.solve_running = False
+            self.solve_requested = False
+
     def execute_assignment_plan(self):
         assignable_requests = TransportationRequest.get_assignable_requests()
         executor = AssignmentExecutor(self, self.socketio, self.assignment_strategy, assignable_requests)
         executor.run()
 
+        self.solver_stats["solves"] += 1
+        self.solver_stats["cpu_seconds"] += executor.solver_clock.cpu_seconds
+        self.solver_stats["wall_seconds"] += executor.solver_clock.wall_seconds
+
     def get_assignable_requests(self):
         assignable = set(r for r in TransportationRequest.pending_requests if r.is_reassignable())
         for t in self.transporters:
@@ -89,13 +187,21 @@ class TransportManager:
             "message": f"🆕 {transporter.name} added at {transporter.current_location} and is ready for assignments."
         })
 
+        if self.dispatch_mode == "event":
+            self.event_dispatcher.on_transporter_free(transporter)
         # Only auto-deploy if in RUNNING state and we have assignable work
-        if self.state == SimulationState.RUNNING and self.has_assignable_work():
+        elif self.state == SimulationState.RUNNING and self.has_assignable_work():
             self.socketio.emit("transport_log", {
                 "message": f"🔁 Re-optimizing all assignments after adding {transporter.name}"
             })
             self.deploy_strategy_assignment()
 
+    def clear_transporters(self):
+        self.transporters.clear()
+        if self.dispatch_mode == "event":
+            # Forget the removed transporters, keep the pending requests
+            self.event_dispatcher.rebuild(self.transporters, TransportationRequest.pending_requests)
+
     def get_transporter(self, name):
         return next((t for t in self.transporters if t.name == name), None)
 
@@ -110,6 +216,11 @@ class TransportManager:
         if not t:
             return {"error": f"🚫 Transporter {name} not found"}
         t.set_active() if status == "active" else t.set_inactive()
+        if self.dispatch_mode == "event":
+            if status == "active":
+                self.event_dispatcher.on_transporter_free(t)
+            else:
+                self.event_dispatcher.on_transporter_unavailable(t)
         return {"status": f"🔄 {name} is now {status}"}
 
     def assign_transport(self, transporter_name, request_obj):
@@ -163,8 +274,8 @@ class TransportManager:
             self.socketio.emit("transport_log", {
                 "message": f"☀️ {transporter.name} is now rested and ready for new assignments!"
             })
-            if self.simulation and self.simulation.is_running():
-                eventlet.spawn_n(self.execute_assignment_plan)
+            if self.simulation and self.simulation.is_running() and self.dispatch_mode == "optimize":
+                self.deploy_strategy_assignment()
 
         if transporter.task_queue:
             next_request = transporter.task_queue.pop(0)
@@ -174,6 +285,8 @@ class TransportManager:
         else:
             transporter.current_task = None
             transporter.is_busy = False
+            if self.dispatch_mode == "event":
+                self.event_dispatcher.on_transporter_free(transporter)
 
     def return_home(self, transporter_name):
         transporter = self.get_transporter(transporter_name)
@@ -187,10 +300,16 @@ class TransportManager:
             return {"error": f"No valid path to Transporter Lounge for {transporter_name}"}, 400
 
         transporter.move_to("Transporter Lounge")
+        if self.dispatch_mode == "event":
+            # Re-index the transporter at its new location
+            self.event_dispatcher.on_transporter_free(transporter)
         return {"status": f"{transporter_name} has returned to the lounge."}
 
     def create_transport_request(self, origin, destination, transport_type="stretcher", urgent=False):
-        return TransportationRequest.create(origin, destination, transport_type, urgent)
+        request = TransportationRequest.create(origin, destination, transport_type, urgent)
+        if self.dispatch_mode == "event":
+            self.event_dispatcher.on_request(request)
+        return request
 
     def remove_transport_request(self, request_key):
         TransportationRequest.remove_completed_request(request_key)
@@ -17,6 +17,7 @@ class TransportationRequest:
         self.request_time = request_time or time.time()
         self.has_started = False  # ✅ Track if the request has been started
         self.assigned_transporter = None
+        self.start_time = None  # When a transporter started on it
 
     def assign_transporter_to_request(self, transporter):
         self.assigned_transporter = transporter
@@ -27,6 +28,8 @@ class TransportationRequest:
     def mark_as_ongoing(self):
         self.status = "ongoing"
         self.has_started = True  # ✅ Mark it as started
+        if self.start_time is None:
+            self.start_time = time.time()
         if self in TransportationRequest.pending_requests:
             TransportationRequest.pending_requests.remove(self)
         if self not in TransportationRequest.ongoing_requests:
@@ -54,6 +54,6 @@ class Simulation:
 
             print(f"🧪 [Simulation] Request: {origin} ➝ {destination} ({transport_type}, urgent={urgent})")
 
-            self.system.transport_manager.deploy_strategy_assignment()
+            self.system.transport_manager.handle_new_request(request)
 
             eventlet.sleep(self.interval)
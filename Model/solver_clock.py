@@ -0,0 +1,58 @@
+import os
+import time
+
+import greenlet
+
+
+class SolverClock:
+    """
+    CPU and wall time spent by one green thread inside the assignment strategy.
+
+    The clock runs only between start() and stop(), and pauses whenever the
+    green thread switches to another one, e.g. on an eventlet.sleep(0) in an
+    anytime strategy, so work done by other green threads in the meantime is
+    not counted. CPU time includes reaped child processes, e.g. the CBC solver
+    behind the ILP strategies and the worker processes of parallel strategies.
+    """
+
+    def __init__(self):
+        self.cpu_seconds = 0.0
+        self.wall_seconds = 0.0
+        self.greenlet = None
+        self._started = None
+        self._previous_trace = None
+
+    def start(self):
+        self.greenlet = greenlet.getcurrent()
+        self._previous_trace = greenlet.settrace(self._trace)
+        self._resume()
+
+    def stop(self):
+        self._pause()
+        greenlet.settrace(self._previous_trace)
+        self._previous_trace = None
+
+    def _trace(self, event, args):
+        origin, target = args
+        if origin is self.greenlet:
+            self._pause()
+        elif target is self.greenlet:
+            self._resume()
+        if self._previous_trace is not None:
+            self._previous_trace(event, args)
+
+    def _resume(self):
+        self._started = (self._cpu_time(), time.time())
+
+    def _pause(self):
+        if self._started is None:
+            return
+        start_cpu, start_wall = self._started
+        self.cpu_seconds += self._cpu_time() - start_cpu
+        self.wall_seconds += time.time() - start_wall
+        self._started = None
+
+    @staticmethod
+    def _cpu_time():
+        times = os.times()
+        return times.user + times.system + times.children_user + times.children_system
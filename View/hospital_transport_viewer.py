@@ -34,6 +34,10 @@ class HospitalTransportViewer:
         self.app.add_url_rule("/update_simulator_config", "update_simulator_config", self.update_simulator_config, methods=["POST"])
         self.app.add_url_rule("/set_strategy_by_name", "set_strategy_by_name", self.set_strategy_by_name, methods=["POST"])
         self.app.add_url_rule("/get_available_strategies", "get_available_strategies", self.get_available_strategies)
+        self.app.add_url_rule("/get_strategy_statistics", "get_strategy_statistics", self.get_strategy_statistics)
+        self.app.add_url_rule("/set_dispatch_mode", "set_dispatch_mode", self.set_dispatch_mode, methods=["POST"])
+        self.app.add_url_rule("/get_dispatch_status", "get_dispatch_status", self.get_dispatch_status)
+        self.app.add_url_rule("/set_batch_policy", "set_batch_policy", self.set_batch_policy, methods=["POST"])
 
     # --- Pages ---
 
@@ -76,6 +80,21 @@ class HospitalTransportViewer:
         result = self.system.transport_manager.set_strategy_by_name(strategy)
         return jsonify(result)
 
+    def set_dispatch_mode(self):
+        data = request.get_json()
+        mode = data.get("mode")
+        if not mode:
+            return jsonify({"error": "Dispatch mode is required"}), 400
+
+        result, status = self.system.transport_manager.set_dispatch_mode(mode)
+        return jsonify(result), status
+
+    def set_batch_policy(self):
+        data = request.get_json()
+        result, status = self.system.transport_manager.set_batch_policy(
+            data.get("window_seconds"), data.get("max_batch_size"), data.get("flush_on_urgent"))
+        return jsonify(result), status
+
     # --- Transporter Management ---
 
     def add_transporter(self):
@@ -167,4 +186,10 @@ class HospitalTransportViewer:
     def get_available_strategies(self):
         strategies = self.system.transport_manager.get_available_strategy_names()
         print(strategies)
-        return jsonify(strategies)
\ No newline at end of file
+        return jsonify(strategies)
+
+    def get_strategy_statistics(self):
+        return jsonify(self.system.transport_manager.get_strategy_statistics())
+
+    def get_dispatch_status(self):
+        return jsonify(self.system.transport_manager.get_dispatch_status())
@@ -0,0 +1,90 @@
+"""
+Compares ALNS with the greedy insertion start plan and with ILP: Makespan on
+the Complex benchmark scenario and on larger random request sets, including
+one on a synthetic hospital: time to build a plan and the makespan of that plan.
+
+Run from the repository root:
+    python -m benchmark.alns_benchmark
+"""
+import logging
+import random
+import time
+
+from benchmark.scenario_factory import MockSocketIO, create_system, random_requests, synthetic_hospital
+from Model.Assignment_strategies.ALNS.alns import ALNS
+from Model.Assignment_strategies.Greedy.greedy_insertion import GreedyInsertion
+from Model.Assignment_strategies.ILP.ilp_optimizer_strategy import ILPOptimizerStrategy
+from Model.Assignment_strategies.ILP.ilp_mode import ILPMode
+from Model.Assignment_strategies.plan_evaluator import PlanEvaluator
+from Model.model_patient_transporters import PatientTransporter
+from Model.model_transportation_request import TransportationRequest
+from new_backend_benchmark.benchmark_model import BenchmarkModel
+
+RANDOM_CASES = [(10, 50), (20, 100), (50, 400)]  # (transporters, requests)
+SYNTHETIC_CASE = (200, 20, 100)  # (departments, transporters, requests)
+ALNS_TIME_LIMIT = 2
+ILP_TIME_LIMIT = 60
+
+
+def complex_case():
+    system = create_system(5)
+    # Leave out the departments the standard hospital lacks, which the ILP rejects
+    requests = [TransportationRequest(origin, destination, "stretcher", urgent)
+                for origin, destination, urgent in BenchmarkModel(system).scenarios["Complex"]
+                if origin in system.hospital.departments and destination in system.hospital.departments]
+    return "Complex", system.transport_manager.get_transporter_objects(), requests, system.hospital.get_graph()
+
+
+def random_case(num_transporters, num_requests):
+    system = create_system(num_transporters)
+    requests = random_requests(system, num_requests, seed=num_transporters)
+    return "Random", system.transport_manager.get_transporter_objects(), requests, system.hospital.get_graph()
+
+
+def synthetic_case(num_departments, num_transporters, num_requests):
+    hospital = synthetic_hospital(num_departments, seed=num_departments)
+    transporters = [PatientTransporter(hospital, f"Sim_Transporter_{i}", MockSocketIO())
+                    for i in range(num_transporters)]
+    rng = random.Random(num_departments)
+    departments = hospital.departments[1:]
+    requests = [TransportationRequest(*rng.sample(departments, 2), "stretcher", rng.random() < 0.3)
+                for _ in range(num_requests)]
+    return f"Synthetic ({num_departments})", transporters, requests, hospital.get_graph()
+
+
+def run_case(label, transporters, requests, graph):
+    evaluator = PlanEvaluator(transporters, graph)
+    cells = []
+
+    start = time.perf_counter()
+    plan = GreedyInsertion(transporters, requests, graph).generate_assignment_plan()
+    cells.append((time.perf_counter() - start, evaluator.evaluate(plan)["makespan"]))
+
+    alns = ALNS(transporters, requests, graph, time_limit_seconds=ALNS_TIME_LIMIT, seed=0)
+    start = time.perf_counter()
+    plan = alns.run()
+    cells.append((time.perf_counter() - start, evaluator.evaluate(plan)["makespan"]))
+
+    strategy = ILPOptimizerStrategy(ILPMode.MAKESPAN, time_limit=ILP_TIME_LIMIT)
+    start = time.perf_counter()
+    plan = strategy.generate_assignment_plan(transporters, requests, graph)
+    cells.append((time.perf_counter() - start, evaluator.evaluate(plan)["makespan"]))
+
+    print(f"{label:<16} {len(transporters):>4} {len(requests):>5} | " +
+          " | ".join(f"{elapsed:>8.3f} {makespan:>9.1f}" for elapsed, makespan in cells) +
+          f" | {alns.iterations:>6}", flush=True)
+
+
+def main():
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"{'scenario':<16} {'T':>4} {'R':>5} | {'greedy (s)':>8} {'makespan':>9} | {'ALNS (s)':>8} {'makespan':>9} | "
+          f"{'ILP (s)':>8} {'makespan':>9} | {'iters':>6}")
+    run_case(*complex_case())
+    for num_transporters, num_requests in RANDOM_CASES:
+        run_case(*random_case(num_transporters, num_requests))
+    run_case(*synthetic_case(*SYNTHETIC_CASE))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Trade-off of the batch dispatch window: runs the simulator on the standard
+hospital with the default strategy for a range of batch windows and reports
+the number of solves, the solver CPU time and the time requests wait before
+a transporter starts on them.
+
+The simulator runs in real time, so the benchmark shrinks simulated time by
+TIME_SCALE: corridor lengths, the request interval and the batch windows are
+all multiplied by it, and measured waits are divided by it again. Solver time
+is not scaled, so solver stalls weigh 1 / TIME_SCALE times more in the waits
+than they would in the hospital. Requests still waiting when a run ends count
+with the time they have waited so far.
+
+Run from the repository root:
+    python -m benchmark.batch_window_benchmark
+"""
+import contextlib
+import io
+import logging
+import random
+
+import eventlet
+
+from benchmark.scenario_factory import create_system
+from Model.model_transportation_request import TransportationRequest
+
+TIME_SCALE = 0.1
+NUM_TRANSPORTERS = 8
+REQUEST_INTERVAL = 5  # simulated seconds between arrivals
+DURATION = 400  # simulated seconds per run
+CASES = [(0, True), (5, False), (15, False), (30, False), (60, False), (30, True)]  # (window, flush on urgent)
+
+
+def run_case(window, flush_on_urgent, seed=0):
+    TransportationRequest.pending_requests.clear()
+    TransportationRequest.ongoing_requests.clear()
+    TransportationRequest.completed_requests.clear()
+    random.seed(seed)
+
+    system = create_system(NUM_TRANSPORTERS)
+    hospital = system.hospital
+    for dept1, neighbours in list(hospital.get_graph().adjacency_list.items()):
+        for dept2, distance in list(neighbours.items()):
+            if dept1 < dept2:
+                hospital.add_corridor(dept1, dept2, distance * TIME_SCALE)
+
+    tm = system.transport_manager
+    tm.set_batch_policy(window * TIME_SCALE, None, flush_on_urgent)
+
+    # The simulator prints every setting, request and transport
+    with contextlib.redirect_stdout(io.StringIO()):
+        system.simulation.set_request_interval(REQUEST_INTERVAL * TIME_SCALE)
+        system.simulation.start()
+        eventlet.sleep(DURATION * TIME_SCALE)
+        system.simulation.stop()
+        tm.batch_dispatcher.clear()
+    end_time = max(r.request_time for r in tm.get_all_requests()) + REQUEST_INTERVAL * TIME_SCALE
+
+    waits = sorted(((r.start_time or end_time) - r.request_time) / TIME_SCALE for r in tm.get_all_requests())
+    solver = tm.get_dispatch_status()["solver"]
+    print(f"{window:>6} {'yes' if flush_on_urgent else 'no':>6} | {len(waits):>8} {solver['solves']:>6} "
+          f"{solver['cpu_seconds']:>8.2f} {solver['cpu_seconds'] / len(waits) * 1000:>9.1f} | "
+          f"{sum(waits) / len(waits):>8.1f} {waits[int(0.9 * len(waits))]:>8.1f} "
+          f"{sum(r.start_time is None for r in tm.get_all_requests()):>8}", flush=True)
+
+
+def main():
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"{'window':>6} {'urgent':>6} | {'requests':>8} {'solves':>6} {'cpu (s)':>8} {'ms/req':>9} | "
+          f"{'wait':>8} {'p90 wait':>8} {'waiting':>8}")
+    for window, flush_on_urgent in CASES:
+        run_case(window, flush_on_urgent)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Measures ClusterBasedILP preprocessing_time (distance matrix) and
+clustering_time for spectral, k-means and hierarchical clustering on synthetic
+hospitals of increasing size.
+
+Run from the repository root:
+    python -m benchmark.cluster_preprocessing_benchmark
+"""
+import random
+import time
+
+from benchmark.scenario_factory import MockSocketIO, synthetic_hospital
+from Model.model_patient_transporters import PatientTransporter
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.ILP.cluster_based_ilp import ClusterBasedILP
+
+DEPARTMENT_COUNTS = [50, 200, 1000]
+CLUSTERING_METHODS = ["spectral", "kmeans", "hierarchical"]
+NUM_TRANSPORTERS = 20
+
+
+def run_case(num_departments, clustering_method):
+    hospital = synthetic_hospital(num_departments, seed=num_departments)
+    transporters = [PatientTransporter(hospital, f"Sim_Transporter_{i}", MockSocketIO())
+                    for i in range(NUM_TRANSPORTERS)]
+
+    # One request out of every department, so all of them take part in the clustering
+    rng = random.Random(num_departments)
+    requests = [TransportationRequest(dept, rng.choice(hospital.departments), "stretcher", False)
+                for dept in hospital.departments]
+
+    ilp = ClusterBasedILP(transporters, requests, hospital.get_graph(), clustering_method=clustering_method)
+
+    start = time.time()
+    ilp._preprocess_data()
+    ilp.preprocessing_time = time.time() - start
+
+    start = time.time()
+    ilp._generate_clusters()
+    ilp.clustering_time = time.time() - start
+
+    return ilp
+
+
+def main():
+    print(f"{'depts':>6} {'method':>13} {'clusters':>9} {'preprocessing (s)':>18} {'clustering (s)':>15}")
+    for num_departments in DEPARTMENT_COUNTS:
+        for method in CLUSTERING_METHODS:
+            ilp = run_case(num_departments, method)
+            print(f"{num_departments:>6} {method:>13} {len(ilp.clusters):>9} "
+                  f"{ilp.preprocessing_time:>18.3f} {ilp.clustering_time:>15.3f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
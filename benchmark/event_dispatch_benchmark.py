@@ -0,0 +1,96 @@
+"""
+Measures the event dispatcher on large synthetic hospitals: a discrete-event
+simulation of one hour of arrivals, where every arrival and every finished
+transport is one dispatch decision. Reports the wall time per decision and
+the simulated waiting time of the requests.
+
+Run from the repository root:
+    python -m benchmark.event_dispatch_benchmark
+"""
+import heapq
+import logging
+import random
+import time
+from types import SimpleNamespace
+
+from benchmark.scenario_factory import MockSocketIO, synthetic_hospital
+from Model.event_dispatcher import EventDispatcher
+from Model.model_patient_transporters import PatientTransporter
+from Model.model_transportation_request import TransportationRequest
+
+CASES = [(100, 100, 2000), (200, 500, 10000), (200, 200, 10000), (500, 2000, 40000), (500, 800, 40000)]  # (departments, transporters, requests per hour)
+URGENT_SHARE = 0.2
+HOUR = 3600
+
+
+class SimulatedHandler:
+    """Stands in for TransportAssignmentHandler: books the transport on the simulated clock."""
+
+    def __init__(self, distances):
+        self.distances = distances
+        self.now = 0.0
+        self.events = []  # (finish time, sequence, transporter)
+        self.waits = []
+
+    def assign(self, transporter, request):
+        request.assign_transporter_to_request(transporter)
+        request.status = "ongoing"
+        transporter.current_task, transporter.is_busy = request, True
+
+        duration = (self.distances.distance(transporter.current_location, request.origin) +
+                    self.distances.distance(request.origin, request.destination))
+        self.waits.append(self.now - request.request_time)
+        heapq.heappush(self.events, (self.now + duration, len(self.waits), transporter))
+
+
+def run_case(num_departments, num_transporters, requests_per_hour, seed=0):
+    rng = random.Random(seed)
+    hospital = synthetic_hospital(num_departments, seed=seed)
+    departments = [d for d in hospital.departments if d != "Transporter Lounge"]
+    socketio = MockSocketIO()
+
+    transporters = [PatientTransporter(hospital, f"T{i}", socketio, rng.choice(departments))
+                    for i in range(num_transporters)]
+    arrivals = sorted(rng.uniform(0, HOUR) for _ in range(requests_per_hour))
+
+    dispatcher = EventDispatcher(SimpleNamespace(hospital=hospital), None)
+    handler = dispatcher.handler = SimulatedHandler(dispatcher.distances)
+    dispatcher.rebuild(transporters, [])
+
+    latencies = []
+    for arrival in arrivals:
+        # Finish the transports that end before this arrival
+        while handler.events and handler.events[0][0] <= arrival:
+            handler.now, _, transporter = heapq.heappop(handler.events)
+            transporter.current_location = transporter.current_task.destination
+            transporter.current_task, transporter.is_busy = None, False
+            start = time.perf_counter()
+            dispatcher.on_transporter_free(transporter)
+            latencies.append(time.perf_counter() - start)
+
+        handler.now = arrival
+        origin, destination = rng.sample(departments, 2)
+        request = TransportationRequest(origin, destination, "stretcher", rng.random() < URGENT_SHARE,
+                                        request_time=arrival)
+        start = time.perf_counter()
+        dispatcher.on_request(request)
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    waits = handler.waits
+    print(f"{num_departments:>6} {num_transporters:>6} {requests_per_hour:>7} | {len(latencies):>9} "
+          f"{sum(latencies) / len(latencies) * 1e6:>9.1f} {latencies[int(0.99 * len(latencies))] * 1e6:>9.1f} "
+          f"{sum(latencies):>8.3f} | {len(waits):>8} {sum(waits) / max(1, len(waits)):>9.1f}", flush=True)
+
+
+def main():
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"{'depts':>6} {'T':>6} {'R/hour':>7} | {'decisions':>9} {'mean (us)':>9} {'p99 (us)':>9} "
+          f"{'total (s)':>8} | {'assigned':>8} {'wait (s)':>9}")
+    for num_departments, num_transporters, requests_per_hour in CASES:
+        run_case(num_departments, num_transporters, requests_per_hour)
+
+
+if __name__ == "__main__":
+    main()
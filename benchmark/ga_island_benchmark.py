@@ -0,0 +1,59 @@
+"""
+Compares a single GA population with the island model under the same
+wall-clock budget. Fitness is the GA objective (lower is better).
+
+Run from the repository root:
+    python -m benchmark.ga_island_benchmark
+"""
+import logging
+import random
+import time
+
+import numpy as np
+
+from benchmark.scenario_factory import create_system, random_requests
+from Model.Assignment_strategies.Genetic_algorithms.genetic_algorithm import GeneticAlgorithm
+from Model.Assignment_strategies.Genetic_algorithms.island_model import IslandModel
+
+CASES = [(10, 50), (20, 100), (30, 200)]  # (transporters, requests)
+ISLANDS = 4
+TIME_LIMIT = 5
+POPULATION_SIZE = 50
+
+
+def run_case(num_transporters, num_requests):
+    system = create_system(num_transporters)
+    transporters = system.transport_manager.get_transporter_objects()
+    requests = random_requests(system, num_requests, seed=num_transporters)
+    graph = system.hospital.get_graph()
+
+    random.seed(0)
+    np.random.seed(0)
+    single = GeneticAlgorithm(transporters, requests, graph, population_size=POPULATION_SIZE,
+                              generations=100000, time_limit_seconds=TIME_LIMIT, early_stopping=False)
+    start = time.time()
+    single.run()
+    single_elapsed = time.time() - start
+
+    islands = IslandModel(transporters, requests, graph, islands=ISLANDS, population_size=POPULATION_SIZE,
+                          generations=100000, time_limit_seconds=TIME_LIMIT, seed=0)
+    start = time.time()
+    islands.run()
+    islands_elapsed = time.time() - start
+
+    return single.best_fitness, single_elapsed, islands.best_fitness, islands_elapsed
+
+
+def main():
+    logging.getLogger('GeneticAlgorithm').setLevel(logging.WARNING)
+    logging.getLogger('IslandModel').setLevel(logging.WARNING)
+
+    print(f"{'T':>4} {'R':>5} | {'single fitness':>15} {'(s)':>6} | {f'{ISLANDS} islands fitness':>18} {'(s)':>6}")
+    for num_transporters, num_requests in CASES:
+        single, single_elapsed, islands, islands_elapsed = run_case(num_transporters, num_requests)
+        print(f"{num_transporters:>4} {num_requests:>5} | {single:>15.1f} {single_elapsed:>6.2f} | "
+              f"{islands:>18.1f} {islands_elapsed:>6.2f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Compares the plain GA with the memetic GA (local search on the elites every
+generation) under the same wall-clock budget. Fitness is the GA objective
+(lower is better); makespan is the longest route of the best individual.
+
+Run from the repository root:
+    python -m benchmark.ga_memetic_benchmark
+"""
+import logging
+import random
+
+import numpy as np
+
+from benchmark.scenario_factory import create_system, random_requests
+from Model.Assignment_strategies.Genetic_algorithms.genetic_algorithm import GeneticAlgorithm
+
+CASES = [(10, 50), (20, 100), (30, 150)]  # (transporters, requests)
+TIME_LIMIT = 5
+
+
+def run_case(num_transporters, num_requests, memetic):
+    system = create_system(num_transporters)
+    transporters = system.transport_manager.get_transporter_objects()
+    requests = random_requests(system, num_requests, seed=num_transporters)
+
+    random.seed(0)
+    np.random.seed(0)
+    ga = GeneticAlgorithm(transporters, requests, system.hospital.get_graph(), generations=100000,
+                          time_limit_seconds=TIME_LIMIT, early_stopping=False, memetic=memetic)
+    ga.run()
+
+    workloads, _ = ga._route_state(ga.best_solution)
+    return ga.best_fitness, workloads.max(), ga.current_generation + 1, ga.memetic_moves
+
+
+def main():
+    logging.getLogger('GeneticAlgorithm').setLevel(logging.WARNING)
+
+    print(f"{'T':>4} {'R':>5} | {'plain fitness':>13} {'makespan':>9} {'gens':>6} | "
+          f"{'memetic fitness':>15} {'makespan':>9} {'gens':>6} {'moves':>6}")
+    for num_transporters, num_requests in CASES:
+        plain = run_case(num_transporters, num_requests, memetic=False)
+        memetic = run_case(num_transporters, num_requests, memetic=True)
+        print(f"{num_transporters:>4} {num_requests:>5} | {plain[0]:>13.1f} {plain[1]:>9.1f} {plain[2]:>6} | "
+              f"{memetic[0]:>15.1f} {memetic[1]:>9.1f} {memetic[2]:>6} {memetic[3]:>6}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Measures GeneticAlgorithmStrategy over a sequence of small re-plans: each
+round a few requests are started (and leave the problem) and a few new ones
+arrive. Compares starting every round from scratch with carrying the
+previous population over.
+
+Run from the repository root:
+    python -m benchmark.ga_replan_benchmark
+"""
+import logging
+import random
+import time
+
+import numpy as np
+
+from benchmark.scenario_factory import create_system, random_requests
+from Model.Assignment_strategies.Genetic_algorithms.genetic_algorithm_strategy import GeneticAlgorithmStrategy
+
+NUM_TRANSPORTERS = 20
+NUM_REQUESTS = 100
+ROUNDS = 8
+CHANGED_PER_ROUND = 5
+GENERATIONS = 100
+
+
+def run_rounds(persistent_population):
+    system = create_system(NUM_TRANSPORTERS)
+    transporters = system.transport_manager.get_transporter_objects()
+    graph = system.hospital.get_graph()
+    requests = random_requests(system, NUM_REQUESTS, seed=1)
+
+    random.seed(0)
+    np.random.seed(0)
+    strategy = GeneticAlgorithmStrategy(generations=GENERATIONS, time_limit_seconds=60,
+                                        persistent_population=persistent_population)
+    strategy.generate_assignment_plan(transporters, requests, graph)
+
+    rows = []
+    for round_number in range(1, ROUNDS + 1):
+        arrivals = random_requests(system, CHANGED_PER_ROUND, seed=100 + round_number)
+        requests = requests[CHANGED_PER_ROUND:] + arrivals
+
+        start = time.time()
+        strategy.generate_assignment_plan(transporters, requests, graph)
+        ga = strategy.algorithm
+        rows.append((ga.fitness_history[0], ga.best_fitness, ga.best_generation,
+                     ga.current_generation + 1, time.time() - start))
+    return rows
+
+
+def main():
+    logging.getLogger('GeneticAlgorithm').setLevel(logging.WARNING)
+
+    print(f"{'mode':>11} | {'initial best':>12} {'final best':>11} {'best at gen':>12} "
+          f"{'gens run':>9} {'time (s)':>9}   (means over {ROUNDS} re-plans)")
+    for persistent in (False, True):
+        rows = np.array(run_rounds(persistent))
+        initial, final, best_generation, generations_run, elapsed = rows.mean(axis=0)
+        mode = "persistent" if persistent else "fresh"
+        print(f"{mode:>11} | {initial:>12.1f} {final:>11.1f} {best_generation:>12.1f} "
+              f"{generations_run:>9.1f} {elapsed:>9.2f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Measures GeneticAlgorithm throughput (generations per second) and the best
+fitness reached for a fixed number of generations.
+
+Run from the repository root:
+    python -m benchmark.ga_throughput_benchmark
+"""
+import logging
+import random
+import time
+
+import numpy as np
+
+from benchmark.scenario_factory import create_system, random_requests
+from Model.Assignment_strategies.Genetic_algorithms.genetic_algorithm import GeneticAlgorithm
+
+CASES = [(10, 50), (20, 100), (50, 400)]  # (transporters, requests)
+POPULATION_SIZE = 50
+GENERATIONS = 100
+
+
+def run_case(num_transporters, num_requests, **ga_kwargs):
+    system = create_system(num_transporters)
+    transporters = system.transport_manager.get_transporter_objects()
+    requests = random_requests(system, num_requests, seed=num_transporters)
+
+    random.seed(0)
+    np.random.seed(0)
+    ga = GeneticAlgorithm(transporters, requests, system.hospital.get_graph(),
+                          population_size=POPULATION_SIZE, generations=GENERATIONS,
+                          time_limit_seconds=600, early_stopping=False, **ga_kwargs)
+
+    start = time.time()
+    ga.run()
+    elapsed = time.time() - start
+
+    generations_run = ga.current_generation + 1
+    return ga, generations_run / max(ga.evolution_time, 1e-9), elapsed
+
+
+def main():
+    logging.getLogger('GeneticAlgorithm').setLevel(logging.WARNING)
+
+    print(f"{'T':>4} {'R':>5} | {'gens/s':>8} {'fitness eval (s)':>17} {'total (s)':>10} {'best fitness':>13}")
+    for num_transporters, num_requests in CASES:
+        ga, gens_per_second, elapsed = run_case(num_transporters, num_requests)
+        print(f"{num_transporters:>4} {num_requests:>5} | {gens_per_second:>8.1f} {ga.fitness_eval_time:>17.3f} "
+              f"{elapsed:>10.2f} {ga.best_fitness:>13.1f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
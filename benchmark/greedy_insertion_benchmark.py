@@ -0,0 +1,72 @@
+"""
+Compares the Greedy Insertion strategy with ILP: Makespan on the benchmark
+scenarios of the benchmark UI and on larger random request sets: time to
+build a plan and the makespan of that plan.
+
+Run from the repository root:
+    python -m benchmark.greedy_insertion_benchmark
+"""
+import logging
+import time
+
+from benchmark.scenario_factory import create_system, random_requests
+from Model.Assignment_strategies.plan_evaluator import PlanEvaluator
+from Model.Assignment_strategies.strategy_registry import STRATEGY_REGISTRY
+from Model.model_transportation_request import TransportationRequest
+from new_backend_benchmark.benchmark_model import BenchmarkModel
+
+SCENARIO_TRANSPORTERS = [3, 5]
+RANDOM_CASES = [(10, 50), (20, 100), (50, 400)]  # (transporters, requests)
+STRATEGIES = ["Greedy Insertion", "ILP: Makespan"]
+GREEDY_REPEATS = 20
+
+
+def time_strategy(name, transporters, requests, graph):
+    """Return (best wall time in seconds, plan) of a strategy; the fast greedy one is repeated."""
+    repeats = GREEDY_REPEATS if name == "Greedy Insertion" else 1
+    best, plan = float('inf'), None
+    for _ in range(repeats):
+        strategy = STRATEGY_REGISTRY[name]()
+        start = time.perf_counter()
+        plan = strategy.generate_assignment_plan(transporters, requests, graph)
+        best = min(best, time.perf_counter() - start)
+    return best, plan
+
+
+def run_case(label, num_transporters, requests, system):
+    transporters = system.transport_manager.get_transporter_objects()
+    graph = system.hospital.get_graph()
+    evaluator = PlanEvaluator(transporters, graph)
+
+    cells = []
+    for name in STRATEGIES:
+        elapsed, plan = time_strategy(name, transporters, requests, graph)
+        cells.append(f"{elapsed * 1000:>10.2f} {evaluator.evaluate(plan)['makespan']:>9.1f}")
+    print(f"{label:<18} {num_transporters:>4} {len(requests):>5} | " + " | ".join(cells), flush=True)
+
+
+def main():
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"{'scenario':<18} {'T':>4} {'R':>5} | {'greedy (ms)':>10} {'makespan':>9} | "
+          f"{'ILP (ms)':>10} {'makespan':>9}")
+
+    scenarios = BenchmarkModel(create_system(1)).scenarios
+    for num_transporters in SCENARIO_TRANSPORTERS:
+        system = create_system(num_transporters)
+        for label, scenario in scenarios.items():
+            # The Complex scenario names departments the standard hospital lacks,
+            # which the ILP's pathfinder rejects
+            requests = [TransportationRequest(origin, destination, "stretcher", urgent)
+                        for origin, destination, urgent in scenario
+                        if origin in system.hospital.departments and destination in system.hospital.departments]
+            run_case(label, num_transporters, requests, system)
+
+    for num_transporters, num_requests in RANDOM_CASES:
+        system = create_system(num_transporters)
+        requests = random_requests(system, num_requests, seed=num_transporters)
+        run_case("Random", num_transporters, requests, system)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Measures how symmetry breaking affects exact ILPMakespan solve times when all
+transporters start out identical (as after HospitalSystem.reset_transporters).
+Symmetry breaking orders each group of identical transporters by the first
+request class they serve, see ILPCore.add_symmetry_breaking_constraints.
+
+Run from the repository root:
+    python -m benchmark.ilp_symmetry_benchmark
+"""
+import time
+
+import pulp
+
+from benchmark.scenario_factory import create_system, random_requests
+from Model.Assignment_strategies.ILP.ilp_makespan import ILPMakespan
+
+CASES = [(10, 15), (10, 20), (10, 30), (20, 30), (30, 45), (50, 75)]  # (transporters, requests)
+TIME_LIMIT = 60
+
+
+def run_case(num_transporters, num_requests, symmetry_breaking):
+    system = create_system(num_transporters)
+    transporters = system.transport_manager.get_transporter_objects()
+    requests = random_requests(system, num_requests, seed=num_transporters)
+
+    ilp = ILPMakespan(transporters, requests, system.hospital.get_graph(),
+                      symmetry_breaking=symmetry_breaking, lp_relaxation=False, time_limit=TIME_LIMIT)
+
+    start = time.time()
+    ilp.build_and_solve()
+    elapsed = time.time() - start
+
+    proven = ilp.model.sol_status == pulp.LpSolutionOptimal
+    return elapsed, pulp.value(ilp.model.objective), proven
+
+
+def main():
+    print(f"{'T':>4} {'R':>5} | {'plain (s)':>10} {'makespan':>9} | {'sym-break (s)':>13} {'makespan':>9} "
+          f"| {'speedup':>7}")
+    for num_transporters, num_requests in CASES:
+        plain = run_case(num_transporters, num_requests, symmetry_breaking=False)
+        broken = run_case(num_transporters, num_requests, symmetry_breaking=True)
+
+        def fmt(result):
+            elapsed, makespan, proven = result
+            return f"{elapsed:>9.2f}{' ' if proven else '*'} {makespan:>9.1f}"
+
+        speedup = plain[0] / broken[0] if broken[0] > 0 else float("inf")
+        print(f"{num_transporters:>4} {num_requests:>5} | {fmt(plain)} | {fmt(broken):>23} | {speedup:>6.1f}x")
+
+    print(f"* = stopped at the {TIME_LIMIT}s time limit without proving optimality")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Helpers for building benchmark systems outside of the Flask app.
+"""
+import math
+import random
+
+from Model.hospital_model import Hospital
+from Model.hospital_system import HospitalSystem
+from Model.model_transportation_request import TransportationRequest
+
+
+class MockSocketIO:
+    """Swallows all emits so benchmarks run without a frontend."""
+
+    def emit(self, *args, **kwargs):
+        pass
+
+
+def create_system(num_transporters):
+    """
+    Create a hospital system with the standard hospital layout.
+
+    Args:
+        num_transporters: Number of identical Sim_Transporter_i to add
+
+    Returns:
+        HospitalSystem: System with transporters waiting in the Transporter Lounge
+    """
+    system = HospitalSystem(MockSocketIO())
+    system._initialize_hospital()
+    system.reset_transporters(num_transporters)
+    return system
+
+
+def random_requests(system, count, urgent_share=0.3, seed=0):
+    """
+    Create random transport requests between departments of the system's hospital.
+
+    The requests are not registered in TransportationRequest.pending_requests.
+
+    Args:
+        system: HospitalSystem to draw departments from
+        count: Number of requests to create
+        urgent_share: Probability that a request is urgent
+        seed: Seed for reproducible scenarios
+
+    Returns:
+        list: TransportationRequest objects
+    """
+    rng = random.Random(seed)
+    departments = [d for d in system.hospital.departments if d != "Transporter Lounge"]
+
+    requests = []
+    for _ in range(count):
+        origin, destination = rng.sample(departments, 2)
+        requests.append(TransportationRequest(origin, destination, "stretcher", rng.random() < urgent_share))
+    return requests
+
+
+def synthetic_hospital(num_departments, seed=0):
+    """
+    Create a random hospital layout of a given size.
+
+    Departments are scattered over a 1000x1000 floor plan. Each one gets a
+    corridor to its nearest earlier department (so the layout is connected)
+    and to its two nearest neighbours overall. Corridor lengths are the
+    Euclidean distances divided by 10.
+
+    Args:
+        num_departments: Number of departments, including the Transporter Lounge
+        seed: Seed for reproducible layouts
+
+    Returns:
+        Hospital: Hospital whose first department is the Transporter Lounge
+    """
+    rng = random.Random(seed)
+    hospital = Hospital()
+    names = ["Transporter Lounge"] + [f"Department_{i}" for i in range(1, num_departments)]
+    points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in names]
+
+    for name, (x, y) in zip(names, points):
+        hospital.add_department(name)
+        hospital.graph.set_node_coordinates(name, x, y)
+
+    def length(i, j):
+        return max(1, round(math.dist(points[i], points[j]) / 10))
+
+    for i in range(1, len(names)):
+        nearest_earlier = min(range(i), key=lambda j: math.dist(points[i], points[j]))
+        hospital.add_corridor(names[i], names[nearest_earlier], length(i, nearest_earlier))
+
+        neighbours = sorted((j for j in range(len(names)) if j != i),
+                            key=lambda j: math.dist(points[i], points[j]))[:2]
+        for j in neighbours:
+            hospital.add_corridor(names[i], names[j], length(i, j))
+
+    return hospital
@@ -0,0 +1,87 @@
+"""
+Builds the latency/quality profile used by the "Auto" strategy: runs every
+routable strategy and time budget on a grid of instances and writes the
+results to Model/Assignment_strategies/Auto/strategy_profile.json.
+
+Run from the repository root:
+    python -m benchmark.strategy_profile_benchmark
+"""
+import logging
+import random
+import time
+
+from benchmark.scenario_factory import MockSocketIO, create_system, random_requests, synthetic_hospital
+from Model.Assignment_strategies.Auto.auto_strategy import ROUTABLE_STRATEGIES
+from Model.Assignment_strategies.Auto.strategy_profile import DEFAULT_PROFILE_PATH, StrategyProfile, instance_features
+from Model.Assignment_strategies.plan_evaluator import PlanEvaluator
+from Model.model_patient_transporters import PatientTransporter
+from Model.model_transportation_request import TransportationRequest
+
+# (strategy, time budget in seconds)
+CANDIDATES = [
+    ("Greedy Insertion", 0),
+    ("Hungarian Batch", 0),
+    ("ALNS", 0.5),
+    ("ALNS", 2),
+    ("Genetic Algorithm", 2),
+    ("ILP: Makespan", 10),
+]
+STANDARD_CASES = [(3, 10, 0.3), (5, 25, 0.3), (5, 25, 0.8), (10, 50, 0.3), (20, 100, 0.3), (30, 200, 0.3),
+                  (50, 400, 0.3)]  # (transporters, requests, urgent share)
+SYNTHETIC_CASES = [(200, 20, 100)]  # (departments, transporters, requests)
+
+
+def standard_instance(num_transporters, num_requests, urgent_share):
+    system = create_system(num_transporters)
+    requests = random_requests(system, num_requests, urgent_share=urgent_share, seed=num_transporters)
+    return system.transport_manager.get_transporter_objects(), requests, system.hospital.get_graph()
+
+
+def synthetic_instance(num_departments, num_transporters, num_requests):
+    hospital = synthetic_hospital(num_departments, seed=num_departments)
+    transporters = [PatientTransporter(hospital, f"Sim_Transporter_{i}", MockSocketIO())
+                    for i in range(num_transporters)]
+    rng = random.Random(num_departments)
+    requests = [TransportationRequest(*rng.sample(hospital.departments[1:], 2), "stretcher", rng.random() < 0.3)
+                for _ in range(num_requests)]
+    return transporters, requests, hospital.get_graph()
+
+
+def profile_instance(profile, transporters, requests, graph):
+    features = instance_features(transporters, requests, graph)
+    evaluator = PlanEvaluator(transporters, graph)
+
+    runs = []
+    for name, budget in CANDIDATES:
+        strategy = ROUTABLE_STRATEGIES[name](budget)
+        start = time.perf_counter()
+        plan = strategy.generate_assignment_plan(transporters, requests, graph)
+        runs.append((name, budget, time.perf_counter() - start, evaluator.evaluate(plan)["makespan"]))
+
+    best = min(makespan for *_, makespan in runs)
+    for name, budget, latency, makespan in runs:
+        profile.record(features, name, budget, latency, makespan / best if best else 1.0)
+        print(f"{features['transporters']:>4} {features['requests']:>5} {features['departments']:>6} "
+              f"{features['urgent_share']:>7.2f} | {name + ' @' + str(budget) + 's':<24} {latency:>9.3f} "
+              f"{makespan:>9.1f} {makespan / best if best else 1.0:>8.3f}", flush=True)
+
+
+def main():
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger('GeneticAlgorithm').setLevel(logging.WARNING)
+    profile = StrategyProfile(path=None)
+
+    print(f"{'T':>4} {'R':>5} {'depts':>6} {'urgent':>7} | {'strategy':<24} {'time (s)':>9} {'makespan':>9} "
+          f"{'quality':>8}")
+    for case in STANDARD_CASES:
+        profile_instance(profile, *standard_instance(*case))
+    for case in SYNTHETIC_CASES:
+        profile_instance(profile, *synthetic_instance(*case))
+
+    profile.path = DEFAULT_PROFILE_PATH
+    profile.save()
+    print(f"Wrote {len(profile.records)} records to {profile.path}")
+
+
+if __name__ == "__main__":
+    main()
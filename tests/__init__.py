@@ -0,0 +1,24 @@
+from unittest.mock import MagicMock
+
+from Model.hospital_model import Hospital
+from Model.model_patient_transporters import PatientTransporter
+
+# Departments of build_hospital() that requests travel between
+DEPARTMENTS = ["Emergency", "ICU", "Surgery", "Radiology"]
+
+
+def build_hospital():
+    """🧪 Small hospital with a lounge and four departments in a line."""
+    hospital = Hospital()
+    for dept in ["Transporter Lounge"] + DEPARTMENTS:
+        hospital.add_department(dept)
+    hospital.add_corridor("Transporter Lounge", "Emergency", 2)
+    hospital.add_corridor("Emergency", "ICU", 5)
+    hospital.add_corridor("ICU", "Surgery", 10)
+    hospital.add_corridor("Surgery", "Radiology", 7)
+    return hospital
+
+
+def build_transporters(hospital, names=("Anna", "Bob", "Cathy"), socketio=None):
+    """Transporters waiting in the lounge, sharing socketio (default: a fresh MagicMock each)."""
+    return [PatientTransporter(hospital, name, socketio or MagicMock()) for name in names]
@@ -0,0 +1,56 @@
+import random
+import unittest
+
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.ALNS.alns import ALNS
+from Model.Assignment_strategies.Greedy.greedy_insertion import GreedyInsertion
+from Model.Assignment_strategies.plan_evaluator import PlanEvaluator
+
+from tests import DEPARTMENTS, build_hospital, build_transporters
+
+
+class TestALNS(unittest.TestCase):
+    def setUp(self):
+        self.hospital = build_hospital()
+        self.transporters = build_transporters(self.hospital)
+        self.transporters[1].current_location = "Surgery"
+
+        rng = random.Random(11)
+        self.requests = [TransportationRequest(*rng.sample(DEPARTMENTS, 2), urgent=rng.random() < 0.3,
+                                               request_time=i + 1) for i in range(25)]
+
+    def test_search_keeps_plans_valid_and_never_worse_than_greedy(self):
+        graph = self.hospital.get_graph()
+        alns = ALNS(self.transporters, self.requests, graph, time_limit_seconds=60, max_iterations=300, seed=1)
+        plans = list(alns.run_anytime(report_interval=0))
+
+        evaluator = PlanEvaluator(self.transporters, graph)
+        greedy_plan = GreedyInsertion(self.transporters, self.requests, graph).generate_assignment_plan()
+        self.assertEqual(plans[0], greedy_plan)
+        self.assertLessEqual(evaluator.evaluate(plans[-1])["makespan"], evaluator.evaluate(greedy_plan)["makespan"])
+        self.assertEqual(alns.iterations, 300)
+
+        for plan in plans:
+            self.assertCountEqual([r.id for route in plan.values() for r in route], [r.id for r in self.requests])
+            for route in plan.values():
+                urgency = [r.urgent for r in route]
+                self.assertEqual(urgency, sorted(urgency, reverse=True))
+
+    def test_insertion_costs_match_best_feasible_position(self):
+        alns = ALNS(self.transporters, self.requests, self.hospital.get_graph())
+        route = [0, 3, 5, 8, 13]
+        route.sort(key=lambda q: not self.requests[q].urgent)
+        pending = [q for q in range(len(self.requests)) if q not in route]
+
+        deltas, positions = alns._insertion_costs(1, route, pending)
+        base = alns._route_load(1, route)
+        urgent_count = sum(self.requests[q].urgent for q in route)
+        for q, delta, position in zip(pending, deltas, positions):
+            allowed = range(urgent_count + 1) if self.requests[q].urgent else range(urgent_count, len(route) + 1)
+            best = min(alns._route_load(1, route[:p] + [q] + route[p:]) - base for p in allowed)
+            self.assertAlmostEqual(delta, best)
+            self.assertIn(position, allowed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import MagicMock
+
+from Model.assignment_executor import AssignmentExecutor
+from Model.hospital_model import Hospital
+from Model.model_patient_transporters import PatientTransporter
+from Model.model_transport_manager import TransportManager
+from Model.model_transportation_request import TransportationRequest
+
+
+class StreamingStrategy:
+    """Yields a fixed sequence of plans, like an anytime optimizer."""
+
+    def __init__(self, plans):
+        self.plans = plans
+
+    def generate_assignment_plans(self, transporters, requests, graph):
+        yield from self.plans
+
+    def get_optimizer(self, transporters, requests, graph):
+        return None
+
+
+class TestAssignmentExecutor(unittest.TestCase):
+    def setUp(self):
+        self.hospital = Hospital()
+        self.mock_socketio = MagicMock()
+        self.tm = TransportManager(self.hospital, self.mock_socketio)
+        self.tm.process_transport = MagicMock()
+        for name in ("Anna", "Bob"):
+            self.tm.add_transporter(PatientTransporter(self.hospital, name, self.mock_socketio))
+
+    def tearDown(self):
+        TransportationRequest.pending_requests.clear()
+        TransportationRequest.ongoing_requests.clear()
+        TransportationRequest.completed_requests.clear()
+
+    def test_streamed_plans_only_rearrange_unstarted_requests(self):
+        r1, r2, r3 = (self.tm.create_transport_request("ER", dest) for dest in ("ICU", "XRay", "Surgery"))
+        first = {"Anna": [r1, r2, r3], "Bob": []}
+        # The improved plan would move the already started r1 to Bob
+        second = {"Anna": [r1, r2], "Bob": [r1, r3]}
+
+        AssignmentExecutor(self.tm, self.mock_socketio, StreamingStrategy([first, second]), [r1, r2, r3]).run()
+        anna, bob = self.tm.transporters
+
+        self.assertIs(anna.current_task, r1)
+        self.assertEqual(anna.task_queue, [r2])
+        self.assertIs(bob.current_task, r3)
+        self.assertEqual(r1.get_transporter_name(), "Anna")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import unittest
+
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.Auto.auto_strategy import AutoStrategy
+from Model.Assignment_strategies.Auto.strategy_profile import StrategyProfile, instance_features
+
+from tests import build_hospital, build_transporters
+
+
+class TestAutoStrategy(unittest.TestCase):
+    def setUp(self):
+        self.hospital = build_hospital()
+        self.transporters = build_transporters(self.hospital, ("Anna", "Bob"))
+        self.requests = [TransportationRequest("Emergency", "ICU"), TransportationRequest("Surgery", "Radiology")]
+
+        self.router = AutoStrategy(latency_slo=1.0, profile_path=None)
+        small = {"requests": 10, "transporters": 3, "departments": 15, "urgent_share": 0.3}
+        large = {"requests": 400, "transporters": 50, "departments": 15, "urgent_share": 0.3}
+        for features, ilp_latency in ((small, 0.05), (large, 12.0)):
+            self.router.profile.record(features, "Greedy Insertion", 0, 0.001, 1.2)
+            self.router.profile.record(features, "ILP: Makespan", 10, ilp_latency, 1.0)
+
+    def test_best_quality_within_slo_is_chosen(self):
+        small = {"requests": 12, "transporters": 3, "departments": 15, "urgent_share": 0.25}
+        large = {"requests": 350, "transporters": 40, "departments": 15, "urgent_share": 0.3}
+
+        self.assertEqual(self.router.choose(small), ("ILP: Makespan", 10))
+        self.assertEqual(self.router.choose(large), ("Greedy Insertion", 0))
+
+    def test_fastest_candidate_when_nothing_meets_slo_and_greedy_without_profile(self):
+        self.router.latency_slo = 0.0001
+        self.assertEqual(self.router.choose(instance_features(self.transporters, self.requests,
+                                                              self.hospital.get_graph())), ("Greedy Insertion", 0))
+        self.assertEqual(AutoStrategy(profile_path=None).choose({}), AutoStrategy.FALLBACK)
+
+    def test_dispatch_latency_is_recorded_in_the_profile(self):
+        plan = self.router.generate_assignment_plan(self.transporters, self.requests, self.hospital.get_graph())
+
+        self.assertCountEqual([r.id for route in plan.values() for r in route], [r.id for r in self.requests])
+        observed = self.router.profile.records[-1]
+        self.assertEqual(observed["strategy"], self.router.choice[0])
+        self.assertIsNone(observed["quality"])
+        self.assertEqual(self.router.get_statistics()["choices"], {self.router.choice[0]: 1})
+
+    def test_observations_are_saved_apart_from_the_benchmark_profile(self):
+        with tempfile.TemporaryDirectory() as directory:
+            profile_path = os.path.join(directory, "profile.json")
+            observations_path = os.path.join(directory, "runtime", "observations.json")
+            self.router.profile.path = profile_path
+            self.router.profile.save()
+            with open(profile_path) as f:
+                benchmark_profile = f.read()
+
+            router = AutoStrategy(latency_slo=1.0, profile_path=profile_path, observations_path=observations_path)
+            router.generate_assignment_plan(self.transporters, self.requests, self.hospital.get_graph())
+
+            with open(profile_path) as f:
+                self.assertEqual(f.read(), benchmark_profile)
+            with open(observations_path) as f:
+                self.assertEqual(len(json.load(f)["records"]), 1)
+            self.assertEqual(os.listdir(os.path.dirname(observations_path)), ["observations.json"])
+
+            restarted = StrategyProfile(profile_path, observations_path)
+            self.assertEqual(len(restarted.records), len(self.router.profile.records) + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import MagicMock
+
+import eventlet
+
+from Model.hospital_model import Hospital
+from Model.model_transport_manager import TransportManager
+from Model.model_transportation_request import TransportationRequest
+
+
+class TestBatchDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.tm = TransportManager(Hospital(), MagicMock())
+        self.tm.deploy_strategy_assignment = MagicMock()
+
+    def tearDown(self):
+        self.tm.batch_dispatcher.clear()
+        TransportationRequest.pending_requests.clear()
+
+    def _arrive(self, urgent=False):
+        request = self.tm.create_transport_request("Emergency", "ICU", urgent=urgent)
+        self.tm.handle_new_request(request)
+        return request
+
+    def test_without_window_every_arrival_is_deployed(self):
+        self._arrive()
+        self._arrive()
+        self.assertEqual(self.tm.deploy_strategy_assignment.call_count, 2)
+        self.assertEqual(self.tm.get_dispatch_status()["batch"]["flushes"]["immediate"], 2)
+
+    def test_batch_closes_on_size_and_on_urgent_arrival(self):
+        self.tm.set_batch_policy(window_seconds=60, max_batch_size=3)
+        self._arrive()
+        self._arrive()
+        self.tm.deploy_strategy_assignment.assert_not_called()
+        self._arrive()
+        self.assertEqual(self.tm.deploy_strategy_assignment.call_count, 1)
+
+        self._arrive()
+        self._arrive(urgent=True)
+        self.assertEqual(self.tm.deploy_strategy_assignment.call_count, 2)
+
+        status = self.tm.get_dispatch_status()["batch"]
+        self.assertEqual((status["flushes"]["size"], status["flushes"]["urgent"]), (1, 1))
+        self.assertEqual(status["mean_batch_size"], 2.5)
+        self.assertEqual(status["open_batch"], 0)
+
+    def test_batch_closes_when_window_expires(self):
+        self.tm.set_batch_policy(window_seconds=0.05, flush_on_urgent=False)
+        self._arrive()
+        self._arrive(urgent=True)
+        self.tm.deploy_strategy_assignment.assert_not_called()
+
+        eventlet.sleep(0.1)
+        self.assertEqual(self.tm.deploy_strategy_assignment.call_count, 1)
+        self.assertEqual(self.tm.get_dispatch_status()["batch"]["flushes"]["window"], 1)
+
+    def test_negative_window_is_rejected(self):
+        _, status = self.tm.set_batch_policy(window_seconds=-1)
+        self.assertEqual(status, 400)
+
+    def test_policy_values_of_the_wrong_type_are_rejected(self):
+        for policy in ({"window_seconds": "5"}, {"window_seconds": True}, {"max_batch_size": 2.5},
+                       {"flush_on_urgent": "yes"}):
+            _, status = self.tm.set_batch_policy(**policy)
+            self.assertEqual(status, 400, policy)
+        self.assertEqual(self.tm.get_dispatch_status()["batch"]["window_seconds"], 0)
+
+    def test_deployments_during_a_running_solve_are_coalesced(self):
+        tm = TransportManager(Hospital(), MagicMock())
+        solves = []
+        tm.execute_assignment_plan = lambda: (solves.append(len(solves)), eventlet.sleep(0.05))
+
+        tm.deploy_strategy_assignment()
+        eventlet.sleep(0)
+        for _ in range(3):
+            tm.deploy_strategy_assignment()
+        self.assertEqual(len(solves), 1)
+
+        eventlet.sleep(0.2)
+        self.assertEqual(len(solves), 2)
+        self.assertEqual(tm.get_dispatch_status()["solver"]["coalesced"], 3)
+        self.assertFalse(tm.solve_running)
+
+    def test_rest_end_during_a_running_solve_is_coalesced(self):
+        tm = TransportManager(Hospital(), MagicMock())
+        tm.simulation = MagicMock()
+        solves = []
+        tm.execute_assignment_plan = lambda: (solves.append(len(solves)), eventlet.sleep(0.05))
+
+        transporter = MagicMock(task_queue=[])
+        transporter.shift_manager.should_rest.return_value = True
+        transporter.shift_manager.rest_duration = 0
+
+        tm.deploy_strategy_assignment()
+        eventlet.sleep(0)
+        tm.process_transport(transporter, MagicMock())
+        self.assertEqual(len(solves), 1)
+
+        eventlet.sleep(0.2)
+        self.assertEqual(len(solves), 2)
+        self.assertEqual(tm.get_dispatch_status()["solver"]["coalesced"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import os
+import subprocess
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.ILP.cluster_based_ilp import ClusterBasedILP
+from Model.Assignment_strategies.distance_matrix import DistanceMatrix
+from Model.Assignment_strategies.graph_partition import GraphPartition
+from Model.Assignment_strategies.parallel_runner import PROCESS_GROUPS, run_in_processes
+
+from tests import build_hospital, build_transporters
+
+
+def _start_sleeper(pid_file):
+    """Task that starts a subprocess and never finishes, like a worker waiting on CBC."""
+    sleeper = subprocess.Popen(["sleep", "60"])
+    with open(pid_file, "w") as f:
+        f.write(str(sleeper.pid))
+    time.sleep(60)
+
+
+def _start_nested_sleeper(pid_file):
+    run_in_processes({"inner": (_start_sleeper, (pid_file,))}, deadline=60)
+
+
+def _is_running(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split(")")[-1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+class TestClusterBasedILP(unittest.TestCase):
+    def setUp(self):
+        self.hospital = build_hospital()
+        self.transporters = build_transporters(self.hospital, ("Anna", "Bob", "Cathy", "Dave"))
+        self.requests = [
+            TransportationRequest("Emergency", "ICU", urgent=True),
+            TransportationRequest("ICU", "Emergency"),
+            TransportationRequest("Emergency", "ICU"),
+            TransportationRequest("Surgery", "Radiology"),
+            TransportationRequest("Radiology", "Surgery", urgent=True),
+        ]
+
+    def _clustered(self, **kwargs):
+        ilp = ClusterBasedILP(self.transporters, self.requests, self.hospital.get_graph(), num_clusters=2, **kwargs)
+        ilp.clusters = [["Transporter Lounge", "Emergency", "ICU"], ["Surgery", "Radiology"]]
+        ilp._assign_requests_to_clusters()
+        ilp.transporter_clusters = [self.transporters[:2], self.transporters[2:]]
+        return ilp
+
+    def test_parallel_clusters_assign_every_request_once(self):
+        plan = self._clustered(parallel=True)._solve_clusters()
+        assigned = [r.id for reqs in plan.values() for r in reqs]
+        self.assertCountEqual(assigned, [r.id for r in self.requests])
+
+        # Cluster transporters only receive requests from their own cluster
+        self.assertTrue(all(r.origin in ("Emergency", "ICU") for name in ("Anna", "Bob") for r in plan[name]))
+
+    def test_parallel_plan_uses_original_request_objects(self):
+        plan = self._clustered(parallel=True)._solve_clusters()
+        originals = {id(r) for r in self.requests}
+        self.assertTrue(all(id(r) in originals for reqs in plan.values() for r in reqs))
+
+    def test_clusters_solve_without_time_limit(self):
+        for parallel in (False, True):
+            plan = self._clustered(parallel=parallel, time_limit=None)._solve_clusters()
+            self.assertCountEqual([r.id for reqs in plan.values() for r in reqs], [r.id for r in self.requests])
+
+    def test_incomplete_cluster_plans_are_replaced_greedily(self):
+        def partial_results(tasks, deadline, max_workers, on_result):
+            # Every cluster "finishes" with an empty plan, as after a time limit without incumbent
+            for i in tasks:
+                on_result(i, {})
+            return {i: {} for i in tasks}
+
+        with patch("Model.Assignment_strategies.ILP.cluster_based_ilp.run_in_processes", partial_results):
+            plan = self._clustered(parallel=True)._solve_clusters()
+        self.assertCountEqual([r.id for reqs in plan.values() for r in reqs], [r.id for r in self.requests])
+
+        with patch("Model.Assignment_strategies.ILP.cluster_based_ilp.ILPMakespan.build_and_solve", return_value={}):
+            plan = self._clustered(parallel=False)._solve_clusters()
+        self.assertCountEqual([r.id for reqs in plan.values() for r in reqs], [r.id for r in self.requests])
+
+    @unittest.skipUnless(PROCESS_GROUPS and os.path.isdir("/proc"), "needs POSIX process groups and /proc")
+    def test_timed_out_workers_take_their_subprocesses_along(self):
+        for task in (_start_sleeper, _start_nested_sleeper):
+            with tempfile.TemporaryDirectory() as tmp:
+                pid_file = os.path.join(tmp, "pid")
+                self.assertEqual(run_in_processes({"slow": (task, (pid_file,))}, deadline=1), {})
+
+                with open(pid_file) as f:
+                    pid = int(f.read())
+                for _ in range(20):
+                    if not _is_running(pid):
+                        break
+                    time.sleep(0.1)
+                self.assertFalse(_is_running(pid), task.__name__)
+
+    def test_distance_matrix_matches_dijkstra(self):
+        graph = self.hospital.get_graph()
+        distances = DistanceMatrix.for_graph(graph)
+        pathfinder = self.transporters[0].pathfinder
+
+        for start in graph.get_nodes():
+            for end in graph.get_nodes():
+                _, expected = pathfinder.dijkstra(start, end)
+                self.assertEqual(distances.distance(start, end), expected)
+
+    def test_distance_matrix_is_rebuilt_when_graph_changes(self):
+        graph = self.hospital.get_graph()
+        before = DistanceMatrix.for_graph(graph)
+        self.assertIs(DistanceMatrix.for_graph(graph), before)
+
+        self.hospital.add_corridor("Emergency", "Radiology", 1)
+        after = DistanceMatrix.for_graph(graph)
+        self.assertIsNot(after, before)
+        self.assertEqual(after.distance("ICU", "Radiology"), 6)
+
+    def test_clustering_methods_split_the_line_in_two(self):
+        for method in ("spectral", "kmeans", "hierarchical"):
+            ilp = ClusterBasedILP(self.transporters, self.requests, self.hospital.get_graph(),
+                                  num_clusters=2, clustering_method=method)
+            ilp._preprocess_data()
+            ilp._generate_clusters()
+            self.assertCountEqual([sorted(c) for c in ilp.clusters],
+                                  [["Emergency", "ICU"], ["Radiology", "Surgery"]], method)
+
+    def test_spectral_partition_is_reused_until_graph_changes(self):
+        graph = self.hospital.get_graph()
+        first = GraphPartition.for_graph(graph, 2)
+        self.assertIs(GraphPartition.for_graph(graph, 2), first)
+        self.assertCountEqual([sorted(c) for c in first.clusters],
+                              [["Emergency", "ICU", "Transporter Lounge"], ["Radiology", "Surgery"]])
+
+        self.hospital.add_corridor("Radiology", "Emergency", 3)
+        self.assertIsNot(GraphPartition.for_graph(graph, 2), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import MagicMock
+
+from Model.event_dispatcher import LocationIndex
+from Model.model_transport_manager import TransportManager
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.distance_matrix import DistanceMatrix
+
+from tests import build_hospital, build_transporters
+
+
+class TestEventDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.hospital = build_hospital()
+        self.tm = TransportManager(self.hospital, MagicMock())
+        self.tm.process_transport = MagicMock()
+        self.anna, self.bob = build_transporters(self.hospital, ("Anna", "Bob"))
+        for transporter in (self.anna, self.bob):
+            self.tm.add_transporter(transporter)
+        self.bob.current_location = "Surgery"
+        self.tm.set_dispatch_mode("event")
+
+    def tearDown(self):
+        TransportationRequest.pending_requests.clear()
+        TransportationRequest.ongoing_requests.clear()
+        TransportationRequest.completed_requests.clear()
+
+    def _finish(self, transporter, location):
+        transporter.current_task, transporter.is_busy, transporter.current_location = None, False, location
+        return self.tm.event_dispatcher.on_transporter_free(transporter)
+
+    def test_arrivals_go_to_nearest_idle_transporter_and_free_transporters_take_urgent_work_first(self):
+        at_surgery = self.tm.create_transport_request("Radiology", "ICU")
+        at_emergency = self.tm.create_transport_request("Emergency", "ICU")
+        self.assertEqual(at_surgery.get_transporter_name(), "Bob")
+        self.assertEqual(at_emergency.get_transporter_name(), "Anna")
+
+        regular = self.tm.create_transport_request("ICU", "Surgery")
+        urgent = self.tm.create_transport_request("Radiology", "Emergency", urgent=True)
+        self.assertEqual(self.tm.get_dispatch_status()["pending_urgent"], 1)
+        self.assertEqual(regular.status, "pending")
+
+        self.assertIs(self._finish(self.anna, "ICU"), urgent)
+        self.assertIs(self._finish(self.bob, "Radiology"), regular)
+        self.assertIsNone(self._finish(self.anna, "Emergency"))
+        self.assertEqual(self.tm.get_dispatch_status()["idle_transporters"], 1)
+
+    def test_inactive_transporters_are_skipped(self):
+        self.tm.set_transporter_status("Bob", "inactive")
+        request = self.tm.create_transport_request("Radiology", "ICU")
+        self.assertEqual(request.get_transporter_name(), "Anna")
+
+    def test_cleared_transporters_are_not_dispatched(self):
+        self.tm.clear_transporters()
+        request = self.tm.create_transport_request("Emergency", "ICU")
+        self.assertEqual(request.status, "pending")
+        self.assertEqual(self.tm.get_dispatch_status()["pending_regular"], 1)
+
+        carl, = build_transporters(self.hospital, ("Carl",))
+        self.tm.add_transporter(carl)
+        self.assertEqual(request.get_transporter_name(), "Carl")
+
+    def test_location_index_scan_matches_direct_lookup(self):
+        distances = DistanceMatrix.for_graph(self.hospital.get_graph())
+        direct, scan = LocationIndex(distances), LocationIndex(distances)
+        scan.DIRECT_SHARE = 0
+        for i, location in enumerate(["Radiology", "Emergency", "Emergency", "Surgery"]):
+            direct.add(i, location, location)
+            scan.add(i, location, location)
+
+        for query in ["ICU", "Transporter Lounge", "Radiology", "ICU"]:
+            self.assertEqual(direct.pop_nearest(query), scan.pop_nearest(query))
+        self.assertEqual(len(direct), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,308 @@
+import random
+import unittest
+
+import eventlet
+import numpy as np
+
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.Genetic_algorithms.genetic_algorithm import GeneticAlgorithm
+
+from tests import DEPARTMENTS, build_hospital, build_transporters
+
+
+class TestGeneticAlgorithm(unittest.TestCase):
+    def setUp(self):
+        self.hospital = build_hospital()
+        self.transporters = build_transporters(self.hospital)
+        self.transporters[1].current_location = "Surgery"
+
+        rng = random.Random(7)
+        self.requests = [TransportationRequest(*rng.sample(DEPARTMENTS, 2), urgent=rng.random() < 0.3)
+                         for _ in range(15)]
+        self.ga = GeneticAlgorithm(self.transporters, self.requests, self.hospital.get_graph())
+
+    def _reference_fitness(self, chromosome):
+        """Per-request walk through the chromosome, as the fitness is defined."""
+        workloads = {t.name: 0 for t in self.transporters}
+        locations = {t.name: t.current_location for t in self.transporters}
+        urgent_completion, total = [0], 0
+        for i, t_idx in enumerate(chromosome):
+            t, r = self.transporters[t_idx], self.requests[i]
+            leg = (self.ga._estimate_point_to_point_time(locations[t.name], r.origin) +
+                   self.ga._estimate_point_to_point_time(r.origin, r.destination))
+            workloads[t.name] += leg
+            locations[t.name] = r.destination
+            total += leg
+            if r.urgent:
+                urgent_completion.append(workloads[t.name])
+
+        w = self.ga.fitness_weights
+        return (w["makespan"] * max(workloads.values()) + w["balance"] * np.std(list(workloads.values())) +
+                w["urgency"] * max(urgent_completion) + w["travel_efficiency"] * total / len(self.requests))
+
+    def _reference_offspring(self, population, parents, num_children):
+        """
+        Copy-based, one child at a time construction of the offspring, drawing
+        the same random numbers in the same order as the buffer-based operators.
+        """
+        ga, num_genes = self.ga, population.shape[1]
+
+        first = np.random.randint(len(parents), size=num_children)
+        second = (first + np.random.randint(1, len(parents), size=num_children)) % len(parents)
+        if ga.crossover_method == "one_point":
+            cut = np.random.randint(1, num_genes, size=num_children)
+            spans = [(c, num_genes) for c in cut]
+        elif ga.crossover_method == "two_point":
+            point1 = np.random.randint(num_genes - 1, size=num_children)
+            point2 = point1 + 1 + (np.random.random(num_children) * (num_genes - 1 - point1)).astype(int)
+            spans = list(zip(point1, point2))
+        else:
+            uniform = np.random.random((num_children, num_genes)) < 0.5
+        crossed = np.random.random(num_children) < ga.crossover_rate
+
+        children = []
+        for i in range(num_children):
+            parent1, parent2 = population[parents[first[i]]], population[parents[second[i]]]
+            if not crossed[i]:
+                child = parent1.copy()
+            elif ga.crossover_method == "uniform":
+                child = np.where(uniform[i], parent2, parent1)
+            else:
+                start, end = spans[i]
+                child = np.concatenate((parent1[:start], parent2[start:end], parent1[end:]))
+            children.append(child)
+
+        selected = np.flatnonzero(np.random.random(num_children) < ga.mutation_rate)
+        mutation_types = np.array(ga._mutation_types(num_genes))
+        drawn = mutation_types[np.random.randint(len(mutation_types), size=len(selected))]
+
+        rows = selected[drawn == "point"]
+        if len(rows):
+            num_mutations = min(max(1, int(num_genes * ga.mutation_rate)), num_genes)
+            keys = np.random.random((len(rows), num_genes))
+            values = np.random.randint(len(self.transporters), size=(len(rows), num_mutations))
+            for row, row_keys, row_values in zip(rows, keys, values):
+                mutated = children[row].copy()
+                mutated[np.argpartition(row_keys, num_mutations - 1)[:num_mutations]] = row_values
+                children[row] = mutated
+
+        rows = selected[drawn == "swap"]
+        if len(rows):
+            pos1 = np.random.randint(num_genes, size=len(rows))
+            pos2 = (pos1 + np.random.randint(1, num_genes, size=len(rows))) % num_genes
+            for row, a, b in zip(rows, pos1, pos2):
+                mutated = children[row].copy()
+                mutated[a], mutated[b] = mutated[b], mutated[a]
+                children[row] = mutated
+
+        for operator in ("inversion", "scramble"):
+            rows = selected[drawn == operator]
+            if not len(rows):
+                continue
+            start = np.random.randint(num_genes - 1, size=len(rows))
+            span = np.minimum(start + 10, num_genes) - (start + 1)
+            end = start + 1 + (np.random.random(len(rows)) * span).astype(int)
+            if operator == "scramble":
+                keys = np.random.random((len(rows), num_genes))
+            for k, (row, a, b) in enumerate(zip(rows, start, end)):
+                mutated = children[row].copy()
+                if operator == "inversion":
+                    mutated[a:b] = mutated[a:b][::-1]
+                else:
+                    mutated[a:b] = mutated[a:b][np.argsort(keys[k, a:b], kind='stable')]
+                children[row] = mutated
+
+        return np.array(children), parents[first]
+
+    def test_vectorized_fitness_matches_reference(self):
+        population = np.random.RandomState(0).randint(len(self.transporters), size=(30, len(self.requests)))
+        scores = self.ga._evaluate_population_fitness(population)
+
+        for chromosome, score in zip(population, scores):
+            self.assertAlmostEqual(score, self._reference_fitness(chromosome))
+
+    def test_invalid_gene_gives_infinite_fitness(self):
+        chromosome = np.zeros(len(self.requests), dtype=int)
+        chromosome[3] = len(self.transporters)
+        self.assertEqual(self.ga._evaluate_fitness(chromosome), float('inf'))
+
+    def test_offspring_state_matches_full_evaluation(self):
+        rng = np.random.RandomState(1)
+        self.ga.population = rng.randint(len(self.transporters), size=(20, len(self.requests)))
+        self.ga.population_workloads, self.ga.population_urgent_completion = \
+            self.ga._route_state(self.ga.population)
+
+        parent_indices = rng.randint(20, size=20)
+        children = self.ga.population[parent_indices]
+        self.ga._point_mutation(children, np.arange(0, 5))
+        self.ga._swap_mutation(children, np.arange(5, 10))
+        self.ga._inversion_mutation(children, np.arange(10, 15))
+
+        workloads, urgent_completion, _ = self.ga._offspring_route_state(children, parent_indices)
+        expected_workloads, expected_urgent = self.ga._route_state(children)
+        np.testing.assert_allclose(workloads, expected_workloads)
+        np.testing.assert_allclose(urgent_completion, expected_urgent)
+
+    def test_delta_scored_offspring_match_full_evaluation(self):
+        rng = np.random.RandomState(4)
+        self.ga.delta_transporter_limit = len(self.transporters)  # every changed child gets a delta
+        self.ga.population = rng.randint(len(self.transporters), size=(20, len(self.requests)))
+        self.ga.population_workloads, self.ga.population_urgent_completion = \
+            self.ga._route_state(self.ga.population)
+
+        for _ in range(3):
+            parent_indices = rng.randint(20, size=20)
+            children = self.ga.population[parent_indices]
+            self.ga._point_mutation(children, np.arange(0, 8))
+            self.ga._swap_mutation(children, np.arange(8, 14))
+            self.ga._scramble_mutation(children, np.arange(14, 18))
+
+            delta_evaluations = self.ga.delta_evaluations
+            workloads, urgent_completion, membership = self.ga._offspring_route_state(children, parent_indices)
+            self.assertGreater(self.ga.delta_evaluations, delta_evaluations)
+            self.assertEqual(self.ga.full_evaluations, 0)
+
+            expected_workloads, expected_urgent = self.ga._route_state(children)
+            np.testing.assert_allclose(workloads, expected_workloads)
+            np.testing.assert_allclose(urgent_completion, expected_urgent)
+            known = membership[3]
+            for inherited, expected in zip(membership[:3], self.ga._route_membership(children[known])):
+                np.testing.assert_array_equal(inherited[known], expected)
+
+            # The children become the parents of the next round, as in a run
+            self.ga.population = children
+            self.ga.population_workloads, self.ga.population_urgent_completion = workloads, urgent_completion
+            self.ga.population_membership = membership
+
+    def test_buffer_operators_match_copying_reference(self):
+        self.ga.crossover_rate, self.ga.mutation_rate = 0.7, 0.9
+        population = np.random.RandomState(5).randint(len(self.transporters), size=(12, len(self.requests)))
+        parents = np.array([3, 0, 7, 7, 11, 5])
+
+        for method in ("one_point", "two_point", "uniform"):
+            self.ga.crossover_method = method
+            self.ga.population = population.copy()
+            for seed in range(5):
+                children = np.empty((10, len(self.requests)), dtype=population.dtype)
+                np.random.seed(seed)
+                sources = self.ga._crossover_into(children, parents)
+                self.ga._mutate_in_place(children)
+
+                np.random.seed(seed)
+                expected, expected_sources = self._reference_offspring(population, parents, len(children))
+                np.testing.assert_array_equal(children, expected)
+                np.testing.assert_array_equal(sources, expected_sources)
+                # Writing the children must leave the parent population untouched
+                np.testing.assert_array_equal(self.ga.population, population)
+
+    def test_population_buffers_are_not_aliased_between_generations(self):
+        ga = GeneticAlgorithm(self.transporters, self.requests, self.hospital.get_graph(), population_size=20,
+                              generations=6, early_stopping=False, mutation_rate=0.5)
+        crossover_into, bred_from = ga._crossover_into, []
+
+        def checked_crossover_into(children, parents):
+            # Offspring are written into the spare buffer, never over the population they are bred from
+            self.assertFalse(np.shares_memory(children, ga.population))
+            self.assertTrue(np.shares_memory(children, ga._offspring_buffer))
+            bred_from.append(ga.population)
+            return crossover_into(children, parents)
+
+        ga._crossover_into = checked_crossover_into
+        ga.run()
+
+        self.assertEqual(len(bred_from), 6)
+        self.assertFalse(np.shares_memory(ga.population, ga._offspring_buffer))
+        # The two buffers swap roles every generation
+        for previous, current in zip(bred_from, bred_from[1:]):
+            self.assertIsNot(previous, current)
+        self.assertEqual(len({id(population) for population in bred_from}), 2)
+        self.assertIs(ga._offspring_buffer, bred_from[-1])
+
+    def test_single_route_state_matches_full_evaluation(self):
+        rng = np.random.RandomState(2)
+        population = rng.randint(len(self.transporters), size=(6, len(self.requests)))
+        expected_workloads, expected_urgent = self.ga._route_state(population)
+
+        rows, transporters = np.nonzero(np.ones(expected_workloads.shape, dtype=bool))
+        workloads, urgent_completion = self.ga._transporter_route_state(
+            self.ga._route_membership(population), rows, transporters)
+        np.testing.assert_allclose(workloads, expected_workloads.ravel())
+        np.testing.assert_allclose(urgent_completion, expected_urgent.ravel())
+
+    def test_fitness_cache_reuses_route_state_and_stays_bounded(self):
+        rng = np.random.RandomState(3)
+        self.ga.fitness_cache_size = 8
+        self.ga.population = rng.randint(len(self.transporters), size=(10, len(self.requests)))
+        self.ga.population_workloads, self.ga.population_urgent_completion = \
+            self.ga._route_state(self.ga.population)
+
+        children = np.roll(self.ga.population, 1, axis=1)
+        parent_indices = np.arange(10)
+        first = self.ga._offspring_route_state(children, parent_indices)
+        hits = self.ga.cache_hits
+        # The two oldest entries were evicted, the eight most recent are hits
+        second = self.ga._offspring_route_state(children[2:], parent_indices[2:])
+
+        np.testing.assert_allclose(second[0], first[0][2:])
+        np.testing.assert_allclose(second[1], first[1][2:])
+        self.assertEqual(self.ga.cache_hits - hits, 8)
+        self.assertEqual(len(self.ga._fitness_cache), 8)
+
+    def test_diversity_is_exact_mean_pairwise_hamming_distance(self):
+        population = np.random.RandomState(4).randint(len(self.transporters), size=(25, len(self.requests)))
+        distances = [np.mean(a != b) for i, a in enumerate(population) for b in population[i + 1:]]
+
+        self.assertAlmostEqual(self.ga._calculate_population_diversity(population), np.mean(distances))
+        self.assertEqual(self.ga._calculate_population_diversity(np.repeat(population[:1], 5, axis=0)), 0.0)
+
+    def test_carry_over_population_remaps_by_request_id_and_transporter_name(self):
+        previous = np.random.RandomState(2).randint(len(self.transporters), size=(10, len(self.requests)))
+        old_ids = [r.id for r in self.requests]
+        old_names = [t.name for t in self.transporters]
+
+        # Two requests were started, one new request arrived and the transporter order changed
+        new_request = TransportationRequest("Radiology", "Emergency")
+        ga = GeneticAlgorithm(self.transporters[::-1], self.requests[2:] + [new_request], self.hospital.get_graph())
+        carried = ga.carry_over_population(previous, old_ids, old_names)
+
+        self.assertEqual(carried.shape, (10, len(self.requests) - 1))
+        for row, old_row in zip(carried, previous):
+            self.assertEqual([ga.transporters[t].name for t in row[:-1]], [old_names[t] for t in old_row[2:]])
+        self.assertTrue(((carried >= 0) & (carried < len(self.transporters))).all())
+
+    def test_anytime_run_streams_incumbents_and_stops_on_convergence(self):
+        ga = GeneticAlgorithm(self.transporters, self.requests, self.hospital.get_graph(), generations=5000,
+                              time_limit_seconds=60, convergence_window=20)
+        plans = list(ga.run_anytime(report_interval=0))
+
+        # The initial incumbent comes first, then one per improvement
+        if ga.best_fitness < ga.best_fitness_history[0]:
+            self.assertGreaterEqual(len(plans), 2)
+        self.assertEqual(plans[-1], ga._convert_to_plan(ga.best_solution))
+        self.assertLess(ga.current_generation, 4999)
+
+    def test_streaming_run_lets_other_green_threads_progress(self):
+        ticks = []
+
+        def transport():
+            while True:
+                ticks.append(1)
+                eventlet.sleep(0)
+
+        worker = eventlet.spawn(transport)
+        ga = GeneticAlgorithm(self.transporters, self.requests, self.hospital.get_graph(),
+                              generations=20, early_stopping=False)
+        # No improved plan is due within the interval, so only the generations yield
+        for _ in ga.run_anytime(report_interval=60):
+            pass
+        worker.kill()
+        self.assertGreaterEqual(len(ticks), 20)
+
+    def test_run_assigns_every_request_once(self):
+        plan = self.ga.run()
+        assigned = [r.id for reqs in plan.values() for r in reqs]
+        self.assertCountEqual(assigned, [r.id for r in self.requests])
+
+
+if __name__ == '__main__':
+    unittest.main()
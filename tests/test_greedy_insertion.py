@@ -0,0 +1,47 @@
+import random
+import unittest
+
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.Greedy.greedy_insertion import GreedyInsertion
+from Model.Assignment_strategies.plan_evaluator import PlanEvaluator
+
+from tests import DEPARTMENTS, build_hospital, build_transporters
+
+
+class TestGreedyInsertion(unittest.TestCase):
+    def setUp(self):
+        self.hospital = build_hospital()
+        self.transporters = build_transporters(self.hospital)
+        self.transporters[1].current_location = "Surgery"
+
+        rng = random.Random(5)
+        self.requests = [TransportationRequest(*rng.sample(DEPARTMENTS, 2), urgent=rng.random() < 0.3,
+                                               request_time=i) for i in range(20)]
+
+    def test_plan_assigns_every_request_once_with_urgent_requests_first(self):
+        plan = GreedyInsertion(self.transporters, self.requests, self.hospital.get_graph()).generate_assignment_plan()
+
+        assigned = [r.id for route in plan.values() for r in route]
+        self.assertCountEqual(assigned, [r.id for r in self.requests])
+        for route in plan.values():
+            urgency = [r.urgent for r in route]
+            self.assertEqual(urgency, sorted(urgency, reverse=True))
+
+    def test_tracked_loads_match_plan_evaluation(self):
+        greedy = GreedyInsertion(self.transporters, self.requests, self.hospital.get_graph())
+        plan = greedy.generate_assignment_plan()
+
+        workload = PlanEvaluator(self.transporters, self.hospital.get_graph()).evaluate(plan)["workload"]
+        for t, load in zip(self.transporters, greedy.loads):
+            self.assertAlmostEqual(load, workload[t.name])
+
+    def test_requests_are_spread_over_idle_transporters(self):
+        # Chaining the second request behind the first would finish later than starting Cathy
+        requests = [TransportationRequest("Emergency", "ICU", request_time=i) for i in range(2)]
+        plan = GreedyInsertion(self.transporters, requests, self.hospital.get_graph()).generate_assignment_plan()
+
+        self.assertEqual({name: len(route) for name, route in plan.items()}, {"Anna": 1, "Bob": 0, "Cathy": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
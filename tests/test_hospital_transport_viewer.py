@@ -0,0 +1,40 @@
+import unittest
+from unittest.mock import MagicMock
+
+from flask import Flask
+
+from Model.hospital_model import Hospital
+from Model.model_transport_manager import TransportManager
+from View.hospital_transport_viewer import HospitalTransportViewer
+
+
+class TestHospitalTransportViewer(unittest.TestCase):
+    def setUp(self):
+        self.system = MagicMock()
+        self.system.transport_manager = TransportManager(Hospital(), MagicMock())
+        app = Flask(__name__)
+        HospitalTransportViewer(app, MagicMock(), self.system)
+        self.client = app.test_client()
+
+    def test_unknown_dispatch_mode_is_sent_as_400(self):
+        response = self.client.post("/set_dispatch_mode", json={"mode": "fastest"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", response.get_json())
+
+        response = self.client.post("/set_dispatch_mode", json={"mode": "optimize"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.system.transport_manager.dispatch_mode, "optimize")
+
+    def test_batch_policy_errors_are_sent_as_400(self):
+        response = self.client.post("/set_batch_policy", json={"window_seconds": "5"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", response.get_json())
+
+        response = self.client.post("/set_batch_policy", json={"window_seconds": 5})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.system.transport_manager.batch_dispatcher.window_seconds, 5)
+        self.system.transport_manager.batch_dispatcher.clear()
+
+
+if __name__ == '__main__':
+    unittest.main()
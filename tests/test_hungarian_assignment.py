@@ -0,0 +1,42 @@
+import itertools
+import unittest
+
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.Hungarian.hungarian_assignment import HungarianAssignment
+from Model.Assignment_strategies.plan_evaluator import PlanEvaluator
+
+from tests import build_hospital, build_transporters
+
+
+class TestHungarianAssignment(unittest.TestCase):
+    def setUp(self):
+        self.hospital = build_hospital()
+        self.transporters = build_transporters(self.hospital)
+        self.transporters[1].current_location = "Surgery"
+        self.transporters[2].current_location = "Radiology"
+
+    def test_single_round_is_the_optimal_matching(self):
+        requests = [TransportationRequest("Emergency", "ICU"), TransportationRequest("Radiology", "Surgery"),
+                    TransportationRequest("ICU", "Surgery")]
+        plan = HungarianAssignment(self.transporters, requests, self.hospital.get_graph()).generate_assignment_plan()
+
+        evaluator = PlanEvaluator(self.transporters, self.hospital.get_graph())
+        best = min(evaluator.evaluate({t.name: [r] for t, r in zip(self.transporters, order)})["total_time"]
+                   for order in itertools.permutations(requests))
+        self.assertEqual(evaluator.evaluate(plan)["total_time"], best)
+        self.assertTrue(all(len(route) == 1 for route in plan.values()))
+
+    def test_rounds_assign_urgent_requests_before_regular_ones(self):
+        requests = [TransportationRequest("Emergency", "ICU", urgent=i % 3 == 0) for i in range(8)]
+        matcher = HungarianAssignment(self.transporters, requests, self.hospital.get_graph())
+        plan = matcher.generate_assignment_plan()
+
+        self.assertCountEqual([r.id for route in plan.values() for r in route], [r.id for r in requests])
+        self.assertEqual(matcher.rounds, 1 + 2)  # one round for the 3 urgent requests, two for the 5 regular ones
+        for route in plan.values():
+            urgency = [r.urgent for r in route]
+            self.assertEqual(urgency, sorted(urgency, reverse=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pulp
+
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.ILP.ilp_makespan import ILPMakespan
+from Model.Assignment_strategies.ILP.ilp_equal_workload import ILPEqualWorkload
+from Model.Assignment_strategies.ILP.ilp_urgency_first import ILPUrgencyFirst
+
+from tests import build_hospital, build_transporters
+
+
+class TestILPCore(unittest.TestCase):
+    def setUp(self):
+        self.hospital = build_hospital()
+        self.mock_socketio = MagicMock()
+        self.transporters = build_transporters(self.hospital, socketio=self.mock_socketio)
+
+    def _requests(self):
+        return [
+            TransportationRequest("Emergency", "ICU", urgent=True),
+            TransportationRequest("Emergency", "ICU", urgent=True),
+            TransportationRequest("Emergency", "ICU", urgent=True),
+            TransportationRequest("Emergency", "ICU", urgent=False),
+            TransportationRequest("Surgery", "Radiology"),
+            TransportationRequest("Surgery", "Radiology"),
+            TransportationRequest("ICU", "Emergency"),
+        ]
+
+    def _solve(self, requests, **kwargs):
+        ilp = ILPMakespan(self.transporters, requests, self.hospital.get_graph(), **kwargs)
+        plan = ilp.build_and_solve()
+        return ilp, plan
+
+    def test_identical_requests_share_a_class(self):
+        ilp, _ = self._solve(self._requests())
+        multiplicities = sorted(c.multiplicity for c in ilp.request_classes)
+        self.assertEqual(multiplicities, [1, 1, 2, 3])
+
+    def test_aggregated_plan_assigns_every_request_once(self):
+        requests = self._requests()
+        _, plan = self._solve(requests)
+        assigned = [r.id for reqs in plan.values() for r in reqs]
+        self.assertCountEqual(assigned, [r.id for r in requests])
+
+    def test_aggregation_keeps_optimal_makespan(self):
+        aggregated, _ = self._solve(self._requests())
+        individual, _ = self._solve(self._requests(), aggregate_requests=False)
+        self.assertEqual(len(individual.request_classes), 7)
+        self.assertAlmostEqual(pulp.value(aggregated.model.objective), pulp.value(individual.model.objective))
+
+    def test_interchangeable_transporters_are_grouped(self):
+        self.transporters[2].current_location = "Surgery"
+        ilp = ILPMakespan(self.transporters, self._requests(), self.hospital.get_graph())
+        groups = ilp.find_interchangeable_transporters()
+        self.assertEqual([[t.name for t in g] for g in groups], [["Anna", "Bob"]])
+
+    def test_symmetry_breaking_keeps_optimal_makespan(self):
+        broken, _ = self._solve(self._requests())
+        plain, _ = self._solve(self._requests(), symmetry_breaking=False)
+        self.assertAlmostEqual(pulp.value(broken.model.objective), pulp.value(plain.model.objective))
+
+    def test_symmetry_breaking_orders_group_by_first_class(self):
+        self.transporters += build_transporters(self.hospital, ("Dave",), self.mock_socketio)
+        ilp, _ = self._solve(self._requests())
+        first_classes = [
+            next((i for i, c in enumerate(ilp.request_classes) if ilp.assign_vars[(t.name, c.id)].varValue > 0.5),
+                 len(ilp.request_classes))
+            for t in self.transporters
+        ]
+        self.assertEqual(first_classes, sorted(first_classes))
+
+    def test_equal_workload_closed_form_matches_mip(self):
+        requests = self._requests()
+        closed = ILPEqualWorkload(self.transporters, requests, self.hospital.get_graph())
+        plan = closed.build_and_solve()
+        mip = ILPEqualWorkload(self.transporters, requests, self.hospital.get_graph(), closed_form=False)
+        mip.build_and_solve()
+
+        self.assertEqual(closed.model.numVariables(), 0)  # solver never invoked
+        self.assertEqual(max(len(reqs) for reqs in plan.values()), pulp.value(mip.model.objective))
+
+    def test_urgency_first_closed_form_assigns_every_request_once(self):
+        requests = self._requests()
+        plan = ILPUrgencyFirst(self.transporters, requests, self.hospital.get_graph()).build_and_solve()
+        assigned = [r.id for reqs in plan.values() for r in reqs]
+        self.assertCountEqual(assigned, [r.id for r in requests])
+
+    def test_lp_relaxation_reports_bound_below_exact_makespan(self):
+        requests = self._requests()
+        relaxed, plan = self._solve(requests, lp_relaxation=True)
+        exact, _ = self._solve(requests, lp_relaxation=False)
+
+        assigned = [r.id for reqs in plan.values() for r in reqs]
+        self.assertCountEqual(assigned, [r.id for r in requests])
+        self.assertLessEqual(relaxed.lp_lower_bound, pulp.value(exact.model.objective) + 1e-6)
+        self.assertGreaterEqual(relaxed.rounded_makespan, pulp.value(exact.model.objective) - 1e-6)
+
+    def test_solver_stop_without_incumbent_falls_back_to_complete_plan(self):
+        requests = self._requests()
+        # A solve that returns before any incumbent leaves every variable unset
+        with patch.object(pulp.LpProblem, "solve", return_value=pulp.LpStatusNotSolved):
+            ilp, plan = self._solve(requests, lp_relaxation=False)
+
+        self.assertFalse(ilp.has_solution())
+        assigned = [r.id for reqs in plan.values() for r in reqs]
+        self.assertCountEqual(assigned, [r.id for r in requests])
+
+
+if __name__ == '__main__':
+    unittest.main()
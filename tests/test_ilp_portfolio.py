@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import patch
+
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.ILP.ilp_mode import ILPMode
+from Model.Assignment_strategies.ILP.ilp_optimizer_strategy import ILPOptimizerStrategy
+from Model.Assignment_strategies.ILP.ilp_portfolio import ILPPortfolio
+from Model.Assignment_strategies.plan_evaluator import PlanEvaluator
+from Model.Assignment_strategies.problem_snapshot import ProblemSnapshot
+
+from tests import build_hospital, build_transporters
+
+
+class TestILPPortfolio(unittest.TestCase):
+    def setUp(self):
+        self.hospital = build_hospital()
+        self.transporters = build_transporters(self.hospital)
+        self.requests = [
+            TransportationRequest("Emergency", "ICU", urgent=True),
+            TransportationRequest("Emergency", "ICU"),
+            TransportationRequest("Surgery", "Radiology"),
+            TransportationRequest("Radiology", "Emergency"),
+            TransportationRequest("ICU", "Surgery"),
+        ]
+
+    def test_snapshot_round_trip_keeps_request_ids(self):
+        snapshot = ProblemSnapshot(self.transporters, self.requests, self.hospital.get_graph())
+        transporters, requests, graph = snapshot.restore()
+
+        self.assertEqual([t.name for t in transporters], ["Anna", "Bob", "Cathy"])
+        self.assertEqual([r.id for r in requests], [r.id for r in self.requests])
+        self.assertEqual(graph.get_edge_weight("ICU", "Surgery"), 10)
+
+    def test_portfolio_returns_best_member_plan(self):
+        members = [
+            ("Makespan", ILPMode.MAKESPAN, {}),
+            ("Equal Workload", ILPMode.EQUAL_WORKLOAD, {}),
+        ]
+        portfolio = ILPPortfolio(self.transporters, self.requests, self.hospital.get_graph(),
+                                 members=members, deadline=20)
+        plan = portfolio.build_and_solve()
+
+        assigned = [r.id for reqs in plan.values() for r in reqs]
+        self.assertCountEqual(assigned, [r.id for r in self.requests])
+        self.assertEqual(set(portfolio.scores), {"Makespan", "Equal Workload"})
+        self.assertEqual(portfolio.scores[portfolio.winner], min(portfolio.scores.values()))
+
+        evaluator = PlanEvaluator(self.transporters, self.hospital.get_graph())
+        self.assertEqual(evaluator.evaluate(plan)["makespan"], portfolio.scores[portfolio.winner])
+
+    def test_incomplete_member_plans_are_ignored(self):
+        complete = {"Anna": [r.id for r in self.requests], "Bob": [], "Cathy": []}
+        partial = {"Anna": [self.requests[0].id], "Bob": [], "Cathy": []}
+        duplicate = {"Anna": [r.id for r in self.requests[:-1]], "Bob": [self.requests[0].id], "Cathy": []}
+        portfolio = ILPPortfolio(self.transporters, self.requests, self.hospital.get_graph())
+        with patch("Model.Assignment_strategies.ILP.ilp_portfolio.run_in_processes",
+                   return_value={"Partial": partial, "Duplicate": duplicate, "Complete": complete}):
+            plan = portfolio.build_and_solve()
+
+        self.assertEqual(portfolio.winner, "Complete")
+        self.assertEqual(set(portfolio.scores), {"Complete"})
+        self.assertEqual(len(plan["Anna"]), len(self.requests))
+
+    def test_strategy_forwards_thread_count(self):
+        strategy = ILPOptimizerStrategy(ILPMode.MAKESPAN, threads=2)
+        optimizer = strategy.get_optimizer(self.transporters, self.requests, self.hospital.get_graph())
+        self.assertEqual(optimizer._solver().optionsDict["threads"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
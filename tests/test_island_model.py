@@ -0,0 +1,53 @@
+import random
+import unittest
+
+import numpy as np
+
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.parallel_runner import process_context
+from Model.Assignment_strategies.Genetic_algorithms.island_model import (
+    IslandMigration, IslandModel, MigrationBuffer
+)
+
+from tests import DEPARTMENTS, build_hospital, build_transporters
+
+
+class TestIslandModel(unittest.TestCase):
+    def setUp(self):
+        self.hospital = build_hospital()
+        self.transporters = build_transporters(self.hospital)
+        rng = random.Random(5)
+        self.requests = [TransportationRequest(*rng.sample(DEPARTMENTS, 2)) for _ in range(20)]
+
+    def test_migrants_travel_around_the_ring_once(self):
+        locks = [process_context().Lock() for _ in range(2)]
+        buffer = MigrationBuffer(2, 2, 4, locks)
+        try:
+            first, second = IslandMigration(buffer, 0, 5), IslandMigration(buffer, 1, 5)
+            population = np.arange(12).reshape(3, 4)
+            scores = np.array([3.0, 1.0, 2.0])
+
+            self.assertIsNone(first(3, population, scores))  # not a migration generation
+            first(5, population, scores)
+            immigrants = second(5, population + 100, scores)
+            np.testing.assert_array_equal(immigrants, population[[1, 2]])
+
+            # The same batch is not delivered twice
+            self.assertIsNone(second.buffer.receive(1, second.last_version)[0])
+        finally:
+            buffer.close(unlink=True)
+
+    def test_islands_assign_every_request(self):
+        model = IslandModel(self.transporters, self.requests, self.hospital.get_graph(), islands=2,
+                            population_size=20, generations=30, time_limit_seconds=2,
+                            migration_interval=5, seed=1)
+        plan = model.run()
+
+        assigned = [r for reqs in plan.values() for r in reqs]
+        self.assertCountEqual([r.id for r in assigned], [r.id for r in self.requests])
+        self.assertEqual(len(model.island_results), 2)
+        self.assertLess(model.best_fitness, float('inf'))
+
+
+if __name__ == '__main__':
+    unittest.main()
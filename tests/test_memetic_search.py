@@ -0,0 +1,50 @@
+import random
+import time
+import unittest
+
+import numpy as np
+
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.Genetic_algorithms.genetic_algorithm import GeneticAlgorithm
+from Model.Assignment_strategies.Genetic_algorithms.memetic_search import MemeticSearch
+
+from tests import DEPARTMENTS, build_hospital, build_transporters
+
+
+class TestMemeticSearch(unittest.TestCase):
+    def setUp(self):
+        self.hospital = build_hospital()
+        transporters = build_transporters(self.hospital)
+        transporters[2].current_location = "Radiology"
+        rng = random.Random(11)
+        requests = [TransportationRequest(*rng.sample(DEPARTMENTS, 2)) for _ in range(18)]
+
+        self.ga = GeneticAlgorithm(transporters, requests, self.hospital.get_graph())
+        self.ga._build_cost_model()
+        self.search = MemeticSearch(self.ga.travel_matrix, self.ga.transporter_location, self.ga.request_origin,
+                                    self.ga.request_destination, self.ga.request_service_time)
+
+    def test_delta_loads_match_recomputed_routes(self):
+        chromosome = np.zeros(len(self.ga.requests), dtype=np.intp)  # everything on one transporter
+        routes = [np.flatnonzero(chromosome == t) for t in range(3)]
+        loads = np.array([self.search._route_load(t, route) for t, route in enumerate(routes)])
+        before = loads.max()
+
+        while self.search._relocate(chromosome, routes, loads, int(loads.argmax())) or \
+                self.search._swap(chromosome, routes, loads, int(loads.argmax())):
+            expected, _ = self.ga._route_state(chromosome)
+            np.testing.assert_allclose(loads, expected[0])
+            for t, route in enumerate(routes):
+                np.testing.assert_array_equal(route, np.flatnonzero(chromosome == t))
+
+        self.assertLess(loads.max(), before)
+
+    def test_improve_respects_deadline(self):
+        chromosome = np.zeros(len(self.ga.requests), dtype=np.intp)
+        improved, moves = self.search.improve(chromosome, time.time() - 1)
+        self.assertEqual(moves, 0)
+        np.testing.assert_array_equal(improved, chromosome)
+
+
+if __name__ == '__main__':
+    unittest.main()
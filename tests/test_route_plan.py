@@ -0,0 +1,55 @@
+import random
+import unittest
+
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.route_plan import RoutePlan
+
+from tests import DEPARTMENTS, build_hospital, build_transporters
+
+
+class TestRoutePlan(unittest.TestCase):
+    def setUp(self):
+        self.hospital = build_hospital()
+        self.transporters = build_transporters(self.hospital)
+        rng = random.Random(3)
+        self.requests = [TransportationRequest(*rng.sample(DEPARTMENTS, 2)) for _ in range(12)]
+
+        # Deliberately unbalanced: Anna gets everything
+        self.plan = {"Anna": list(self.requests), "Bob": [], "Cathy": []}
+
+    def _sequential_time(self, transporter, requests):
+        pathfinder = transporter.pathfinder
+        time, location = 0, transporter.current_location
+        for r in requests:
+            time += pathfinder.dijkstra(location, r.origin)[1] + pathfinder.dijkstra(r.origin, r.destination)[1]
+            location = r.destination
+        return time
+
+    def test_route_load_matches_dijkstra(self):
+        route_plan = RoutePlan(self.transporters, self.plan, self.hospital.get_graph())
+        self.assertEqual(route_plan.route_load(0), self._sequential_time(self.transporters[0], self.requests))
+
+    def test_improve_keeps_delta_loads_exact_and_shortens_longest_route(self):
+        route_plan = RoutePlan(self.transporters, self.plan, self.hospital.get_graph())
+        before = route_plan.loads().max()
+
+        loads = route_plan.loads()
+        while route_plan._try_relocate(int(loads.argmax()), loads) or route_plan._try_swap(int(loads.argmax()), loads):
+            # Delta-tracked loads must equal a full recomputation after every move
+            self.assertTrue(all(abs(a - b) < 1e-9 for a, b in zip(loads, route_plan.loads())))
+
+        self.assertLess(route_plan.loads().max(), before)
+
+    def test_plan_keeps_original_request_objects(self):
+        route_plan = RoutePlan(self.transporters, self.plan, self.hospital.get_graph())
+        route_plan.order_greedy_chain().improve()
+        plan = route_plan.to_plan()
+
+        self.assertCountEqual([id(r) for reqs in plan.values() for r in reqs], [id(r) for r in self.requests])
+        for t in self.transporters:
+            self.assertAlmostEqual(route_plan.route_load(self.transporters.index(t)),
+                                   self._sequential_time(t, plan[t.name]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import time
+import unittest
+
+import eventlet
+
+from Model.solver_clock import SolverClock
+
+
+def _spin(seconds):
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+
+class TestSolverClock(unittest.TestCase):
+    def test_time_of_other_green_threads_is_not_counted(self):
+        clock = SolverClock()
+        other = eventlet.spawn(_spin, 0.4)
+
+        clock.start()
+        _spin(0.1)
+        eventlet.sleep(0)  # The other green thread spins while this one waits
+        _spin(0.1)
+        clock.stop()
+        other.wait()
+
+        # os.times counts in clock ticks, so allow for a few ticks either way
+        self.assertGreater(clock.cpu_seconds, 0.15)
+        self.assertLess(clock.cpu_seconds, 0.35)
+        self.assertLess(clock.wall_seconds, 0.35)
+
+    def test_clock_only_runs_between_start_and_stop(self):
+        clock = SolverClock()
+        clock.start()
+        clock.stop()
+        _spin(0.1)
+        eventlet.sleep(0)
+
+        self.assertLess(clock.cpu_seconds, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import random
+import unittest
+from unittest.mock import MagicMock, patch
+
+from Model.model_transport_manager import TransportManager
+from Model.model_transportation_request import TransportationRequest
+from Model.Assignment_strategies.plan_evaluator import PlanEvaluator
+from Model.Assignment_strategies.strategy_portfolio import BUDGETED_MEMBERS, StrategyPortfolio, _build_member
+from Model.Assignment_strategies.strategy_registry import STRATEGY_REGISTRY
+
+from tests import DEPARTMENTS, build_hospital, build_transporters
+
+
+class TestStrategyPortfolio(unittest.TestCase):
+    def setUp(self):
+        self.hospital = build_hospital()
+        self.transporters = build_transporters(self.hospital)
+        rng = random.Random(3)
+        self.requests = [TransportationRequest(*rng.sample(DEPARTMENTS, 2)) for _ in range(12)]
+
+    def test_race_keeps_best_plan_and_counts_wins(self):
+        portfolio = StrategyPortfolio(members=["Random", "Greedy Insertion", "Hungarian Batch"], deadline=30)
+        graph = self.hospital.get_graph()
+        for _ in range(2):
+            plan = portfolio.generate_assignment_plan(self.transporters, self.requests, graph)
+
+        self.assertCountEqual([r.id for route in plan.values() for r in route], [r.id for r in self.requests])
+        self.assertEqual(PlanEvaluator(self.transporters, graph).evaluate(plan)["makespan"],
+                         min(portfolio.scores.values()))
+
+        statistics = portfolio.get_statistics()
+        self.assertEqual(statistics["runs"], 2)
+        self.assertEqual(sum(member["wins"] for member in statistics["members"].values()), 2)
+        self.assertTrue(all(member["finished"] == 2 for member in statistics["members"].values()))
+
+    def test_incomplete_member_plans_count_as_unfinished(self):
+        ids = [r.id for r in self.requests]
+        results = {"Random": {"Anna": ids, "Bob": [], "Cathy": []},
+                   "ILP: Makespan": {"Anna": ids[:1], "Bob": [], "Cathy": []}}
+
+        def finish(tasks, deadline, max_workers, on_result):
+            for name, id_plan in results.items():
+                on_result(name, id_plan)
+            return results
+
+        portfolio = StrategyPortfolio(members=["Random", "ILP: Makespan"], deadline=5)
+        with patch("Model.Assignment_strategies.strategy_portfolio.run_in_processes", finish):
+            plan = portfolio.generate_assignment_plan(self.transporters, self.requests, self.hospital.get_graph())
+
+        self.assertEqual(portfolio.winner, "Random")
+        self.assertEqual(len(plan["Anna"]), len(self.requests))
+        self.assertEqual(portfolio.get_statistics()["members"]["ILP: Makespan"]["finished"], 0)
+
+    def test_members_are_bounded_by_the_deadline(self):
+        portfolio = StrategyPortfolio(deadline=5)
+        budget = portfolio.member_budget()
+        self.assertLess(budget, 5)
+
+        self.assertLessEqual(set(BUDGETED_MEMBERS), set(STRATEGY_REGISTRY))
+        self.assertEqual(_build_member("ILP: Makespan", budget).kwargs["time_limit"], int(budget))
+        self.assertEqual(_build_member("ALNS", budget).time_limit_seconds, budget)
+        self.assertNotIn("time_limit", _build_member("ILP: Makespan", None).kwargs)
+
+    def test_transport_manager_exposes_strategy_statistics(self):
+        manager = TransportManager(self.hospital, MagicMock())
+        manager.set_strategy_by_name("Portfolio")
+
+        result = manager.get_strategy_statistics()
+        self.assertEqual(result["strategy"], "StrategyPortfolio")
+        self.assertEqual(result["statistics"]["runs"], 0)
+        self.assertIn("Greedy Insertion", result["statistics"]["members"])
+
+
+if __name__ == '__main__':
+    unittest.main()